@@ -1,28 +1,66 @@
 """The Wallbox integration."""
 from __future__ import annotations
 
-from datetime import timedelta
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable, Collection, Mapping
+from dataclasses import dataclass, replace
 from http import HTTPStatus
 import logging
-from typing import Any
-
-import requests
-import operator
-
-#from wallbox import Wallbox
-from eCB1 import eCB1 as Wallbox
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+import time
+from urllib.parse import urlparse
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.const import (
+    CONF_PASSWORD,
+    CONF_SCAN_INTERVAL,
+    CONF_TIMEOUT,
+    CONF_USERNAME,
+    Platform,
+)
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed, HomeAssistantError
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
     DataUpdateCoordinator,
+    UpdateFailed,
 )
 
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers import (
+    config_validation as cv,
+    device_registry as dr,
+    entity_registry as er,
+)
+from homeassistant.helpers.entity import DeviceInfo, Entity, EntityDescription
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.typing import ConfigType
+from .load_time import IMPORT_STARTED, LOAD_TIMES_MS
 from .const import *
+from .breaker import CircuitBreaker, async_get_breaker, async_release_breaker
+from .decode import (
+    CHARGE_CONTROL_FIELDS,
+    OBIS_FIELDS,
+    OBIS_GROUP_OF_CODE,
+    OBIS_PROFILE_CODES,
+    ChargeControl,
+    MeterInfo,
+    charge_control_from_values,
+    decode_meters,
+    decode_status,
+    decode_statuses,
+    to_bool,
+)
+from .executor import WallboxExecutor, async_get_executor, async_release_executor
+from .snapshot import WallboxSnapshot, accessor_for_key
+
+if TYPE_CHECKING:
+    # The client library (and requests) is imported on first use, in the executor.
+    from eCB1 import eCB1 as Wallbox
+
+    # Like the optional controllers, imported only by stations that use it.
+    from .modbus import ModbusTransport
 # (
 #     CONF_BASEURL,
 #     CONF_CURRENT_VERSION_KEY,
@@ -41,6 +79,13 @@ from .const import *
 
 _LOGGER = logging.getLogger(__name__)
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+# Errors of a read or write a station did not complete. Connection errors of
+# requests are OSErrors, not ConnectionErrors, malformed responses raise
+# ValueErrors or KeyErrors and rejected credentials HomeAssistantErrors.
+STATION_ERRORS = (OSError, ValueError, KeyError, HomeAssistantError)
+
 PLATFORMS = [Platform.SENSOR, Platform.LOCK, Platform.SELECT, Platform.BINARY_SENSOR, Platform.SWITCH, Platform.NUMBER]
 #Platform.NUMBER,
 #UPDATE_INTERVAL = 30
@@ -79,23 +124,85 @@ CHARGER_STATUS: dict[int, str] = {
 }
 CHARGING_MODES: dict[str, str] = {}
 
-class WallboxCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+
+def create_wallbox(data: Mapping[str, Any]) -> Wallbox:
+    """Create the eCB1 client, importing the library on first use.
+
+    Must run in the executor.
+    """
+    from eCB1 import eCB1
+
+    return eCB1(
+        data[CONF_USERNAME],
+        data[CONF_PASSWORD],
+        data[CONF_BASEURL],
+        REQUEST_TIMEOUT,
+    )
+
+
+@dataclass
+class _SourceState:
+    """Last value of an endpoint and the monotonic time it was received."""
+
+    value: Any
+    updated: float
+
+
+class WallboxCoordinator(DataUpdateCoordinator[WallboxSnapshot]):
     """Wallbox Coordinator class."""
 
-    def __init__(self, station: str, wallbox: Wallbox, hass: HomeAssistant) -> None:
+    def __init__(
+        self,
+        station: str,
+        wallbox: Wallbox,
+        hass: HomeAssistant,
+        executor: WallboxExecutor | None = None,
+        breaker: CircuitBreaker | None = None,
+        transport: ModbusTransport | None = None,
+    ) -> None:
         """Initialize."""
         self._station = station
         self._wallbox = wallbox
+        self.executor = executor
+        self.breaker = breaker
+        # Reads status and meters instead of the REST API when set.
+        self.transport = transport
+        self.poll_interval: float = UPDATE_INTERVAL
+        self.poll_deadline: float = POLL_DEADLINE
+        self.endpoint_timeout: float = REQUEST_TIMEOUT
+        self.stale_after: float = SOURCE_STALE_AFTER
+        # OBIS codes with entities, codes to decode (None decodes all) and
+        # their deadbands.
+        self.profile_codes: frozenset[str] = OBIS_PROFILE_CODES[OBIS_PROFILE_FULL]
+        self.obis_codes: frozenset[str] | None = None
+        self.deadbands: dict[str, float] = {}
+        self._sources: dict[str, _SourceState] = {}
+        # Sensor precision per data key, registered by the sensor platform.
+        self.precision: dict[str, int] = {}
+        self._charging_modes = tuple(wallbox.getChargingModes().values())
+        self.history: deque[WallboxSnapshot] = deque(maxlen=SNAPSHOT_HISTORY)
+        # Last snapshot read from the station, not predicted by a write.
+        self._read: WallboxSnapshot | None = None
+        # Upper bounds on the charging current per controller (PV surplus,
+        # demand response), respected by the site load balancer.
+        self.current_caps: dict[str, float] = {}
+        # Controllers that paused charging by locking the station.
+        self.paused_by: set[str] = set()
+        self._device_info_key: tuple[Any, ...] | None = None
+        self._device_info: DeviceInfo | None = None
 
+        # Polls are driven by the WallboxScheduler, not by the coordinator timer.
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=UPDATE_INTERVAL),
+            update_interval=None,
         )
 
     def _authenticate(self) -> None:
         """Authenticate using Wallbox API."""
+        import requests
+
         try:
             self._wallbox.authenticate()
         except requests.exceptions.HTTPError as wallbox_connection_error:
@@ -105,6 +212,8 @@ class WallboxCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
     def _validate(self) -> None:
         """Authenticate using Wallbox API."""
+        import requests
+
         try:
             self._wallbox.authenticate()
         except requests.exceptions.HTTPError as wallbox_connection_error:
@@ -112,87 +221,592 @@ class WallboxCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 raise InvalidAuth from wallbox_connection_error
             raise ConnectionError from wallbox_connection_error
 
+    async def _async_add_job(
+        self,
+        func: Callable[..., Any],
+        *args: Any,
+        timeout: float | None = None,
+        deadline: float | None = None,
+    ) -> Any:
+        """Run a blocking eCB1 call in the executor of this host.
+
+        The timeout counts from the start of the call, the monotonic deadline
+        also bounds the wait for a free worker.
+        """
+        if self.executor is None:
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                timeout = remaining if timeout is None else min(timeout, remaining)
+            return await asyncio.wait_for(
+                self.hass.async_add_executor_job(func, *args), timeout
+            )
+        return await self.executor.async_run(
+            func, *args, timeout=timeout, deadline=deadline
+        )
+
     async def async_validate_input(self) -> None:
         """Get new sensor data for Wallbox component."""
-        await self.hass.async_add_executor_job(self._validate)
+        await self._async_add_job(self._validate)
 
-    def _get_data(self) -> dict[str, Any]:
-        """Get new sensor data for Wallbox component."""
-        try:
-            self._authenticate()
-            #data: dict[str, Any] = self._wallbox.getChargerStatus(self._station)
-            data = {}
-            try:
-                data = self._wallbox.getChargerStatus(self._station)
-                data[CONF_MAX_AVAILABLE_POWER_KEY] = data[CONF_DATA_KEY][CONF_MAX_AVAILABLE_POWER_KEY]
-                data[CONF_LOCKED_UNLOCKED_KEY] = data[CONF_DATA_KEY][CONF_LOCKED_UNLOCKED_KEY]
-                data[CONF_AI_MODE_KEY] = self._wallbox.getAutoStartStopMode(self._station)[CONF_AI_MODE_KEY]
-                #_LOGGER.log(10, data)
-            except:
-                pass
+    def _get_raw(self, path: str) -> bytes:
+        """Load the raw body of an eCB1 REST endpoint."""
+        import requests
+
+        response = requests.get(
+            f"{self._wallbox.baseUrl}{path}",
+            headers=self._wallbox.headers,
+            timeout=self.endpoint_timeout,
+        )
+        response.raise_for_status()
+        return response.content
 
-            system_info: dict[str, Any] = self._wallbox.getSystemInformation()
+    def _get_status(self) -> ChargeControl:
+        """Load the charge control status of the station."""
+        return decode_status(
+            self._get_raw(f"api/v1/chargecontrols/{self._station}"), self.precision
+        )
 
-            #ata[CONF_NAME_KEY] = system_info['company']
-            data[CONF_SYS_INFO_KEY] = system_info
+    def _get_system(self) -> Mapping[str, Any]:
+        """Load the system information of the eCB1."""
+        return MappingProxyType(self._wallbox.getSystemInformation())
 
+    def _get_ai_mode(self) -> bool | None:
+        """Load the AI mode (auto start stop) of the station."""
+        return to_bool(
+            self._wallbox.getAutoStartStopMode(self._station)[CONF_AI_MODE_KEY]
+        )
 
-            #_LOGGER.log(20, data[CONF_LOCKED_UNLOCKED_KEY])
+    def _get_meters(self) -> MeterInfo:
+        """Load the meter data of the station."""
+        return decode_meters(
+            self._get_raw(f"api/v1/meters/{self._station}"),
+            self.precision,
+            self.obis_codes,
+            self.deadbands,
+            self.data.meter.data if self.data else None,
+        )
 
-            CHARGING_MODES = self._wallbox.getChargingModes()
-            T = []
-            for i in CHARGING_MODES:
-                T.append(CHARGING_MODES[i])
-            data[CONF_CHARGING_MODES_KEY] = T
+    def _get_meter_values(self, codes: frozenset[str]) -> Any:
+        """Load some meter values of the station, without deadbands."""
+        return decode_meters(
+            self._get_raw(f"api/v1/meters/{self._station}"), self.precision, codes
+        ).data
 
-            try:
-                data[CONF_DATA_KEY][CONF_SERIAL_NUMBER_KEY] = str(system_info[CONF_SERIAL_NUMBER_KEY])+"-"+str(self._station)
-                data[CONF_DATA_KEY] = data[CONF_DATA_KEY] | self._wallbox.getMetersData(self._station)[CONF_METERS_KEY]['data']
-            except:
-                meter = self._wallbox.getMetersData(self._station)
-                data[CONF_DATA_KEY] = meter[CONF_METERS_KEY]['data']
-                data[CONF_DATA_KEY][CONF_SERIAL_NUMBER_KEY] = str(system_info[CONF_SERIAL_NUMBER_KEY])+"-"+str(self._station)
-                data[CONF_DATA_KEY]['id'] = self._station
-                data[CONF_DATA_KEY][CONF_PART_NUMBER_KEY] = meter[CONF_METERS_KEY][CONF_PART_NUMBER_KEY]
+    async def async_read_meter_values(self, codes: frozenset[str]) -> Any:
+        """Read some meter values right away, outside of the poll cycle."""
+        if self.transport is not None:
+            meter = await asyncio.wait_for(
+                self.transport.async_get_meters(self.precision, codes, {}, None),
+                self.endpoint_timeout,
+            )
+            return meter.data
+        return await self._async_add_job(
+            self._fetch,
+            lambda: self._get_meter_values(codes),
+            timeout=self.endpoint_timeout,
+        )
+
+    async def async_read_status(self) -> ChargeControl:
+        """Read the charge control status right away, outside of the poll cycle."""
+        if self.transport is not None:
+            return await asyncio.wait_for(
+                self._async_read_status(), self.endpoint_timeout
+            )
+        return await self._async_add_job(
+            self._fetch, self._get_status, timeout=self.endpoint_timeout
+        )
+
+    async def async_read_values(
+        self, keys: Collection[str], merge: bool = False
+    ) -> dict[str, Any]:
+        """Read charge control fields, the AI mode and OBIS codes right away.
 
+        Only the endpoints the keys need are read. With merge the values are
+        published as a new snapshot version, updating only the entities of
+        the keys that changed instead of refreshing the station.
+        """
+        codes = frozenset(key for key in keys if key in OBIS_FIELDS)
+        reads: dict[str, Awaitable[Any]] = {}
+        if codes:
+            reads[SOURCE_METERS] = self.async_read_meter_values(codes)
+        if CONF_AI_MODE_KEY in keys:
+            reads[SOURCE_AI_MODE] = self._async_add_job(
+                self._fetch, self._get_ai_mode, timeout=self.endpoint_timeout
+            )
+        if len(codes) + (CONF_AI_MODE_KEY in keys) < len(keys):
+            reads[SOURCE_STATUS] = self.async_read_status()
+        results = dict(zip(reads, await asyncio.gather(*reads.values())))
+        status: ChargeControl | None = results.get(SOURCE_STATUS)
+        data = results.get(SOURCE_METERS)
+        ai_mode: bool | None = results.get(SOURCE_AI_MODE)
+        values = {
+            key: ai_mode
+            if key == CONF_AI_MODE_KEY
+            else getattr(data, OBIS_FIELDS[key])
+            if key in codes
+            else getattr(status, key)
+            for key in keys
+        }
+        if merge and self.data is not None:
+            self._async_merge(status, data, codes, ai_mode)
+        return values
 
-            #_LOGGER.log(10, data)
-            return data
+    def _get_host_statuses(self) -> dict[int | None, Mapping[str, Any]]:
+        """Load the charge control fields of every station of the eCB1."""
+        return decode_statuses(self._get_raw("api/v1/chargecontrols"))
 
+    async def async_read_host_statuses(self) -> dict[int | None, Mapping[str, Any]]:
+        """Read the charge control fields of every station of the host in one request."""
+        return await self._async_add_job(
+            self._fetch, self._get_host_statuses, timeout=self.endpoint_timeout
+        )
+
+    @callback
+    def async_merge_host_statuses(
+        self, statuses: Mapping[int | None, Mapping[str, Any]]
+    ) -> None:
+        """Merge the status of this station from a read of every station of its host."""
+        if (values := statuses.get(self._station)) is not None and self.data is not None:
+            self._async_merge(
+                charge_control_from_values(values, self.precision), None, frozenset()
+            )
+
+    @callback
+    def _async_merge(
+        self,
+        status: ChargeControl | None,
+        data: Any,
+        codes: frozenset[str],
+        ai_mode: bool | None = None,
+    ) -> None:
+        """Merge values read outside of the poll cycle into a new snapshot."""
+        previous = self.data
+        sections: dict[str, Any] = {}
+        changed: set[str] = set()
+        if status is not None:
+            self._sources[SOURCE_STATUS] = _SourceState(status, time.monotonic())
+            sections["chargecontrol"] = status
+            changed |= {
+                name
+                for name in CHARGE_CONTROL_FIELDS
+                if previous.chargecontrol is None
+                or getattr(previous.chargecontrol, name) != getattr(status, name)
+            }
+            # The mode select listens with the key of the charging modes.
+            if CONF_CURRENT_MODE_KEY in changed:
+                changed.add(CONF_CHARGING_MODES_KEY)
+        if ai_mode is not None:
+            self._sources[SOURCE_AI_MODE] = _SourceState(ai_mode, time.monotonic())
+            sections["ai_mode"] = ai_mode
+            if ai_mode != previous.ai_mode:
+                changed.add(CONF_AI_MODE_KEY)
+        if data is not None and (state := self._sources.get(SOURCE_METERS)):
+            values = {OBIS_FIELDS[code]: getattr(data, OBIS_FIELDS[code]) for code in codes}
+            meter = replace(state.value, data=replace(state.value.data, **values))
+            # Only some codes are fresh, so the source keeps its age.
+            self._sources[SOURCE_METERS] = _SourceState(meter, state.updated)
+            sections["meter"] = meter
+            changed |= {
+                code
+                for code in codes
+                if getattr(previous.meter.data, OBIS_FIELDS[code])
+                != getattr(data, OBIS_FIELDS[code])
+            }
+        snapshot = previous.evolve(**sections)
+        if snapshot is previous:
+            return
+        self.history.append(snapshot)
+        self.data = snapshot
+        # Entities listen with their data key as context.
+        for update_callback, context in list(self._listeners.values()):
+            if context in changed:
+                update_callback()
+        self._async_fire_lifecycle_events(snapshot)
+
+    async def _async_read_status(self) -> ChargeControl:
+        """Read the charge control status of the station from the transport."""
+        return await self.transport.async_get_status(self.precision)
+
+    async def _async_read_meters(self) -> MeterInfo:
+        """Read the meter data of the station from the transport."""
+        return await self.transport.async_get_meters(
+            self.precision,
+            self.obis_codes,
+            self.deadbands,
+            self.data.meter if self.data else None,
+        )
+
+    async def _async_fetch(
+        self, func: Callable[..., Any], deadline: float
+    ) -> Any:
+        """Run one endpoint call within the endpoint timeout and the cycle deadline."""
+        if (remaining := deadline - time.monotonic()) <= 0:
+            raise TimeoutError
+        if asyncio.iscoroutinefunction(func):
+            return await asyncio.wait_for(func(), min(self.endpoint_timeout, remaining))
+        return await self._async_add_job(
+            self._fetch, func, timeout=self.endpoint_timeout, deadline=deadline
+        )
+
+    def _fetch(self, func: Callable[[], Any]) -> Any:
+        """Run one endpoint call, reporting HTTP errors as connection errors."""
+        import requests
+
+        try:
+            return func()
         except requests.exceptions.HTTPError as wallbox_connection_error:
             raise ConnectionError from wallbox_connection_error
 
-    async def _async_update_data(self) -> dict[str, Any]:
-        """Get new sensor data for Wallbox component."""
-        return await self.hass.async_add_executor_job(self._get_data)
+    @callback
+    def async_apply_options(self, options: Mapping[str, Any]) -> None:
+        """Apply the options of the config entry to the running coordinator.
+
+        Timeouts and filters take effect on the next poll; the poll interval is
+        applied by the scheduler.
+        """
+        self.poll_interval = options.get(CONF_SCAN_INTERVAL, UPDATE_INTERVAL)
+        self.poll_deadline = options.get(CONF_POLL_DEADLINE, POLL_DEADLINE)
+        self.endpoint_timeout = options.get(CONF_TIMEOUT, REQUEST_TIMEOUT)
+        self.stale_after = options.get(CONF_STALE_AFTER, SOURCE_STALE_AFTER)
+        profile = options.get(CONF_OBIS_PROFILE, OBIS_PROFILE_FULL)
+        self.profile_codes = profile_codes = OBIS_PROFILE_CODES[profile]
+        groups = options.get(CONF_OBIS_GROUPS)
+        if profile == OBIS_PROFILE_FULL and groups is None:
+            self.obis_codes = None
+        else:
+            self.obis_codes = frozenset(
+                code
+                for code in profile_codes
+                if groups is None or OBIS_GROUP_OF_CODE[code] in groups
+            )
+        self.deadbands = {
+            code: deadband
+            for code, group in OBIS_GROUP_OF_CODE.items()
+            if (deadband := options.get(f"{CONF_DEADBAND}_{group}"))
+        }
+        if self.data is not None:
+            # Entities of disabled groups turn unavailable right away.
+            self.async_update_listeners()
+
+    @property
+    def current_cap(self) -> float | None:
+        """Return the lowest cap on the charging current, None if uncapped."""
+        return min(self.current_caps.values(), default=None)
+
+    def key_enabled(self, key: str) -> bool:
+        """Return False for OBIS codes outside the profile or the enabled groups."""
+        return (
+            self.obis_codes is None
+            or not key.startswith(OBIS_PREFIX)
+            or key in self.obis_codes
+        )
+
+    def source_age(self, source: str) -> float | None:
+        """Return the seconds since a source last answered, None if it never did."""
+        if (state := self._sources.get(source)) is None:
+            return None
+        return time.monotonic() - state.updated
+
+    def source_is_stale(self, source: str) -> bool:
+        """Return True if a source has not answered within the stale threshold."""
+        age = self.source_age(source)
+        return age is None or age > self.stale_after
+
+    def _build_snapshot(self) -> WallboxSnapshot:
+        """Return the next snapshot from the latest value of every source."""
+        status = self._sources.get(SOURCE_STATUS)
+        ai_mode = self._sources.get(SOURCE_AI_MODE)
+        system_info: Mapping[str, Any] = self._sources[SOURCE_SYSTEM].value
+        meter: MeterInfo = self._sources[SOURCE_METERS].value
+        chargecontrol: ChargeControl | None = status.value if status else None
+
+        sections: dict[str, Any] = {
+            "serial": f"{system_info[CONF_SERIAL_NUMBER_KEY]}-{self._station}",
+            "model": (chargecontrol and chargecontrol.type)
+            or meter.type
+            or (self.data.model if self.data else None),
+            "system": system_info,
+            "meter": meter,
+            "chargecontrol": chargecontrol,
+            "ai_mode": ai_mode.value if ai_mode else None,
+            "charging_modes": self._charging_modes,
+        }
+        if self.data is None:
+            snapshot = WallboxSnapshot(version=1, **sections)
+        else:
+            snapshot = self.data.evolve(**sections)
+        if snapshot is not self.data:
+            self.history.append(snapshot)
+            self._async_update_device_info(snapshot)
+        return snapshot
+
+    async def _async_refresh(self, *args: Any, **kwargs: Any) -> None:
+        """Refresh, firing the lifecycle events once the read is published."""
+        await super()._async_refresh(*args, **kwargs)
+        if self.last_update_success and self.data is not None:
+            self._async_fire_lifecycle_events(self.data)
+
+    @callback
+    def _async_fire_lifecycle_events(self, snapshot: WallboxSnapshot) -> None:
+        """Fire an event for every lifecycle key a read shows changed.
+
+        Called once a read is published as the data of the coordinator.
+        Snapshots are compared with the previous read, not with optimistic
+        versions, so a write is reported once the station confirms it.
+        """
+        previous, self._read = self._read, snapshot
+        if previous is None or not snapshot.changed(previous) & {
+            "chargecontrol",
+            "ai_mode",
+        }:
+            return
+        for key, event_type in LIFECYCLE_EVENTS.items():
+            before, after = (
+                version.value(key)
+                if version.chargecontrol is not None or key == CONF_AI_MODE_KEY
+                else None
+                for version in (previous, snapshot)
+            )
+            if before == after or after is None:
+                continue
+            device = dr.async_get(self.hass).async_get_device(
+                identifiers={(DOMAIN, snapshot.serial)}
+            )
+            self.hass.bus.async_fire(
+                event_type,
+                {
+                    "device_id": device and device.id,
+                    "serial": snapshot.serial,
+                    "key": key,
+                    "before": before,
+                    "after": after,
+                    "version": snapshot.version,
+                },
+            )
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return the device information shared by all entities of the station."""
+        return self._device_info
+
+    @callback
+    def _async_update_device_info(self, snapshot: WallboxSnapshot) -> None:
+        """Rebuild the device information when the system info changed."""
+        key = (
+            snapshot.serial,
+            snapshot.model,
+            snapshot.system.get("company"),
+            snapshot.system.get(CONF_SOFTWARE_KEY),
+        )
+        if key == self._device_info_key:
+            return
+        initial = self._device_info_key is None
+        self._device_info_key = key
+        self._device_info = DeviceInfo(
+            identifiers={(DOMAIN, snapshot.serial)},
+            name="Wallbox Smart Controller",
+            manufacturer=f"{snapshot.system.get('company')}",
+            model=snapshot.model,
+            sw_version=snapshot.system.get(CONF_SOFTWARE_KEY),
+        )
+        if initial:
+            return
+        # The registry only reads device_info when entities are added.
+        registry = dr.async_get(self.hass)
+        if device := registry.async_get_device(identifiers={(DOMAIN, snapshot.serial)}):
+            registry.async_update_device(
+                device.id,
+                manufacturer=self._device_info["manufacturer"],
+                model=self._device_info["model"],
+                sw_version=self._device_info["sw_version"],
+            )
+
+    @property
+    def reachable(self) -> bool:
+        """Return False while the circuit breaker of the host is not closed."""
+        return self.breaker is None or self.breaker.state == BREAKER_CLOSED
+
+    async def async_pause(self, source: str, pause: bool) -> None:
+        """Pause or resume charging for a controller by locking the station.
+
+        Charging currents below the minimum are not accepted by the station,
+        so controllers pause by locking it instead. The first controller to
+        pause locks the station and the last one to resume unlocks it, while
+        a station the user locked is left alone.
+        """
+        if pause:
+            if source in self.paused_by:
+                return
+            control = self.data.chargecontrol if self.data else None
+            if not self.paused_by and control is not None and control.stateid == 17:
+                return
+            self.paused_by.add(source)
+            if len(self.paused_by) > 1:
+                return
+        elif source in self.paused_by:
+            self.paused_by.discard(source)
+            if self.paused_by:
+                return
+        else:
+            return
+        try:
+            await self.async_set_lock_unlock(pause, refresh=False)
+        except BaseException:
+            # The station kept its state, so does the bookkeeping.
+            self.paused_by.symmetric_difference_update({source})
+            raise
+
+    async def async_resume(self, *sources: str) -> None:
+        """Resume charging paused by controllers, all of them if none are given."""
+        for source in sources or list(self.paused_by):
+            try:
+                await self.async_pause(source, False)
+            except (OSError, HomeAssistantError) as err:
+                _LOGGER.warning(
+                    "Resuming charging of station %s failed: %r", self._station, err
+                )
+
+    @callback
+    def async_set_optimistic(self, **changes: Any) -> None:
+        """Publish a new snapshot version ahead of the charger confirming a write."""
+        snapshot = self.data.evolve(**changes)
+        if snapshot is not self.data:
+            self.history.append(snapshot)
+            self.async_set_updated_data(snapshot)
+
+    def _fetchers(self) -> dict[str, Callable[..., Any]]:
+        """Return the endpoint call of every source to fetch this cycle."""
+        if self.transport is None:
+            return {
+                SOURCE_STATUS: self._get_status,
+                SOURCE_AI_MODE: self._get_ai_mode,
+                SOURCE_SYSTEM: self._get_system,
+                SOURCE_METERS: self._get_meters,
+            }
+        fetchers: dict[str, Callable[..., Any]] = {
+            SOURCE_STATUS: self._async_read_status,
+            SOURCE_METERS: self._async_read_meters,
+        }
+        # System information and AI mode are only served by the REST API and
+        # rarely change, so they are refreshed at half the stale threshold.
+        for source, func in (
+            (SOURCE_SYSTEM, self._get_system),
+            (SOURCE_AI_MODE, self._get_ai_mode),
+        ):
+            if (age := self.source_age(source)) is None or age >= self.stale_after / 2:
+                fetchers[source] = func
+        return fetchers
+
+    async def _async_update_data(self) -> WallboxSnapshot:
+        """Get new sensor data for Wallbox component.
+
+        Every endpoint is fetched on its own within a shared deadline. Sources
+        that do not answer keep their last value, so one slow endpoint does not
+        discard the data of the others.
+        """
+        deadline = time.monotonic() + self.poll_deadline
+        if self.breaker is not None and self.breaker.state != BREAKER_CLOSED:
+            if not self.breaker.probe_due:
+                return self._carry_forward(
+                    f"Station {self._station} is unreachable, waiting for the next probe"
+                )
+            # A single cheap request decides whether the host is back.
+            self.breaker.async_start_probe()
+            probe_source, probe = (
+                (SOURCE_AI_MODE, self._get_ai_mode)
+                if self.transport is None
+                else (SOURCE_STATUS, self._async_read_status)
+            )
+            probed = False
+            try:
+                value = await self._async_fetch(probe, deadline)
+                probed = True
+            except Exception as err:  # noqa: BLE001
+                _LOGGER.debug("Probe of station %s failed: %r", self._station, err)
+                return self._carry_forward(f"Probe of station {self._station} failed")
+            finally:
+                # Whatever ended the probe, the breaker must not stay half open.
+                if not probed:
+                    self.breaker.async_record_failure()
+            self._sources[probe_source] = _SourceState(value, time.monotonic())
+            self.breaker.async_record_success()
+
+        fetchers = self._fetchers()
+        if self.transport is None or SOURCE_SYSTEM in fetchers or SOURCE_AI_MODE in fetchers:
+            try:
+                await self._async_fetch(self._authenticate, deadline)
+            except OSError:
+                if self.breaker is not None:
+                    self.breaker.async_record_failure()
+                return self._carry_forward(f"Error authenticating station {self._station}")
+
+        results = await asyncio.gather(
+            *(self._async_fetch(func, deadline) for func in fetchers.values()),
+            return_exceptions=True,
+        )
+
+        now = time.monotonic()
+        failed: list[str] = []
+        for source, result in zip(fetchers, results):
+            if isinstance(result, ConfigEntryAuthFailed):
+                raise result
+            if isinstance(result, Exception):
+                _LOGGER.debug("Station %s: %s unavailable: %r", self._station, source, result)
+                failed.append(source)
+                continue
+            self._sources[source] = _SourceState(result, now)
+
+        if len(failed) == len(fetchers):
+            if self.breaker is not None:
+                self.breaker.async_record_failure()
+            return self._carry_forward(f"No endpoint of station {self._station} answered")
+        if self.breaker is not None:
+            self.breaker.async_record_success()
+        if SOURCE_SYSTEM not in self._sources or SOURCE_METERS not in self._sources:
+            raise UpdateFailed(f"Station {self._station} has not reported system and meter data yet")
+        return self._build_snapshot()
+
+    def _carry_forward(self, reason: str) -> WallboxSnapshot:
+        """Return the last known data, raise UpdateFailed once every source is stale."""
+        if self.data is None or all(
+            self.source_is_stale(source) for source in SOURCES
+        ):
+            raise UpdateFailed(reason)
+        _LOGGER.debug("%s, keeping last known data", reason)
+        return self._build_snapshot()
 
     def _set_charging_current(self, charging_current: float) -> None:
         """Set maximum charging current for Wallbox."""
+        import requests
+
         try:
             self._authenticate()
             self._wallbox.setMaxChargingCurrent(self._station, charging_current)
-            self._get_data()
         except requests.exceptions.HTTPError as wallbox_connection_error:
             if wallbox_connection_error.response.status_code == 403:
                 raise InvalidAuth from wallbox_connection_error
             raise ConnectionError from wallbox_connection_error
 
-    async def async_set_charging_current(self, charging_current: float) -> None:
+    async def async_set_charging_current(
+        self, charging_current: float, refresh: bool = True
+    ) -> None:
         """Set maximum charging current for Wallbox."""
-        await self.hass.async_add_executor_job(
+        await self._async_add_job(
             self._set_charging_current, charging_current
         )
-        await self.async_request_refresh()
+        if refresh:
+            await self.async_request_refresh()
 
     def _set_lock_unlock(self, lock: bool) -> None:
         """Set wallbox to locked or unlocked."""
+        import requests
+
         try:
             self._authenticate()
             if lock:
                 self._wallbox.lockCharger(self._station)
             else:
                 self._wallbox.unlockCharger(self._station)
-            self._get_data()
         except requests.exceptions.HTTPError as wallbox_connection_error:
             if wallbox_connection_error.response.status_code == 403:
                 raise InvalidAuth from wallbox_connection_error
@@ -200,51 +814,92 @@ class WallboxCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
     def _set_charging_mode(self, mode: str) -> None:
         """Set wallbox charging mode."""
+        import requests
+
         #_LOGGER.log(20, "updation mode to: '"+mode+"'")
         try:
             self._authenticate()
             self._wallbox.setChargingMode(self._station, mode)
-            self._get_data()
         except requests.exceptions.HTTPError as wallbox_connection_error:
             if wallbox_connection_error.response.status_code == 403:
                 raise InvalidAuth from wallbox_connection_error
             raise ConnectionError from wallbox_connection_error
 
-    async def async_set_lock_unlock(self, lock: bool) -> None:
+    async def async_set_lock_unlock(self, lock: bool, refresh: bool = True) -> None:
         """Set wallbox to locked or unlocked."""
-        await self.hass.async_add_executor_job(self._set_lock_unlock, lock)
-        await self.async_request_refresh()
+        await self._async_add_job(self._set_lock_unlock, lock)
+        if refresh:
+            await self.async_request_refresh()
 
-    async def async_set_charging_mode(self, mode: str) -> None:
+    async def async_set_charging_mode(self, mode: str, refresh: bool = True) -> None:
         """Set wallbox charging mode"""
-        await self.hass.async_add_executor_job(self._set_charging_mode, mode)
-        await self.async_request_refresh()
+        await self._async_add_job(self._set_charging_mode, mode)
+        if refresh:
+            await self.async_request_refresh()
 
     def _set_start_stop_mode(self, onOrOff: bool) -> None:
         """Set wallbox AI Mode (Auto Start Stop -> PV Excess Charging)"""
+        import requests
+
         try:
             self._authenticate()
             self._wallbox.setAutoStartStopMode(self._station, onOrOff)
-            self._get_data()
         except requests.exceptions.HTTPError as wallbox_connection_error:
             if wallbox_connection_error.response.status_code == 403:
                 raise InvalidAuth from wallbox_connection_error
             raise ConnectionError from wallbox_connection_error
 
-    async def aysnc_set_start_stop_mode(self, onOrOff: bool) -> None:
+    async def aysnc_set_start_stop_mode(self, onOrOff: bool, refresh: bool = True) -> None:
         """Set wallbox AI Mode (Auto Start Stop -> PV Excess Charging)"""
-        await self.hass.async_add_executor_job(self._set_start_stop_mode, onOrOff)
-        await self.async_request_refresh()
+        await self._async_add_job(self._set_start_stop_mode, onOrOff)
+        if refresh:
+            await self.async_request_refresh()
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the services of the Wallbox integration."""
+    from .services import async_setup_services
+
+    async_setup_services(hass)
+    return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Wallbox from a config entry."""
-    wallbox = Wallbox(entry.data[CONF_USERNAME], entry.data[CONF_PASSWORD], entry.data[CONF_BASEURL])
+    wallbox = await hass.async_add_import_executor_job(create_wallbox, entry.data)
+    executor = async_get_executor(hass, entry.data[CONF_BASEURL])
+    entry.async_on_unload(
+        lambda: async_release_executor(hass, entry.data[CONF_BASEURL])
+    )
+    breaker = async_get_breaker(hass, entry.data[CONF_BASEURL])
+    entry.async_on_unload(
+        lambda: async_release_breaker(hass, entry.data[CONF_BASEURL])
+    )
+    transport: ModbusTransport | None = None
+    if entry.data.get(CONF_TRANSPORT) == TRANSPORT_MODBUS:
+        from .modbus import (
+            ModbusTransport,
+            async_get_modbus_client,
+            async_release_modbus_client,
+        )
+
+        host = urlparse(entry.data[CONF_BASEURL]).hostname
+        port = entry.data.get(CONF_MODBUS_PORT, DEFAULT_MODBUS_PORT)
+        transport = ModbusTransport(
+            async_get_modbus_client(hass, host, port),
+            entry.data[CONF_STATION],
+            wallbox.getChargingModes(),
+        )
+        entry.async_on_unload(lambda: async_release_modbus_client(hass, host, port))
     wallbox_coordinator = WallboxCoordinator(
         entry.data[CONF_STATION],
         wallbox,
         hass,
+        executor,
+        breaker,
+        transport,
     )
+    wallbox_coordinator.async_apply_options(entry.options)
 
     try:
         await wallbox_coordinator.async_validate_input()
@@ -253,8 +908,24 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         raise ConfigEntryAuthFailed from ex
 
     await wallbox_coordinator.async_config_entry_first_refresh()
+    async_remove_entities_outside_profile(hass, entry, wallbox_coordinator)
+    if entry.options.get(CONF_METRICS):
+        _async_register_metrics_view(hass)
 
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = wallbox_coordinator
+    await _async_apply_controllers(hass, entry, wallbox_coordinator)
+    entry.async_on_unload(lambda: _async_stop_controllers(hass, entry))
+    await _async_apply_statistics(hass, entry, wallbox_coordinator)
+    entry.async_on_unload(lambda: _async_stop_statistics(hass, entry))
+
+    from .scheduler import async_get_scheduler
+
+    scheduler = async_get_scheduler(hass)
+    scheduler.async_register(
+        entry.entry_id, wallbox_coordinator, wallbox_coordinator.poll_interval
+    )
+    entry.async_on_unload(lambda: scheduler.async_unregister(entry.entry_id))
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
 
     #hass.config_entries.async_setup_platforms(entry, PLATFORMS)
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -262,8 +933,118 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
+@callback
+def _async_register_metrics_view(hass: HomeAssistant) -> None:
+    """Register the OpenMetrics view, imported only when a station enables it."""
+    from .metrics import async_register_metrics_view
+
+    async_register_metrics_view(hass)
+
+
+async def _async_apply_statistics(
+    hass: HomeAssistant, entry: ConfigEntry, coordinator: WallboxCoordinator
+) -> None:
+    """Start or stop compiling statistics, importing the recorder only if enabled.
+
+    A running compiler is kept, so changing other options does not drop the
+    aggregates of the hour in progress.
+    """
+    if not entry.options.get(CONF_STATISTICS):
+        _async_stop_statistics(hass, entry)
+    elif entry.entry_id not in hass.data.get(DATA_STATISTICS, {}):
+        from .external_statistics import async_start_statistics
+
+        await async_start_statistics(hass, entry, coordinator)
+
+
+@callback
+def _async_stop_statistics(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Stop the statistics compiler of an entry."""
+    if (compiler := hass.data.get(DATA_STATISTICS, {}).pop(entry.entry_id, None)) is not None:
+        compiler.async_stop()
+
+
+async def _async_apply_controllers(
+    hass: HomeAssistant, entry: ConfigEntry, coordinator: WallboxCoordinator
+) -> None:
+    """Start, restart or stop the optional controllers according to the options.
+
+    A controller module is imported only once a station enables it; one that
+    is not imported has nothing running to stop.
+    """
+    if limit := entry.options.get(CONF_SITE_LIMIT):
+        from .balancer import async_get_balancer
+
+        async_get_balancer(hass).async_register(entry.entry_id, coordinator, limit)
+    elif (balancer := hass.data.get(DATA_BALANCER)) is not None:
+        balancer.async_unregister(entry.entry_id)
+    if entry.options.get(CONF_SURPLUS) or DATA_SURPLUS in hass.data:
+        from .surplus import async_apply_surplus
+
+        async_apply_surplus(hass, entry, coordinator)
+    if entry.options.get(CONF_DEMAND_RESPONSE) or DATA_DEMAND in hass.data:
+        from .demand import async_apply_demand_response
+
+        async_apply_demand_response(hass, entry, coordinator)
+    if entry.options.get(CONF_SAMPLE_HISTORY) or DATA_SAMPLE_HISTORY in hass.data:
+        from .sample_history import async_apply_sample_history
+
+        await async_apply_sample_history(hass, entry, coordinator)
+
+
+@callback
+def _async_stop_controllers(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Stop the optional controllers of an entry."""
+    if (balancer := hass.data.get(DATA_BALANCER)) is not None:
+        balancer.async_unregister(entry.entry_id)
+    if DATA_SURPLUS in hass.data:
+        from .surplus import async_stop_surplus
+
+        async_stop_surplus(hass, entry)
+    if DATA_DEMAND in hass.data:
+        from .demand import async_stop_demand_response
+
+        async_stop_demand_response(hass, entry)
+    if DATA_SAMPLE_HISTORY in hass.data:
+        from .sample_history import async_stop_sample_history
+
+        async_stop_sample_history(hass, entry)
+
+
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply changed options in place, without reloading the platforms."""
+    coordinator: WallboxCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator.async_apply_options(entry.options)
+    async_remove_entities_outside_profile(hass, entry, coordinator)
+    if entry.options.get(CONF_METRICS):
+        _async_register_metrics_view(hass)
+    await _async_apply_controllers(hass, entry, coordinator)
+    await _async_apply_statistics(hass, entry, coordinator)
+
+    from .scheduler import async_get_scheduler
+
+    async_get_scheduler(hass).async_set_interval(entry.entry_id, coordinator.poll_interval)
+
+
+@callback
+def async_remove_entities_outside_profile(
+    hass: HomeAssistant, entry: ConfigEntry, coordinator: WallboxCoordinator
+) -> None:
+    """Remove the OBIS entities the profile of the entry does not include."""
+    registry = er.async_get(hass)
+    suffix = f"-{coordinator.data.serial}"
+    for entity in er.async_entries_for_config_entry(registry, entry.entry_id):
+        key = entity.unique_id.removesuffix(suffix)
+        if key.startswith(OBIS_PREFIX) and key not in coordinator.profile_codes:
+            registry.async_remove(entity.entity_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
+    coordinator: WallboxCoordinator = hass.data[DOMAIN][entry.entry_id]
+    # Stop the controllers first, so charging they paused resumes for good.
+    _async_stop_controllers(hass, entry)
+    await coordinator.async_resume()
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id)
@@ -275,21 +1056,109 @@ class InvalidAuth(HomeAssistantError):
     """Error to indicate there is invalid auth."""
 
 
+def source_for_key(key: str) -> str:
+    """Return the endpoint a data key is read from."""
+    if key == CONF_AI_MODE_KEY:
+        return SOURCE_AI_MODE
+    if key.startswith(OBIS_PREFIX):
+        return SOURCE_METERS
+    return SOURCE_STATUS
+
+
+@callback
+def async_setup_entity_discovery(
+    coordinator: WallboxCoordinator,
+    entry: ConfigEntry,
+    descriptions: Mapping[str, EntityDescription],
+    entity_factory: Callable[[EntityDescription], Entity],
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Add entities for the keys reported now and for every key reported later.
+
+    Each refresh only looks up the keys that were not seen before, so keys a
+    meter starts reporting after a firmware update get their entities without
+    reloading the entry.
+    """
+    known: set[str] = set()
+    last: WallboxSnapshot | None = None
+    profile = coordinator.profile_codes
+
+    @callback
+    def _async_add_new_keys() -> None:
+        nonlocal last, profile
+        if profile is not coordinator.profile_codes:
+            # Entities outside the previous profile were removed, forget them.
+            profile = coordinator.profile_codes
+            known.difference_update(
+                [key for key in known if key.startswith(OBIS_PREFIX) and key not in profile]
+            )
+            last = None
+        if (snapshot := coordinator.data) is None or snapshot is last:
+            return
+        last = snapshot
+        new_keys = [
+            key
+            for key in snapshot.keys()
+            if key not in known and coordinator.key_enabled(key)
+        ]
+        if not new_keys:
+            return
+        known.update(new_keys)
+        if entities := [
+            entity_factory(description)
+            for key in new_keys
+            if (description := descriptions.get(key))
+        ]:
+            _LOGGER.debug("Adding %s entities for new keys of %s", len(entities), entry.title)
+            async_add_entities(entities)
+
+    _async_add_new_keys()
+    entry.async_on_unload(coordinator.async_add_listener(_async_add_new_keys))
+
+
 class WallboxEntity(CoordinatorEntity[WallboxCoordinator]):
-    """Defines a base Wallbox entity."""
+    """Defines a base Wallbox entity.
+
+    Descriptions are frozen and shared by the entities of every station; name
+    and unique id are derived from them instead of stored per entity.
+    """
+
+    def __init__(
+        self,
+        coordinator: WallboxCoordinator,
+        entry: ConfigEntry,
+        description: EntityDescription,
+    ) -> None:
+        """Initialize the entity and precompile the accessor of its data key."""
+        super().__init__(coordinator, description.key)
+        self.entity_description = description
+        self._title = entry.title
+        self._source = source_for_key(description.key)
+        self._value = accessor_for_key(description.key)
+
+    @property
+    def name(self) -> str:
+        """Return the name, derived instead of stored per entity."""
+        return f"{self._title} {self.entity_description.name}"
+
+    @property
+    def unique_id(self) -> str:
+        """Return the unique id, derived instead of stored per entity."""
+        return f"{self.entity_description.key}-{self.coordinator.data.serial}"
+
+    @property
+    def available(self) -> bool:
+        """Return False once the endpoint of this entity is stale or disabled."""
+        return (
+            super().available
+            and not self.coordinator.source_is_stale(self._source)
+            and self.coordinator.key_enabled(self.entity_description.key)
+        )
 
     @property
     def device_info(self) -> DeviceInfo:
         """Return device information about this Wallbox device."""
-        return DeviceInfo(
-            identifiers={
-                (DOMAIN, self.coordinator.data[CONF_DATA_KEY][CONF_SERIAL_NUMBER_KEY])
-            },
-            name=f"Wallbox Smart Controller",
-            manufacturer=f"{self.coordinator.data[CONF_SYS_INFO_KEY]['company']}",
-            model=self.coordinator.data[CONF_DATA_KEY][CONF_PART_NUMBER_KEY],
-            # sw_version=self.coordinator.data[CONF_DATA_KEY][CONF_SOFTWARE_KEY][
-            #     CONF_CURRENT_VERSION_KEY
-            # ],
-            sw_version=self.coordinator.data[CONF_SYS_INFO_KEY]['os_version'],
-        )
+        return self.coordinator.device_info
+
+
+LOAD_TIMES_MS["integration"] = round((time.perf_counter() - IMPORT_STARTED) * 1000, 2)
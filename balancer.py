@@ -0,0 +1,357 @@
+"""Site-level load balancing across the stations of the Wallbox integration."""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass, replace
+from datetime import timedelta
+import logging
+import math
+import statistics
+import time
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import (
+    BALANCER_HEADROOM,
+    BALANCER_INTERVAL,
+    BALANCER_LATENCY_SAMPLES,
+    BALANCER_MIN_CURRENT,
+    BALANCER_MIN_STEP,
+    BALANCER_WRITE_INTERVAL,
+    CONF_SITE_LIMIT,
+    DATA_BALANCER,
+)
+from .obis import OBIS_CURRENT_L1, OBIS_CURRENT_L2, OBIS_CURRENT_L3
+
+if TYPE_CHECKING:
+    from . import WallboxCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Read from every session on each control cycle.
+BALANCER_CODES = frozenset({OBIS_CURRENT_L1, OBIS_CURRENT_L2, OBIS_CURRENT_L3})
+
+
+@dataclass
+class _Member:
+    """A station sharing the site supply."""
+
+    coordinator: WallboxCoordinator
+    limit: float
+    # Last current written by the balancer, 0 while it paused the station, and
+    # the monotonic time of the write.
+    setpoint: float | None = None
+    written: float = -math.inf
+
+
+def phase_draw(data: Any) -> float | None:
+    """Return the highest phase current of MeterData, None if not measured."""
+    currents = [
+        current
+        for current in (data.current_l1, data.current_l2, data.current_l3)
+        if current is not None
+    ]
+    return max(currents, default=None)
+
+
+def latency_metrics(latency_ms: Iterable[float]) -> dict[str, float | None]:
+    """Return the last, median and highest of the latest latencies."""
+    latency = list(latency_ms)
+    return {
+        "last": latency[-1] if latency else None,
+        "median": statistics.median(latency) if latency else None,
+        "max": max(latency, default=None),
+    }
+
+
+def distribute(
+    budget: float, demands: Mapping[str, float], floor: float = BALANCER_MIN_CURRENT
+) -> dict[str, float]:
+    """Share a current budget between sessions, in the order of demands.
+
+    Every session gets at least the floor as long as the budget allows,
+    sessions that do not fit anymore get 0, which pauses them. The rest is filled up evenly
+    without giving a session more than it demands.
+    """
+    fitting = list(demands)[: max(int(budget // floor), 0)] if floor else list(demands)
+    allocation = {key: 0.0 for key in demands}
+    remaining = budget
+    for key in fitting:
+        allocation[key] = min(floor, demands[key])
+        remaining -= allocation[key]
+
+    open_keys = sorted(fitting, key=lambda key: demands[key])
+    while open_keys and remaining > 0:
+        share = remaining / len(open_keys)
+        key = open_keys[0]
+        if (missing := demands[key] - allocation[key]) <= share:
+            allocation[key] = demands[key]
+            remaining -= missing
+            open_keys.pop(0)
+            continue
+        for key in open_keys:
+            allocation[key] += share
+        break
+    # The chargers take whole amperes.
+    return {key: float(math.floor(current)) for key, current in allocation.items()}
+
+
+class SiteLoadBalancer:
+    """Share one supply limit between every station that opts in.
+
+    A control cycle runs every BALANCER_INTERVAL while a station is balanced,
+    and whenever a controller changes a cap, coalesced while one is running.
+    A cycle reads the phase currents of all sessions, shares the limit
+    between them and writes the changed setpoints of all stations as one
+    batch. Sessions that do not fit are paused by locking their station and
+    resume once they fit again. Lowering a setpoint is written at once,
+    raising it at most every BALANCER_WRITE_INTERVAL per station, and steps
+    below BALANCER_MIN_STEP are not written at all.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize."""
+        self._hass = hass
+        self._members: dict[str, _Member] = {}
+        self._unsubscribe: Callable[[], None] | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._pending = False
+        self._latency_ms: deque[float] = deque(maxlen=BALANCER_LATENCY_SAMPLES)
+        self._cycles = 0
+        self._writes = 0
+        self._deferred = 0
+        self._failed = 0
+
+    @property
+    def limit(self) -> float | None:
+        """Return the site limit, the lowest limit any member configured."""
+        return min((member.limit for member in self._members.values()), default=None)
+
+    @callback
+    def async_register(
+        self, key: str, coordinator: WallboxCoordinator, limit: float
+    ) -> None:
+        """Start balancing a station under a site limit in amperes per phase."""
+        if (member := self._members.get(key)) is not None:
+            if member.coordinator is coordinator:
+                member.limit = limit
+                self.async_request_cycle()
+                return
+            self.async_unregister(key)
+        self._members[key] = _Member(coordinator, limit)
+        if self._unsubscribe is None:
+            self._unsubscribe = async_track_time_interval(
+                self._hass,
+                self._async_tick,
+                timedelta(seconds=BALANCER_INTERVAL),
+                cancel_on_shutdown=True,
+            )
+        self.async_request_cycle()
+
+    @callback
+    def async_unregister(self, key: str) -> None:
+        """Stop balancing a station, leaving its last setpoint in place.
+
+        A station the balancer paused resumes charging.
+        """
+        if (member := self._members.pop(key, None)) is None:
+            return
+        coordinator = member.coordinator
+        if CONF_SITE_LIMIT in coordinator.paused_by:
+            self._hass.async_create_task(coordinator.async_resume(CONF_SITE_LIMIT))
+        if not self._members:
+            self.async_stop()
+
+    @callback
+    def async_stop(self, _event: Event | None = None) -> None:
+        """Stop the control loop and cancel a running control cycle."""
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+            self._unsubscribe = None
+        if self._task is not None:
+            self._task.cancel()
+
+    def is_member(self, key: str) -> bool:
+        """Return True if a station is balanced."""
+        return key in self._members
+
+    @callback
+    def _async_tick(self, _now: Any = None) -> None:
+        """Run the control cycle of the interval."""
+        self.async_request_cycle()
+
+    @callback
+    def async_request_cycle(self) -> None:
+        """Run a control cycle, or another one after the running cycle."""
+        if self._task is not None and not self._task.done():
+            self._pending = True
+            return
+        self._task = self._hass.async_create_task(self._async_control())
+
+    async def _async_control(self) -> None:
+        """Run control cycles until no other one was requested meanwhile."""
+        self._pending = True
+        while self._pending and self._members:
+            self._pending = False
+            try:
+                await self._async_cycle()
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Load balancing cycle failed")
+
+    async def _async_cycle(self) -> None:
+        """Share the site limit and write the changed setpoints."""
+        if (limit := self.limit) is None:
+            return
+        self._cycles += 1
+        reserved = 0.0
+        sessions: dict[str, float] = {}
+        idle: list[str] = []
+        paused: list[str] = []
+        measuring: dict[str, _Member] = {}
+        # Stations already charging keep their share before new sessions.
+        for key, member in sorted(
+            self._members.items(), key=lambda item: (not item[1].setpoint, item[0])
+        ):
+            coordinator = member.coordinator
+            control = coordinator.data.chargecontrol if coordinator.data else None
+            if control is None or not coordinator.last_update_success:
+                reserved += self._reserve(member)
+            elif not control.connected:
+                idle.append(key)
+            elif coordinator.current_cap == 0:
+                paused.append(key)
+            elif coordinator.reachable:
+                measuring[key] = member
+            else:
+                reserved += self._reserve(member)
+
+        measured = time.monotonic()
+        draws = await asyncio.gather(
+            *(
+                member.coordinator.async_read_meter_values(BALANCER_CODES)
+                for member in measuring.values()
+            ),
+            return_exceptions=True,
+        )
+        for (key, member), data in zip(measuring.items(), draws):
+            if isinstance(data, Exception):
+                # Unknown state, assume it draws what it may draw.
+                _LOGGER.debug("Reading the phase currents of %s failed: %r", key, data)
+                reserved += self._reserve(member)
+                continue
+            control = member.coordinator.data.chargecontrol
+            setpoint = member.setpoint or control.manualmodeamp or 0
+            maximum = control.supplylinemaxamp or setpoint
+            draw = phase_draw(data)
+            # A car drawing well below its setpoint releases the rest.
+            if draw is not None and draw <= setpoint - BALANCER_HEADROOM:
+                maximum = min(maximum, draw + BALANCER_HEADROOM)
+            if (cap := member.coordinator.current_cap) is not None:
+                maximum = min(maximum, cap)
+            sessions[key] = max(maximum, BALANCER_MIN_CURRENT)
+
+        # Idle stations wait at the floor out of the budget, so a car plugging
+        # in starts low. Those the budget has no room for are parked at 0 A.
+        allocation = distribute(
+            limit - reserved,
+            {**sessions, **dict.fromkeys(idle, float(BALANCER_MIN_CURRENT))},
+        )
+        allocation.update({key: 0.0 for key in paused})
+        now = time.monotonic()
+        writes = {
+            key: current
+            for key, current in allocation.items()
+            if self._async_due(self._members[key], current, now)
+        }
+        if not writes:
+            return
+
+        results = await asyncio.gather(
+            *(
+                self._async_write(self._members[key], current)
+                for key, current in writes.items()
+            ),
+            return_exceptions=True,
+        )
+        written = time.monotonic()
+        for (key, current), result in zip(writes.items(), results):
+            if (member := self._members.get(key)) is None:
+                continue
+            if isinstance(result, Exception):
+                self._failed += 1
+                _LOGGER.warning("Setting %s A on %s failed: %r", current, key, result)
+                continue
+            self._writes += 1
+            member.setpoint = current
+            member.written = written
+            if current and (control := member.coordinator.data.chargecontrol) is not None:
+                member.coordinator.async_set_optimistic(
+                    chargecontrol=replace(control, manualmodeamp=current)
+                )
+        if measuring:
+            self._latency_ms.append(round((written - measured) * 1000, 1))
+
+    @staticmethod
+    def _reserve(member: _Member) -> float:
+        """Return the current a station of unknown state may draw."""
+        if member.setpoint is not None:
+            return member.setpoint
+        control = member.coordinator.data.chargecontrol if member.coordinator.data else None
+        return (control and control.manualmodeamp) or 0
+
+    @staticmethod
+    async def _async_write(member: _Member, current: float) -> None:
+        """Write a setpoint, pausing the station at 0 A and resuming it above."""
+        coordinator = member.coordinator
+        if current:
+            await coordinator.async_set_charging_current(current, refresh=False)
+        await coordinator.async_pause(CONF_SITE_LIMIT, not current)
+
+    def _async_due(self, member: _Member, current: float, now: float) -> bool:
+        """Return True if a setpoint should be written now."""
+        setpoint = member.setpoint
+        if setpoint is None:
+            setpoint = member.coordinator.data.chargecontrol.manualmodeamp
+        if setpoint is not None and abs(current - setpoint) < BALANCER_MIN_STEP:
+            return False
+        if (
+            setpoint is not None
+            and current > setpoint
+            and now - member.written < BALANCER_WRITE_INTERVAL
+        ):
+            self._deferred += 1
+            return False
+        return True
+
+    @property
+    def metrics(self) -> dict[str, Any]:
+        """Return the setpoints, write counters and control loop latency."""
+        return {
+            "limit": self.limit,
+            "interval": BALANCER_INTERVAL,
+            "setpoints": {key: member.setpoint for key, member in self._members.items()},
+            "paused": [
+                key
+                for key, member in self._members.items()
+                if CONF_SITE_LIMIT in member.coordinator.paused_by
+            ],
+            "cycles": self._cycles,
+            "writes": self._writes,
+            "deferred": self._deferred,
+            "failed": self._failed,
+            "latency_ms": latency_metrics(self._latency_ms),
+        }
+
+
+@callback
+def async_get_balancer(hass: HomeAssistant) -> SiteLoadBalancer:
+    """Return the load balancer shared by all config entries."""
+    if (balancer := hass.data.get(DATA_BALANCER)) is None:
+        balancer = hass.data[DATA_BALANCER] = SiteLoadBalancer(hass)
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, balancer.async_stop)
+    return balancer
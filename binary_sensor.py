@@ -20,14 +20,14 @@ from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     UpdateFailed,
 )
-from . import WallboxCoordinator, WallboxEntity
+from . import WallboxCoordinator, WallboxEntity, async_setup_entity_discovery
 from .const import *
 
 #UPDATE_INTERVAL = 30
 
 _LOGGER = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(frozen=True)
 class WallboxBinarySensorEntityDescription(BinarySensorEntityDescription):
     device_class: BinarySensorDeviceClass | str | None = None
 
@@ -46,12 +46,12 @@ async def async_setup_entry(
     """Create wallbox binary sensor entities in HASS."""
     coordinator: WallboxCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    async_add_entities(
-        [
-            WallboxBinarySensor(coordinator, entry, description)
-            for ent in coordinator.data[CONF_DATA_KEY]
-            if (description := BINARYSENSOR_TYPES.get(ent))
-        ]
+    async_setup_entity_discovery(
+        coordinator,
+        entry,
+        BINARYSENSOR_TYPES,
+        lambda description: WallboxBinarySensor(coordinator, entry, description),
+        async_add_entities,
     )
 
 class WallboxBinarySensor(WallboxEntity, BinarySensorEntity):
@@ -67,46 +67,11 @@ class WallboxBinarySensor(WallboxEntity, BinarySensorEntity):
         description: WallboxSensorEntityDescription,
     ) -> None:
         """Initialize a Wallbox sensor."""
-        super().__init__(coordinator)
-        self.entity_description = description
-        self._attr_is_on = coordinator.data[CONF_DATA_KEY][CONF_CONNECTED_KEY]
-        self._attr_name = f"{entry.title} {description.name}"
-        self._attr_unique_id = f"{description.key}-{coordinator.data[CONF_DATA_KEY][CONF_SERIAL_NUMBER_KEY]}"
-
-    def update(self) -> bool:
-        _LOGGER.log(20, self.coordinator.data[CONF_DATA_KEY][CONF_CONNECTED_KEY])
-        if self.coordinator.data[CONF_DATA_KEY][CONF_CONNECTED_KEY] == "false":
-            #self.is_on = False #coordinator.data[CONF_DATA_KEY][CONF_CONNECTED_KEY]
-            self._attr_is_on = False
-        elif self.coordinator.data[CONF_DATA_KEY][CONF_CONNECTED_KEY] == False:
-            #self.is_on = False
-            self._attr_is_on = False
-        else:
-            #self.is_on = True
-            self._attr_is_on = True
-
-    def async_update(self) -> bool:
-        _LOGGER.log(20, self.coordinator.data[CONF_DATA_KEY][CONF_CONNECTED_KEY])
-        if self.coordinator.data[CONF_DATA_KEY][CONF_CONNECTED_KEY] == "false":
-            #self.is_on = False #coordinator.data[CONF_DATA_KEY][CONF_CONNECTED_KEY]
-            self._attr_is_on = False
-        elif self.coordinator.data[CONF_DATA_KEY][CONF_CONNECTED_KEY] == False:
-            #self.is_on = False
-            self._attr_is_on = False
-        else:
-            #self.is_on = True
-            self._attr_is_on = True
+        super().__init__(coordinator, entry, description)
+        self._attr_is_on = coordinator.data.chargecontrol.connected
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        if self.coordinator.data[CONF_DATA_KEY][CONF_CONNECTED_KEY] == "false":
-            #self.is_on = False #coordinator.data[CONF_DATA_KEY][CONF_CONNECTED_KEY]
-            self._attr_is_on = False
-        elif self.coordinator.data[CONF_DATA_KEY][CONF_CONNECTED_KEY] == False:
-            #self.is_on = False
-            self._attr_is_on = False
-        else:
-            #self.is_on = True
-            self._attr_is_on = True
+        self._attr_is_on = self.coordinator.data.chargecontrol.connected
         self.async_write_ha_state()
@@ -0,0 +1,130 @@
+"""Per-host circuit breaker for unreachable eCB1 chargers."""
+from __future__ import annotations
+
+from collections.abc import Callable
+import logging
+import random
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import (
+    BREAKER_BACKOFF,
+    BREAKER_CLOSED,
+    BREAKER_HALF_OPEN,
+    BREAKER_MAX_BACKOFF,
+    BREAKER_OPEN,
+    BREAKER_THRESHOLD,
+    DOMAIN,
+)
+from .executor import host_key
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_BREAKERS = f"{DOMAIN}_breakers"
+
+
+class CircuitBreaker:
+    """Stop polling a host after consecutive failures and probe it with backoff.
+
+    While open, a single cheap request is allowed once the backoff expired.
+    A successful probe closes the breaker and normal polling resumes.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        threshold: int = BREAKER_THRESHOLD,
+        backoff: float = BREAKER_BACKOFF,
+        max_backoff: float = BREAKER_MAX_BACKOFF,
+    ) -> None:
+        """Initialize."""
+        self.host = host
+        self.threshold = threshold
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.state = BREAKER_CLOSED
+        self.failures = 0
+        self.trips = 0
+        self.next_probe = 0.0
+        self._listeners: list[Callable[[], None]] = []
+
+    @callback
+    def async_add_listener(self, update_callback: Callable[[], None]) -> Callable[[], None]:
+        """Listen for state changes, return a function removing the listener."""
+        self._listeners.append(update_callback)
+        return lambda: self._listeners.remove(update_callback)
+
+    @callback
+    def _async_set_state(self, state: str) -> None:
+        """Change the state and notify listeners."""
+        if state == self.state:
+            return
+        _LOGGER.info("Circuit breaker of %s changed from %s to %s", self.host, self.state, state)
+        self.state = state
+        for update_callback in list(self._listeners):
+            update_callback()
+
+    @property
+    def probe_due(self) -> bool:
+        """Return True if the breaker is open and the backoff has expired."""
+        return self.state == BREAKER_OPEN and time.monotonic() >= self.next_probe
+
+    @callback
+    def async_start_probe(self) -> None:
+        """Mark that a probe request is in flight."""
+        self._async_set_state(BREAKER_HALF_OPEN)
+
+    @callback
+    def async_record_success(self) -> None:
+        """Close the breaker after a successful request."""
+        self.failures = 0
+        self.trips = 0
+        self._async_set_state(BREAKER_CLOSED)
+
+    @callback
+    def async_record_failure(self) -> None:
+        """Count a failed poll or probe, open the breaker when over the threshold."""
+        self.failures += 1
+        if self.state == BREAKER_CLOSED and self.failures < self.threshold:
+            return
+        delay = min(self.max_backoff, self.backoff * 2**self.trips)
+        self.trips += 1
+        self.next_probe = time.monotonic() + random.uniform(0.8, 1.0) * delay
+        self._async_set_state(BREAKER_OPEN)
+
+    @property
+    def attributes(self) -> dict[str, Any]:
+        """Return details for diagnostics."""
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "trips": self.trips,
+            "next_probe_in": max(0.0, round(self.next_probe - time.monotonic(), 1))
+            if self.state == BREAKER_OPEN
+            else None,
+        }
+
+
+@callback
+def async_get_breaker(hass: HomeAssistant, url: str) -> CircuitBreaker:
+    """Return the circuit breaker of a host, creating it on first use."""
+    breakers: dict[str, list[Any]] = hass.data.setdefault(DATA_BREAKERS, {})
+    host = host_key(url)
+    if host not in breakers:
+        breakers[host] = [CircuitBreaker(host), 0]
+    breakers[host][1] += 1
+    return breakers[host][0]
+
+
+@callback
+def async_release_breaker(hass: HomeAssistant, url: str) -> None:
+    """Release a reference to the circuit breaker of a host."""
+    breakers: dict[str, list[Any]] = hass.data.get(DATA_BREAKERS, {})
+    host = host_key(url)
+    if host not in breakers:
+        return
+    breakers[host][1] -= 1
+    if breakers[host][1] <= 0:
+        breakers.pop(host)
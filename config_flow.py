@@ -1,19 +1,62 @@
 """Config flow for Wallbox integration."""
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import Any
+from urllib.parse import urlparse
 
 import logging
 import voluptuous as vol
-from eCB1 import eCB1 as Wallbox
 
 from homeassistant import config_entries, core
-from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.const import (
+    CONF_PASSWORD,
+    CONF_SCAN_INTERVAL,
+    CONF_TIMEOUT,
+    CONF_USERNAME,
+)
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.selector import EntitySelector, EntitySelectorConfig
 
-from . import InvalidAuth, WallboxCoordinator
-from .const import CONF_STATION, CONF_BASEURL, DOMAIN
-
+from . import InvalidAuth, WallboxCoordinator, create_wallbox
+from .const import (
+    CONF_BASEURL,
+    CONF_DEADBAND,
+    CONF_DEMAND_RESPONSE,
+    CONF_DR_PAUSE_BELOW,
+    CONF_DR_REDUCE_BELOW,
+    CONF_METRICS,
+    CONF_MODBUS_PORT,
+    CONF_OBIS_GROUPS,
+    CONF_OBIS_PROFILE,
+    CONF_SAMPLE_HISTORY,
+    CONF_POLL_DEADLINE,
+    CONF_SITE_LIMIT,
+    CONF_STALE_AFTER,
+    CONF_STATION,
+    CONF_STATISTICS,
+    CONF_SURPLUS,
+    CONF_SURPLUS_PHASES,
+    CONF_SURPLUS_SENSOR,
+    CONF_TRANSPORT,
+    DEFAULT_MODBUS_PORT,
+    DEMAND_PAUSE_BELOW,
+    DEMAND_REDUCE_BELOW,
+    DOMAIN,
+    MODBUS_STATUS_ADDRESS,
+    OBIS_GROUPS,
+    OBIS_PROFILE_FULL,
+    OBIS_PROFILES,
+    POLL_DEADLINE,
+    REQUEST_TIMEOUT,
+    SOURCE_STALE_AFTER,
+    TRANSPORT_MODBUS,
+    TRANSPORT_REST,
+    TRANSPORTS,
+    UPDATE_INTERVAL,
+)
 _LOGGER = logging.getLogger(__name__)
 
 COMPONENT_DOMAIN = DOMAIN
@@ -24,10 +67,173 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
         vol.Required(CONF_STATION, default=1): int,
         vol.Optional(CONF_USERNAME): str,
         vol.Optional(CONF_PASSWORD): str,
-
+        vol.Required(CONF_TRANSPORT, default=TRANSPORT_REST): vol.In(TRANSPORTS),
+        vol.Optional(CONF_MODBUS_PORT, default=DEFAULT_MODBUS_PORT): int,
     }
 )
 
+def polling_schema(options: dict[str, Any]) -> vol.Schema:
+    """Return the polling options with the current options as defaults."""
+    return vol.Schema(
+        {
+            vol.Required(
+                CONF_SCAN_INTERVAL, default=options.get(CONF_SCAN_INTERVAL, UPDATE_INTERVAL)
+            ): vol.All(vol.Coerce(float), vol.Range(min=1, max=3600)),
+            vol.Required(
+                CONF_TIMEOUT, default=options.get(CONF_TIMEOUT, REQUEST_TIMEOUT)
+            ): vol.All(vol.Coerce(float), vol.Range(min=0.5, max=60)),
+            vol.Required(
+                CONF_POLL_DEADLINE, default=options.get(CONF_POLL_DEADLINE, POLL_DEADLINE)
+            ): vol.All(vol.Coerce(float), vol.Range(min=1, max=300)),
+            vol.Required(
+                CONF_STALE_AFTER,
+                default=options.get(CONF_STALE_AFTER, SOURCE_STALE_AFTER),
+            ): vol.All(vol.Coerce(float), vol.Range(min=1, max=86400)),
+        }
+    )
+
+
+def entities_schema(options: dict[str, Any]) -> vol.Schema:
+    """Return the meter entity options with the current options as defaults."""
+    schema: dict[Any, Any] = {
+        vol.Required(
+            CONF_OBIS_PROFILE, default=options.get(CONF_OBIS_PROFILE, OBIS_PROFILE_FULL)
+        ): vol.In(OBIS_PROFILES),
+        vol.Required(
+            CONF_OBIS_GROUPS, default=list(options.get(CONF_OBIS_GROUPS, OBIS_GROUPS))
+        ): cv.multi_select(
+            {group: group.replace("_", " ").capitalize() for group in OBIS_GROUPS}
+        ),
+    }
+    for group in OBIS_GROUPS:
+        key = f"{CONF_DEADBAND}_{group}"
+        schema[vol.Required(key, default=options.get(key, 0))] = vol.All(
+            vol.Coerce(float), vol.Range(min=0)
+        )
+    return vol.Schema(schema)
+
+
+def load_management_schema(options: dict[str, Any]) -> vol.Schema:
+    """Return the load management options with the current options as defaults."""
+    return vol.Schema(
+        {
+            vol.Required(
+                CONF_SITE_LIMIT, default=options.get(CONF_SITE_LIMIT, 0)
+            ): vol.All(vol.Coerce(float), vol.Range(min=0, max=1000)),
+            vol.Required(CONF_SURPLUS, default=options.get(CONF_SURPLUS, False)): bool,
+            vol.Optional(
+                CONF_SURPLUS_SENSOR,
+                description={"suggested_value": options.get(CONF_SURPLUS_SENSOR)},
+            ): EntitySelector(EntitySelectorConfig(domain="sensor", device_class="power")),
+            vol.Required(
+                CONF_SURPLUS_PHASES, default=options.get(CONF_SURPLUS_PHASES, 3)
+            ): vol.In((1, 3)),
+            vol.Required(
+                CONF_DEMAND_RESPONSE, default=options.get(CONF_DEMAND_RESPONSE, False)
+            ): bool,
+            vol.Required(
+                CONF_DR_REDUCE_BELOW,
+                default=options.get(CONF_DR_REDUCE_BELOW, DEMAND_REDUCE_BELOW),
+            ): vol.All(vol.Coerce(float), vol.Range(min=45, max=55)),
+            vol.Required(
+                CONF_DR_PAUSE_BELOW,
+                default=options.get(CONF_DR_PAUSE_BELOW, DEMAND_PAUSE_BELOW),
+            ): vol.All(vol.Coerce(float), vol.Range(min=45, max=55)),
+        }
+    )
+
+
+def recording_schema(options: dict[str, Any]) -> vol.Schema:
+    """Return the recording options with the current options as defaults."""
+    return vol.Schema(
+        {
+            vol.Required(CONF_METRICS, default=options.get(CONF_METRICS, False)): bool,
+            vol.Required(
+                CONF_STATISTICS, default=options.get(CONF_STATISTICS, False)
+            ): bool,
+            vol.Required(
+                CONF_SAMPLE_HISTORY, default=options.get(CONF_SAMPLE_HISTORY, 0)
+            ): vol.All(vol.Coerce(float), vol.Range(min=0, max=10000)),
+        }
+    )
+
+
+# Menu option -> schema of its options, in the order of the menu.
+OPTIONS_SECTIONS: dict[str, Callable[[dict[str, Any]], vol.Schema]] = {
+    "polling": polling_schema,
+    "entities": entities_schema,
+    "load_management": load_management_schema,
+    "recording": recording_schema,
+}
+
+
+def _section_errors(user_input: dict[str, Any]) -> dict[str, str]:
+    """Return the errors of options that do not fit together."""
+    # Below the pause threshold nothing is left to reduce.
+    if (
+        CONF_DR_PAUSE_BELOW in user_input
+        and user_input[CONF_DR_PAUSE_BELOW] >= user_input[CONF_DR_REDUCE_BELOW]
+    ):
+        return {CONF_DR_PAUSE_BELOW: "pause_not_below_reduce"}
+    return {}
+
+
+class OptionsFlowHandler(config_entries.OptionsFlow):
+    """Handle the options of a Wallbox station, one section at a time."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize options flow."""
+        self.config_entry = config_entry
+
+    async def async_step_init(self, user_input: dict[str, Any] | None = None) -> FlowResult:
+        """Show the sections of the options."""
+        return self.async_show_menu(step_id="init", menu_options=list(OPTIONS_SECTIONS))
+
+    async def async_step_polling(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the poll interval, timeouts and when values go stale."""
+        return self._async_step_section("polling", user_input)
+
+    async def async_step_entities(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the meter profile, groups and deadbands."""
+        return self._async_step_section("entities", user_input)
+
+    async def async_step_load_management(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage site load balancing, PV surplus charging and demand response."""
+        return self._async_step_section("load_management", user_input)
+
+    async def async_step_recording(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the OpenMetrics endpoint, statistics and sample history."""
+        return self._async_step_section("recording", user_input)
+
+    @callback
+    def _async_step_section(
+        self, step_id: str, user_input: dict[str, Any] | None
+    ) -> FlowResult:
+        """Show the form of a section, or save it keeping the other sections."""
+        options = dict(self.config_entry.options)
+        schema = OPTIONS_SECTIONS[step_id](options)
+        if user_input is None:
+            return self.async_show_form(step_id=step_id, data_schema=schema)
+        if errors := _section_errors(user_input):
+            return self.async_show_form(
+                step_id=step_id,
+                data_schema=OPTIONS_SECTIONS[step_id]({**options, **user_input}),
+                errors=errors,
+            )
+        # Optional options left empty are removed, not kept from before.
+        for key in schema.schema:
+            options.pop(str(key), None)
+        return self.async_create_entry(title="", data={**options, **user_input})
+
+
 STEP_SOCKETS_DATA_SCHEMA = vol.Schema({
     vol.Optional("Socket"): bool,
 })
@@ -54,10 +260,23 @@ async def validate_input(
 
     if not data[CONF_BASEURL].endswith("/"):
         data[CONF_BASEURL] = data[CONF_BASEURL]+"/"
-    wallbox = Wallbox(data["username"], data["password"], data[CONF_BASEURL])
+    wallbox = await hass.async_add_import_executor_job(create_wallbox, data)
     wallbox_coordinator = WallboxCoordinator(data[CONF_STATION], wallbox, hass)
 
     await wallbox_coordinator.async_validate_input()
+    if data.get(CONF_TRANSPORT) == TRANSPORT_MODBUS:
+        from .modbus import ModbusTcpClient
+
+        client = ModbusTcpClient(
+            urlparse(data[CONF_BASEURL]).hostname,
+            data.get(CONF_MODBUS_PORT, DEFAULT_MODBUS_PORT),
+        )
+        try:
+            await client.async_read_input_registers(
+                data[CONF_STATION], MODBUS_STATUS_ADDRESS, 1
+            )
+        finally:
+            client.close()
     try:
         data['station_name'] = await hass.async_add_executor_job(wallbox.getMetersData, data['station'])
         data['station_name'] = data['station_name']['meter']['name']
@@ -82,6 +301,14 @@ class ConfigFlow(config_entries.ConfigFlow, domain=COMPONENT_DOMAIN):
         """Start the Wallbox config flow."""
         self._reauth_entry: config_entries.ConfigEntry | None = None
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> OptionsFlowHandler:
+        """Get the options flow for this handler."""
+        return OptionsFlowHandler(config_entry)
+
     async def async_step_reauth(self, user_input: dict[str, Any] | None = None) -> FlowResult:
         """Perform reauth upon an API authentication error."""
         self._reauth_entry = self.hass.config_entries.async_get_entry(
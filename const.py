@@ -1,7 +1,5 @@
 """Constants for the Wallbox integration."""
 
-from .obis import *
-
 DOMAIN = "ha-eCB1"
 UPDATE_INTERVAL = 10
 
@@ -23,6 +21,7 @@ CONF_COST_KEY = "cost"
 CONF_CURRENT_MODE_KEY = "mode"
 CONF_CURRENT_VERSION_KEY = "currentVersion"
 CONF_DATA_KEY = "chargecontrol"
+CONF_DATA_LIST_KEY = "chargecontrols"
 CONF_DEPOT_PRICE_KEY = "depot_price"
 # CONF_KWH_OUT_KEY = "1-0:1.8.0"
 # CONF_KWH_IN_KEY = "1-0:2.8.0"
@@ -41,3 +40,156 @@ CONF_STATION = "station"
 CONF_STATUS_DESCRIPTION_KEY = "status_description"
 CONF_STATUS_ID_KEY = "status_id"
 CONF_SYS_INFO_KEY = "system"
+
+EXECUTOR_MAX_WORKERS = 2
+EXECUTOR_TIMEOUT = 20
+REQUEST_TIMEOUT = 5
+SCHEDULER_JITTER = 0.1
+
+POLL_DEADLINE = 8
+SOURCE_STALE_AFTER = 60
+OBIS_PREFIX = "1-0:"
+SOURCE_AI_MODE = "ai_mode"
+SOURCE_METERS = "meters"
+SOURCE_STATUS = "status"
+SOURCE_SYSTEM = "system"
+SOURCES = (SOURCE_STATUS, SOURCE_AI_MODE, SOURCE_SYSTEM, SOURCE_METERS)
+SNAPSHOT_HISTORY = 32
+DEFAULT_PRECISION = 2
+
+BREAKER_BACKOFF = 10
+BREAKER_MAX_BACKOFF = 300
+BREAKER_THRESHOLD = 3
+BREAKER_CLOSED = "closed"
+BREAKER_HALF_OPEN = "half_open"
+BREAKER_OPEN = "open"
+CONF_BREAKER_KEY = "circuit_breaker"
+
+# Registries of the optional controllers, kept here so the integration can
+# check and stop them without importing their modules (or the recorder).
+DATA_BALANCER = f"{DOMAIN}_balancer"
+DATA_DEMAND = f"{DOMAIN}_demand_response"
+DATA_SAMPLE_HISTORY = f"{DOMAIN}_sample_history"
+DATA_SCHEDULER = f"{DOMAIN}_scheduler"
+DATA_STATISTICS = f"{DOMAIN}_statistics"
+DATA_SURPLUS = f"{DOMAIN}_surplus"
+
+CONF_DEADBAND = "deadband"
+CONF_DEMAND_RESPONSE = "demand_response"
+CONF_DR_PAUSE_BELOW = "demand_response_pause_below"
+CONF_DR_REDUCE_BELOW = "demand_response_reduce_below"
+CONF_METRICS = "metrics"
+CONF_SAMPLE_HISTORY = "sample_history_size"
+CONF_SITE_LIMIT = "site_current_limit"
+CONF_STATISTICS = "external_statistics"
+CONF_SURPLUS = "pv_surplus"
+CONF_SURPLUS_PHASES = "pv_surplus_phases"
+CONF_SURPLUS_SENSOR = "pv_surplus_sensor"
+CONF_OBIS_GROUPS = "obis_groups"
+CONF_OBIS_PROFILE = "obis_profile"
+CONF_POLL_DEADLINE = "poll_deadline"
+CONF_STALE_AFTER = "stale_after"
+OBIS_GROUP_ACTIVE_POWER = "active_power"
+OBIS_GROUP_APPARENT_POWER = "apparent_power"
+OBIS_GROUP_CURRENT = "current"
+OBIS_GROUP_ENERGY = "energy"
+OBIS_GROUP_FREQUENCY = "frequency"
+OBIS_GROUP_POWER_FACTOR = "power_factor"
+OBIS_GROUP_REACTIVE_POWER = "reactive_power"
+OBIS_GROUP_VOLTAGE = "voltage"
+OBIS_GROUPS = (
+    OBIS_GROUP_ACTIVE_POWER,
+    OBIS_GROUP_REACTIVE_POWER,
+    OBIS_GROUP_APPARENT_POWER,
+    OBIS_GROUP_CURRENT,
+    OBIS_GROUP_VOLTAGE,
+    OBIS_GROUP_POWER_FACTOR,
+    OBIS_GROUP_FREQUENCY,
+    OBIS_GROUP_ENERGY,
+)
+OBIS_PROFILE_FULL = "full"
+OBIS_PROFILE_MINIMAL = "minimal"
+OBIS_PROFILE_PER_PHASE = "per_phase"
+OBIS_PROFILES = (OBIS_PROFILE_MINIMAL, OBIS_PROFILE_PER_PHASE, OBIS_PROFILE_FULL)
+
+CONF_MODBUS_PORT = "modbus_port"
+CONF_TRANSPORT = "transport"
+DEFAULT_MODBUS_PORT = 502
+MODBUS_MAX_GAP = 8
+MODBUS_MAX_REGISTERS = 125
+MODBUS_STATUS_ADDRESS = 0
+TRANSPORT_MODBUS = "modbus"
+TRANSPORT_REST = "rest"
+TRANSPORTS = (TRANSPORT_REST, TRANSPORT_MODBUS)
+
+# Event types are slugs, the domain has a dash and capitals.
+EVENT_PREFIX = DOMAIN.lower().replace("-", "_")
+EVENT_AI_MODE_CHANGED = f"{EVENT_PREFIX}_ai_mode_changed"
+EVENT_CONNECTED_CHANGED = f"{EVENT_PREFIX}_connected_changed"
+EVENT_MODE_CHANGED = f"{EVENT_PREFIX}_mode_changed"
+EVENT_STATEID_CHANGED = f"{EVENT_PREFIX}_stateid_changed"
+# Data key -> event fired when a read shows it changed.
+LIFECYCLE_EVENTS = {
+    CONF_CONNECTED_KEY: EVENT_CONNECTED_CHANGED,
+    CONF_LOCKED_UNLOCKED_KEY: EVENT_STATEID_CHANGED,
+    CONF_CURRENT_MODE_KEY: EVENT_MODE_CHANGED,
+    CONF_AI_MODE_KEY: EVENT_AI_MODE_CHANGED,
+}
+
+SERVICE_BULK_COMMAND = "bulk_command"
+SERVICE_EXPORT = "export"
+SERVICE_QUERY_HISTORY = "query_history"
+SERVICE_READ_VALUES = "read_values"
+ATTR_COMMAND = "command"
+ATTR_END = "end"
+ATTR_FORMAT = "format"
+ATTR_KIND = "kind"
+ATTR_KEYS = "keys"
+ATTR_MERGE = "merge"
+ATTR_POINTS = "points"
+ATTR_START = "start"
+ATTR_VALUE = "value"
+COMMAND_AI_MODE = "ai_mode"
+COMMAND_CHARGING_CURRENT = "charging_current"
+COMMAND_CHARGING_MODE = "charging_mode"
+COMMAND_LOCK = "lock"
+
+BALANCER_HEADROOM = 2
+BALANCER_INTERVAL = 2
+BALANCER_LATENCY_SAMPLES = 64
+BALANCER_MIN_CURRENT = 6
+BALANCER_MIN_STEP = 1
+BALANCER_WRITE_INTERVAL = 10
+
+SURPLUS_HYSTERESIS = 1
+SURPLUS_INTERVAL = 2
+SURPLUS_LATENCY_SAMPLES = 64
+SURPLUS_START_DELAY = 60
+SURPLUS_STOP_DELAY = 120
+SURPLUS_VOLTAGE = 230
+SURPLUS_WRITE_INTERVAL = 5
+
+DEMAND_INTERVAL = 1
+DEMAND_INTERVAL_MODBUS = 0.5
+DEMAND_LATENCY_SAMPLES = 64
+DEMAND_PAUSE_BELOW = 49.5
+DEMAND_RAMP_INTERVAL = 5
+DEMAND_RAMP_STEP = 1
+DEMAND_RECOVERY_DELAY = 30
+DEMAND_REDUCE_BELOW = 49.8
+
+SAMPLE_HISTORY_CHUNK = 4096
+SAMPLE_HISTORY_FLUSH_INTERVAL = 60
+SAMPLE_HISTORY_POINTS = 200
+
+EXPORT_FORMAT_CSV = "csv"
+EXPORT_FORMAT_PARQUET = "parquet"
+EXPORT_FORMATS = (EXPORT_FORMAT_CSV, EXPORT_FORMAT_PARQUET)
+EXPORT_KIND_SAMPLES = "samples"
+EXPORT_KIND_SESSIONS = "sessions"
+EXPORT_KINDS = (EXPORT_KIND_SESSIONS, EXPORT_KIND_SAMPLES)
+SESSION_END_AFTER = 300
+SESSION_MIN_POWER = 100
+
+STATISTICS_BACKFILL_MAX_HOURS = 31 * 24
+STATISTICS_PROFILE_DAYS = 7
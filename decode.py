@@ -0,0 +1,273 @@
+"""Typed decoding of eCB1 responses for the Wallbox integration."""
+from __future__ import annotations
+
+from collections.abc import Callable, Collection, Mapping
+from dataclasses import dataclass, fields, make_dataclass
+import threading
+from typing import Any
+
+from homeassistant.util.json import json_loads
+
+from . import obis
+from .const import (
+    CONF_DATA_KEY,
+    CONF_DATA_LIST_KEY,
+    CONF_METERS_KEY,
+    CONF_NAME_KEY,
+    CONF_PART_NUMBER_KEY,
+    DEFAULT_PRECISION,
+    OBIS_GROUP_ACTIVE_POWER,
+    OBIS_GROUP_APPARENT_POWER,
+    OBIS_GROUP_CURRENT,
+    OBIS_GROUP_ENERGY,
+    OBIS_GROUP_FREQUENCY,
+    OBIS_GROUP_POWER_FACTOR,
+    OBIS_GROUP_REACTIVE_POWER,
+    OBIS_GROUP_VOLTAGE,
+    OBIS_PREFIX,
+    OBIS_PROFILE_FULL,
+    OBIS_PROFILE_MINIMAL,
+    OBIS_PROFILE_PER_PHASE,
+)
+
+# OBIS code -> attribute name, e.g. "1-0:1.4.0" -> "active_power_plus".
+OBIS_FIELDS: dict[str, str] = {
+    code: name.removeprefix("OBIS_").lower()
+    for name, code in vars(obis).items()
+    if name.startswith("OBIS_")
+}
+
+# Quantity (C field of the code, per phase codes offset by 20) -> group.
+_QUANTITY_GROUPS: dict[int, str] = {
+    1: OBIS_GROUP_ACTIVE_POWER,
+    2: OBIS_GROUP_ACTIVE_POWER,
+    3: OBIS_GROUP_REACTIVE_POWER,
+    4: OBIS_GROUP_REACTIVE_POWER,
+    9: OBIS_GROUP_APPARENT_POWER,
+    10: OBIS_GROUP_APPARENT_POWER,
+    11: OBIS_GROUP_CURRENT,
+    12: OBIS_GROUP_VOLTAGE,
+    13: OBIS_GROUP_POWER_FACTOR,
+    14: OBIS_GROUP_FREQUENCY,
+}
+
+
+def _obis_quantity(code: str) -> tuple[int, str]:
+    """Return the quantity and the kind (4 instantaneous, 3/6 min/max, 8 energy)."""
+    quantity, kind = code.removeprefix(OBIS_PREFIX).split(".")[:2]
+    return int(quantity), kind
+
+
+def _obis_group(code: str) -> str:
+    """Return the group of an OBIS code, e.g. "1-0:52.4.0" -> "voltage"."""
+    quantity, kind = _obis_quantity(code)
+    if kind == "8":
+        return OBIS_GROUP_ENERGY
+    return _QUANTITY_GROUPS[quantity % 20]
+
+
+# OBIS code -> group, e.g. "1-0:32.4.0" -> "voltage".
+OBIS_GROUP_OF_CODE: dict[str, str] = {code: _obis_group(code) for code in OBIS_FIELDS}
+
+# Active power, current, voltage and power factor per phase, without min/max.
+_PER_PHASE_QUANTITIES = (1, 2, 11, 12, 13, 14)
+
+# Profile -> OBIS codes that get entities.
+OBIS_PROFILE_CODES: dict[str, frozenset[str]] = {
+    OBIS_PROFILE_MINIMAL: frozenset(
+        code
+        for code in OBIS_FIELDS
+        if _obis_quantity(code)[0] in (1, 2) and _obis_quantity(code)[1] in ("4", "8")
+    ),
+    OBIS_PROFILE_PER_PHASE: frozenset(
+        code
+        for code in OBIS_FIELDS
+        if _obis_quantity(code)[0] % 20 in _PER_PHASE_QUANTITIES
+        and _obis_quantity(code)[1] in ("4", "8")
+    ),
+    OBIS_PROFILE_FULL: frozenset(OBIS_FIELDS),
+}
+
+
+def _meter_keys(self: Any) -> list[str]:
+    """Return the OBIS codes reported by the meter."""
+    return [code for code, attr in OBIS_FIELDS.items() if getattr(self, attr) is not None]
+
+
+_meter_data: type | None = None
+_meter_data_lock = threading.Lock()
+
+
+def meter_data_class() -> type:
+    """Return the MeterData class, generated on the first meter response.
+
+    Generating a dataclass with one field per OBIS code takes several
+    milliseconds, so it is deferred from import to the first decode, which
+    runs in the executor.
+    """
+    global _meter_data
+    with _meter_data_lock:
+        if _meter_data is None:
+            _meter_data = make_dataclass(
+                "MeterData",
+                [(attr, "float | None", None) for attr in OBIS_FIELDS.values()],
+                namespace={
+                    "keys": _meter_keys,
+                    "__doc__": "OBIS values of a meter, one float per code.",
+                },
+                frozen=True,
+                slots=True,
+            )
+        return _meter_data
+
+
+@dataclass(frozen=True, slots=True)
+class MeterInfo:
+    """Meter of a station."""
+
+    name: str | None
+    type: str | None
+    data: Any  # MeterData
+
+
+@dataclass(frozen=True, slots=True)
+class ChargeControl:
+    """Charge control status of a station, normalized to canonical types."""
+
+    id: int | None = None
+    type: str | None = None
+    connected: bool | None = None
+    stateid: int | None = None
+    mode: str | None = None
+    manualmodeamp: float | None = None
+    supplylinemaxamp: float | None = None
+    currentpwmamp: float | None = None
+
+    def keys(self) -> list[str]:
+        """Return the fields reported by the station."""
+        return [name for name in CHARGE_CONTROL_FIELDS if getattr(self, name) is not None]
+
+
+CHARGE_CONTROL_FIELDS: tuple[str, ...] = tuple(field.name for field in fields(ChargeControl))
+
+
+def _to_float(value: Any, precision: int = DEFAULT_PRECISION) -> float | None:
+    """Convert a numeric value to a float rounded to precision."""
+    try:
+        return round(float(value), precision)
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_int(value: Any) -> int | None:
+    """Convert a numeric value to int."""
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_str(value: Any) -> str | None:
+    """Convert a value to str."""
+    return None if value is None else str(value)
+
+
+def to_bool(value: Any) -> bool | None:
+    """Convert the eCB1 spellings of a flag ("false", "1", True, ...) to bool."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return value.strip().lower() not in ("", "0", "false", "off")
+    return bool(value)
+
+
+_CHARGE_CONTROL_TYPES: dict[str, Callable[[Any], Any]] = {
+    "id": _to_int,
+    "type": _to_str,
+    "connected": to_bool,
+    "stateid": _to_int,
+    "mode": _to_str,
+}
+_CHARGE_CONTROL_FLOATS = ("manualmodeamp", "supplylinemaxamp", "currentpwmamp")
+
+
+def charge_control_from_values(
+    status: Mapping[str, Any], precision: Mapping[str, int] | None = None
+) -> ChargeControl:
+    """Build a ChargeControl from raw field values, normalizing every field once."""
+    precision = precision or {}
+    values = {
+        name: convert(status.get(name)) for name, convert in _CHARGE_CONTROL_TYPES.items()
+    }
+    for name in _CHARGE_CONTROL_FLOATS:
+        values[name] = _to_float(status.get(name), precision.get(name, DEFAULT_PRECISION))
+    return ChargeControl(**values)
+
+
+def decode_status(raw: bytes, precision: Mapping[str, int] | None = None) -> ChargeControl:
+    """Decode the body of api/v1/chargecontrols/<id>."""
+    return charge_control_from_values(json_loads(raw)[CONF_DATA_KEY], precision)
+
+
+def decode_statuses(raw: bytes) -> dict[int | None, Mapping[str, Any]]:
+    """Decode the body of api/v1/chargecontrols into the raw fields per station id."""
+    return {
+        _to_int(status.get("id")): status for status in json_loads(raw)[CONF_DATA_LIST_KEY]
+    }
+
+
+def meter_info_from_values(
+    name: str | None,
+    meter_type: str | None,
+    values: Mapping[str, Any],
+    precision: Mapping[str, int] | None = None,
+    codes: Collection[str] | None = None,
+    deadbands: Mapping[str, float] | None = None,
+    previous: Any = None,
+) -> MeterInfo:
+    """Build a MeterInfo from raw values keyed by OBIS code.
+
+    Every OBIS value is converted to float and rounded to the precision of its
+    sensor once, so entities only read attributes. Codes outside codes are
+    skipped, and a value that moved less than its deadband from the previous
+    MeterData keeps the previous value.
+    """
+    precision = precision or {}
+    deadbands = deadbands or {}
+    data: dict[str, float | None] = {}
+    for code, value in values.items():
+        if (attr := OBIS_FIELDS.get(code)) is None or (
+            codes is not None and code not in codes
+        ):
+            continue
+        number = _to_float(value, precision.get(code, DEFAULT_PRECISION))
+        if (
+            (deadband := deadbands.get(code))
+            and number is not None
+            and previous is not None
+            and (held := getattr(previous, attr)) is not None
+            and abs(number - held) < deadband
+        ):
+            number = held
+        data[attr] = number
+    return MeterInfo(name, meter_type, meter_data_class()(**data))
+
+
+def decode_meters(
+    raw: bytes,
+    precision: Mapping[str, int] | None = None,
+    codes: Collection[str] | None = None,
+    deadbands: Mapping[str, float] | None = None,
+    previous: Any = None,
+) -> MeterInfo:
+    """Decode the body of api/v1/meters/<id>."""
+    meter: dict[str, Any] = json_loads(raw)[CONF_METERS_KEY]
+    return meter_info_from_values(
+        meter.get(CONF_NAME_KEY),
+        meter.get(CONF_PART_NUMBER_KEY),
+        meter.get("data") or {},
+        precision,
+        codes,
+        deadbands,
+        previous,
+    )
@@ -0,0 +1,289 @@
+"""Grid frequency demand response for the Wallbox integration."""
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable
+from dataclasses import replace
+from datetime import timedelta
+import logging
+import math
+import time
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from . import STATION_ERRORS
+from .balancer import SiteLoadBalancer, latency_metrics
+from .const import (
+    BALANCER_MIN_CURRENT,
+    CONF_DEMAND_RESPONSE,
+    CONF_DR_PAUSE_BELOW,
+    CONF_DR_REDUCE_BELOW,
+    DATA_BALANCER,
+    DATA_DEMAND,
+    DATA_SURPLUS,
+    DEMAND_INTERVAL,
+    DEMAND_INTERVAL_MODBUS,
+    DEMAND_LATENCY_SAMPLES,
+    DEMAND_PAUSE_BELOW,
+    DEMAND_RAMP_INTERVAL,
+    DEMAND_RAMP_STEP,
+    DEMAND_RECOVERY_DELAY,
+    DEMAND_REDUCE_BELOW,
+)
+from .obis import OBIS_SUPPLY_FREQUENCY
+
+if TYPE_CHECKING:
+    from . import WallboxCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+DEMAND_CODES = frozenset({OBIS_SUPPLY_FREQUENCY})
+
+STATE_NORMAL = "normal"
+STATE_PAUSED = "paused"
+STATE_RECOVERING = "recovering"
+STATE_REDUCED = "reduced"
+
+
+class DemandResponseController:
+    """Lower or pause the charging current of a station on under-frequency.
+
+    The supply frequency is read on a fast loop of its own, every
+    DEMAND_INTERVAL_MODBUS over Modbus and every DEMAND_INTERVAL over REST.
+    Below the reduce threshold the current drops to the minimum, below the
+    pause threshold charging pauses by locking the station, written right
+    away past every rate limit. Once the frequency stayed above the reduce threshold for
+    DEMAND_RECOVERY_DELAY, the cap is raised by DEMAND_RAMP_STEP every
+    DEMAND_RAMP_INTERVAL until the current before the event is restored.
+    Nothing is read while the circuit breaker of the host is open.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        key: str,
+        coordinator: WallboxCoordinator,
+        reduce_below: float = DEMAND_REDUCE_BELOW,
+        pause_below: float = DEMAND_PAUSE_BELOW,
+    ) -> None:
+        """Initialize."""
+        self._hass = hass
+        self._key = key
+        self._coordinator = coordinator
+        self.reduce_below = reduce_below
+        self.pause_below = pause_below
+        self.interval = (
+            DEMAND_INTERVAL_MODBUS if coordinator.transport is not None else DEMAND_INTERVAL
+        )
+        self.frequency: float | None = None
+        self.state = STATE_NORMAL
+        # Manual current before the event, restored by the ramp.
+        self._restore: float | None = None
+        self._recovered_since: float | None = None
+        self._ramped = -math.inf
+        self._unsubscribe: Callable[[], None] | None = None
+        self._busy = False
+        self._latency_ms: deque[float] = deque(maxlen=DEMAND_LATENCY_SAMPLES)
+        self._samples = 0
+        self._events = 0
+        self._writes = 0
+        self._failed = 0
+
+    @callback
+    def async_start(self) -> None:
+        """Start watching the supply frequency."""
+        self._unsubscribe = async_track_time_interval(
+            self._hass,
+            self._async_tick,
+            timedelta(seconds=self.interval),
+            cancel_on_shutdown=True,
+        )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop watching, lifting the cap but leaving the current in place."""
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+            self._unsubscribe = None
+        self._coordinator.current_caps.pop(CONF_DEMAND_RESPONSE, None)
+        if CONF_DEMAND_RESPONSE in self._coordinator.paused_by:
+            self._hass.async_create_task(
+                self._coordinator.async_resume(CONF_DEMAND_RESPONSE)
+            )
+
+    def cap_for(self, frequency: float) -> float | None:
+        """Return the cap a frequency calls for, None if it is in range."""
+        if frequency < self.pause_below:
+            return 0.0
+        if frequency < self.reduce_below:
+            return float(BALANCER_MIN_CURRENT)
+        return None
+
+    async def _async_tick(self, _now: Any = None) -> None:
+        """Read the supply frequency and act on it."""
+        if self._busy or not self._coordinator.reachable:
+            return
+        self._busy = True
+        try:
+            await self._async_sample()
+        finally:
+            self._busy = False
+
+    async def _async_sample(self) -> None:
+        """Act on one frequency sample."""
+        sampled = time.monotonic()
+        try:
+            data = await self._coordinator.async_read_meter_values(DEMAND_CODES)
+        except STATION_ERRORS as err:
+            self._failed += 1
+            _LOGGER.debug("Reading the frequency of %s failed: %r", self._key, err)
+            return
+        if (frequency := data.supply_frequency) is None:
+            return
+        self.frequency = frequency
+        self._samples += 1
+        caps = self._coordinator.current_caps
+
+        if (cap := self.cap_for(frequency)) is not None:
+            self._recovered_since = None
+            if self._restore is None:
+                control = self._coordinator.data.chargecontrol
+                self._restore = (control and control.manualmodeamp) or float(
+                    BALANCER_MIN_CURRENT
+                )
+                self._events += 1
+                _LOGGER.warning(
+                    "Supply frequency of %s at %s Hz, limiting charging to %s A",
+                    self._key,
+                    frequency,
+                    cap,
+                )
+            self.state = STATE_PAUSED if cap == 0 else STATE_REDUCED
+            if (held := caps.get(CONF_DEMAND_RESPONSE)) is None or cap < held:
+                caps[CONF_DEMAND_RESPONSE] = cap
+                control = self._coordinator.data.chargecontrol
+                # A station already below the cap, e.g. paused, stays there.
+                if (
+                    control is None
+                    or control.manualmodeamp is None
+                    or control.manualmodeamp > cap
+                ):
+                    await self._async_write(cap, sampled)
+            return
+
+        if self._restore is None:
+            return
+        now = time.monotonic()
+        if self._recovered_since is None:
+            self._recovered_since = now
+            self.state = STATE_RECOVERING
+            return
+        if (
+            now - self._recovered_since < DEMAND_RECOVERY_DELAY
+            or now - self._ramped < DEMAND_RAMP_INTERVAL
+        ):
+            return
+        self._ramped = now
+        cap = max(caps.get(CONF_DEMAND_RESPONSE, 0) + DEMAND_RAMP_STEP, BALANCER_MIN_CURRENT)
+        if cap >= self._restore:
+            cap = self._restore
+            caps.pop(CONF_DEMAND_RESPONSE, None)
+            self._restore = None
+            self.state = STATE_NORMAL
+        else:
+            caps[CONF_DEMAND_RESPONSE] = cap
+        if self._managed and CONF_DEMAND_RESPONSE not in self._coordinator.paused_by:
+            # The balancer or the surplus controller raises the current.
+            if (balancer := self._balancer) is not None:
+                balancer.async_request_cycle()
+        else:
+            # Charging resumes at the cap, not at the current before the pause.
+            await self._async_write(cap, sampled)
+
+    @property
+    def _balancer(self) -> SiteLoadBalancer | None:
+        """Return the site balancer if it balances the station, without creating it."""
+        balancer: SiteLoadBalancer | None = self._hass.data.get(DATA_BALANCER)
+        return balancer if balancer is not None and balancer.is_member(self._key) else None
+
+    @property
+    def _managed(self) -> bool:
+        """Return True if another controller writes the current of the station."""
+        return self._balancer is not None or (
+            self._key in self._hass.data.get(DATA_SURPLUS, {})
+        )
+
+    async def _async_write(self, cap: float, sampled: float) -> None:
+        """Write a cap as the charging current of the station, pausing at 0 A."""
+        coordinator = self._coordinator
+        try:
+            if cap:
+                await coordinator.async_set_charging_current(cap, refresh=False)
+            await coordinator.async_pause(CONF_DEMAND_RESPONSE, not cap)
+        except STATION_ERRORS as err:
+            self._failed += 1
+            _LOGGER.warning("Setting %s A on %s failed: %r", cap, self._key, err)
+            return
+        self._writes += 1
+        self._latency_ms.append(round((time.monotonic() - sampled) * 1000, 1))
+        if cap and (control := coordinator.data.chargecontrol) is not None:
+            coordinator.async_set_optimistic(
+                chargecontrol=replace(control, manualmodeamp=cap)
+            )
+        if (balancer := self._balancer) is not None:
+            balancer.async_request_cycle()
+
+    @property
+    def metrics(self) -> dict[str, Any]:
+        """Return the state, counters and sample to command latency."""
+        return {
+            "state": self.state,
+            "frequency": self.frequency,
+            "interval": self.interval,
+            "cap": self._coordinator.current_caps.get(CONF_DEMAND_RESPONSE),
+            "samples": self._samples,
+            "events": self._events,
+            "writes": self._writes,
+            "failed": self._failed,
+            "latency_ms": latency_metrics(self._latency_ms),
+        }
+
+
+@callback
+def async_apply_demand_response(
+    hass: HomeAssistant, entry: ConfigEntry, coordinator: WallboxCoordinator
+) -> None:
+    """Start, restart or stop demand response of an entry per its options."""
+    controllers: dict[str, DemandResponseController] = hass.data.setdefault(
+        DATA_DEMAND, {}
+    )
+    if (controller := controllers.pop(entry.entry_id, None)) is not None:
+        controller.async_stop()
+    if not entry.options.get(CONF_DEMAND_RESPONSE):
+        return
+    controller = controllers[entry.entry_id] = DemandResponseController(
+        hass,
+        entry.entry_id,
+        coordinator,
+        entry.options.get(CONF_DR_REDUCE_BELOW, DEMAND_REDUCE_BELOW),
+        entry.options.get(CONF_DR_PAUSE_BELOW, DEMAND_PAUSE_BELOW),
+    )
+    controller.async_start()
+
+
+@callback
+def async_stop_demand_response(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Stop demand response of an entry."""
+    if (controller := hass.data.get(DATA_DEMAND, {}).pop(entry.entry_id, None)) is not None:
+        controller.async_stop()
+
+
+@callback
+def async_get_demand_response(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> DemandResponseController | None:
+    """Return the demand response controller of an entry, None if it is disabled."""
+    return hass.data.get(DATA_DEMAND, {}).get(entry.entry_id)
@@ -0,0 +1,61 @@
+"""Diagnostics support for the Wallbox integration."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+
+from . import LOAD_TIMES_MS, WallboxCoordinator
+from .const import (
+    DATA_BALANCER,
+    DATA_DEMAND,
+    DATA_SAMPLE_HISTORY,
+    DATA_SCHEDULER,
+    DATA_STATISTICS,
+    DATA_SURPLUS,
+    DOMAIN,
+    SOURCES,
+)
+
+TO_REDACT = {CONF_PASSWORD, CONF_USERNAME}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: WallboxCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "executor": coordinator.executor.metrics if coordinator.executor else None,
+        "snapshot_version": coordinator.data.version if coordinator.data else None,
+        "poll_interval": coordinator.poll_interval,
+        "poll_phase": scheduler.phases.get(entry.entry_id)
+        if (scheduler := hass.data.get(DATA_SCHEDULER))
+        else None,
+        "source_age": {source: coordinator.source_age(source) for source in SOURCES},
+        "circuit_breaker": coordinator.breaker.attributes if coordinator.breaker else None,
+        "modbus_requests": coordinator.transport.client.requests
+        if coordinator.transport
+        else None,
+        "load_balancer": balancer.metrics
+        if (balancer := hass.data.get(DATA_BALANCER))
+        else None,
+        "pv_surplus": surplus.metrics
+        if (surplus := hass.data.get(DATA_SURPLUS, {}).get(entry.entry_id))
+        else None,
+        "demand_response": demand.metrics
+        if (demand := hass.data.get(DATA_DEMAND, {}).get(entry.entry_id))
+        else None,
+        "external_statistics": compiler.metrics
+        if (compiler := hass.data.get(DATA_STATISTICS, {}).get(entry.entry_id))
+        else None,
+        "sample_history": recorder.history.metrics
+        if (recorder := hass.data.get(DATA_SAMPLE_HISTORY, {}).get(entry.entry_id))
+        else None,
+        "load_time_ms": dict(LOAD_TIMES_MS),
+    }
@@ -0,0 +1,176 @@
+"""Bounded executor for the blocking eCB1 calls of the Wallbox integration."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import threading
+import time
+from typing import Any, TypeVar
+from urllib.parse import urlparse
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN, EXECUTOR_MAX_WORKERS, EXECUTOR_TIMEOUT
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+DATA_EXECUTORS = f"{DOMAIN}_executors"
+
+
+def host_key(url: str) -> str:
+    """Return the host part of an eCB1 base url."""
+    return urlparse(url).netloc or url
+
+
+class WallboxExecutor:
+    """Thread pool dedicated to the blocking calls against one eCB1 host.
+
+    A hanging charger can only exhaust the slots of its own pool instead of
+    the shared Home Assistant executor.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        max_workers: int = EXECUTOR_MAX_WORKERS,
+        timeout: float = EXECUTOR_TIMEOUT,
+    ) -> None:
+        """Initialize."""
+        self.host = host
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=f"{DOMAIN}-{host}"
+        )
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._active = 0
+        self._peak_queued = 0
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._timed_out = 0
+        self._busy_seconds = 0.0
+
+    def _run(
+        self, func: Callable[..., _T], args: tuple[Any, ...], started: asyncio.Future[None]
+    ) -> _T:
+        """Run func in a worker thread and account for it."""
+        started.get_loop().call_soon_threadsafe(_set_started, started)
+        with self._lock:
+            self._queued -= 1
+            self._active += 1
+        start = time.monotonic()
+        try:
+            result = func(*args)
+        except Exception:
+            with self._lock:
+                self._failed += 1
+            raise
+        finally:
+            with self._lock:
+                self._active -= 1
+                self._completed += 1
+                self._busy_seconds += time.monotonic() - start
+        return result
+
+    async def async_run(
+        self,
+        func: Callable[..., _T],
+        *args: Any,
+        timeout: float | None = None,
+        deadline: float | None = None,
+    ) -> _T:
+        """Run func in the pool, raise TimeoutError if it does not finish in time.
+
+        The timeout starts once a worker picks the call up, so waiting behind
+        other calls to the host does not count against it. The wait in the
+        queue is bounded by the monotonic deadline if given, else by the
+        timeout, and the deadline also caps the timeout.
+        """
+        timeout = timeout or self.timeout
+        started: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        with self._lock:
+            self._submitted += 1
+            self._queued += 1
+            self._peak_queued = max(self._peak_queued, self._queued)
+        future = self._pool.submit(self._run, func, args, started)
+        result = asyncio.wrap_future(future)
+        try:
+            done, _ = await asyncio.wait(
+                (started, result),
+                timeout=timeout if deadline is None else deadline - time.monotonic(),
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            if not done:
+                raise TimeoutError
+            if deadline is not None:
+                timeout = min(timeout, deadline - time.monotonic())
+            return await asyncio.wait_for(result, timeout)
+        except TimeoutError:
+            with self._lock:
+                self._timed_out += 1
+                if future.cancel():
+                    # Never started, so _run will not decrement the queue.
+                    self._queued -= 1
+            _LOGGER.debug("Call %s on %s timed out", func.__name__, self.host)
+            raise
+        except asyncio.CancelledError:
+            with self._lock:
+                if future.cancel():
+                    self._queued -= 1
+            raise
+
+    @property
+    def metrics(self) -> dict[str, Any]:
+        """Return the saturation metrics of the pool."""
+        with self._lock:
+            return {
+                "host": self.host,
+                "max_workers": self.max_workers,
+                "active": self._active,
+                "queued": self._queued,
+                "peak_queued": self._peak_queued,
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "failed": self._failed,
+                "timed_out": self._timed_out,
+                "busy_seconds": round(self._busy_seconds, 3),
+            }
+
+    def shutdown(self) -> None:
+        """Stop the pool without waiting for hanging calls."""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _set_started(started: asyncio.Future[None]) -> None:
+    """Mark that a worker picked up a call."""
+    if not started.done():
+        started.set_result(None)
+
+
+@callback
+def async_get_executor(hass: HomeAssistant, url: str) -> WallboxExecutor:
+    """Return the executor of a host, creating it on first use."""
+    executors: dict[str, list[Any]] = hass.data.setdefault(DATA_EXECUTORS, {})
+    host = host_key(url)
+    if host not in executors:
+        executors[host] = [WallboxExecutor(host), 0]
+    executors[host][1] += 1
+    return executors[host][0]
+
+
+@callback
+def async_release_executor(hass: HomeAssistant, url: str) -> None:
+    """Release a reference to the executor of a host, shut it down when unused."""
+    executors: dict[str, list[Any]] = hass.data.get(DATA_EXECUTORS, {})
+    host = host_key(url)
+    if host not in executors:
+        return
+    executors[host][1] -= 1
+    if executors[host][1] <= 0:
+        executors.pop(host)[0].shutdown()
@@ -0,0 +1,194 @@
+"""Streaming export of charging sessions and samples of the Wallbox integration."""
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+import csv
+from datetime import datetime
+import logging
+import math
+import os
+import tempfile
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    EXPORT_FORMAT_CSV,
+    EXPORT_KIND_SESSIONS,
+    SESSION_END_AFTER,
+    SESSION_MIN_POWER,
+)
+from .obis import OBIS_ACTIVE_ENERGY_PLUS, OBIS_ACTIVE_POWER_PLUS
+
+if TYPE_CHECKING:
+    from .sample_history import SampleHistory
+
+_LOGGER = logging.getLogger(__name__)
+
+SESSION_CODES = [OBIS_ACTIVE_POWER_PLUS, OBIS_ACTIVE_ENERGY_PLUS]
+SESSION_COLUMNS = [
+    "start",
+    "end",
+    "duration_s",
+    "energy_kwh",
+    "max_power_w",
+    "samples",
+]
+
+# Column -> Parquet type, float64 for the others.
+PARQUET_TYPES = {
+    "time": "string",
+    "start": "string",
+    "end": "string",
+    "duration_s": "int64",
+    "samples": "int64",
+}
+
+
+def iter_samples(
+    chunks: Iterable[list[tuple[float, ...]]]
+) -> Iterator[list[tuple[Any, ...]]]:
+    """Yield chunks of samples with ISO timestamps and empty missing values."""
+    for rows in chunks:
+        yield [
+            (
+                dt_util.utc_from_timestamp(timestamp).isoformat(),
+                *(None if math.isnan(value) else value for value in values),
+            )
+            for timestamp, *values in rows
+        ]
+
+
+def iter_sessions(
+    chunks: Iterable[list[tuple[float, ...]]]
+) -> Iterator[list[tuple[Any, ...]]]:
+    """Yield chunks of charging sessions found in samples of power and energy.
+
+    The station keeps no session log, so a session is a run of samples
+    drawing at least SESSION_MIN_POWER, ended once the draw stayed below it
+    for SESSION_END_AFTER. Its energy is the rise of the import counter.
+    """
+    # [start, last active, first energy, last energy, max power, samples]
+    session: list[Any] | None = None
+
+    def _row(session: list[Any]) -> tuple[Any, ...]:
+        start, last, first_energy, last_energy, max_power, samples = session
+        return (
+            dt_util.utc_from_timestamp(start).isoformat(),
+            dt_util.utc_from_timestamp(last).isoformat(),
+            round(last - start),
+            None
+            if first_energy is None or last_energy is None
+            else round(last_energy - first_energy, 3),
+            max_power,
+            samples,
+        )
+
+    for rows in chunks:
+        sessions: list[tuple[Any, ...]] = []
+        for timestamp, power, energy in rows:
+            energy = None if math.isnan(energy) else energy
+            if session is not None and timestamp - session[1] > SESSION_END_AFTER:
+                sessions.append(_row(session))
+                session = None
+            if math.isnan(power) or power < SESSION_MIN_POWER:
+                continue
+            if session is None:
+                session = [timestamp, timestamp, energy, energy, power, 0]
+            session[1] = timestamp
+            if session[2] is None:
+                session[2] = energy
+            if energy is not None:
+                session[3] = energy
+            session[4] = max(session[4], power)
+            session[5] += 1
+        if sessions:
+            yield sessions
+    if session is not None:
+        yield [_row(session)]
+
+
+def write_csv(
+    path: str, columns: list[str], chunks: Iterable[list[tuple[Any, ...]]]
+) -> int:
+    """Write chunks of rows as CSV and return the number of rows."""
+    count = 0
+    with open(path, "w", newline="", encoding="utf-8") as file:
+        writer = csv.writer(file)
+        writer.writerow(columns)
+        for rows in chunks:
+            writer.writerows(rows)
+            count += len(rows)
+    return count
+
+
+def write_parquet(
+    path: str, columns: list[str], chunks: Iterable[list[tuple[Any, ...]]]
+) -> int:
+    """Write chunks of rows as Parquet, one row group per chunk.
+
+    pyarrow is not a requirement of the integration, so it is imported here
+    and only needed for Parquet.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as err:
+        raise HomeAssistantError("Parquet export needs pyarrow installed") from err
+
+    schema = pa.schema(
+        [(column, PARQUET_TYPES.get(column, "float64")) for column in columns]
+    )
+    count = 0
+    with pq.ParquetWriter(path, schema) as writer:
+        for rows in chunks:
+            writer.write_table(
+                pa.Table.from_pylist(
+                    [dict(zip(columns, row)) for row in rows], schema=schema
+                )
+            )
+            count += len(rows)
+    return count
+
+
+def export(
+    history: SampleHistory,
+    path: str,
+    kind: str,
+    file_format: str,
+    codes: list[str],
+    start: datetime,
+    end: datetime,
+) -> int:
+    """Export sessions or samples from start to end and return the number of rows.
+
+    The history is read, converted and written chunk by chunk, so memory does
+    not grow with the range. The file appears under path once it is complete,
+    written to a partial file of its own so concurrent exports do not mix.
+    """
+    if kind == EXPORT_KIND_SESSIONS:
+        columns = SESSION_COLUMNS
+        chunks = iter_sessions(
+            history.iter_rows(SESSION_CODES, start.timestamp(), end.timestamp())
+        )
+    else:
+        columns = ["time", *codes]
+        chunks = iter_samples(
+            history.iter_rows(codes, start.timestamp(), end.timestamp())
+        )
+    write = write_csv if file_format == EXPORT_FORMAT_CSV else write_parquet
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    descriptor, partial = tempfile.mkstemp(
+        suffix=".part", prefix=f"{os.path.basename(path)}.", dir=os.path.dirname(path)
+    )
+    os.close(descriptor)
+    try:
+        count = write(partial, columns, chunks)
+    except BaseException:
+        if os.path.exists(partial):
+            os.remove(partial)
+        raise
+    os.replace(partial, path)
+    _LOGGER.debug("Exported %s %s rows to %s", count, kind, path)
+    return count
@@ -0,0 +1,309 @@
+"""Hourly long-term statistics compiled by the Wallbox integration itself.
+
+Imported only when a station enables them, so the recorder is not loaded
+otherwise.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from datetime import datetime, timedelta
+import logging
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+    get_last_statistics,
+    statistics_during_period,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util, slugify
+
+from .const import (
+    DATA_STATISTICS,
+    DOMAIN,
+    OBIS_GROUP_ENERGY,
+    STATISTICS_BACKFILL_MAX_HOURS,
+    STATISTICS_PROFILE_DAYS,
+)
+from .decode import OBIS_FIELDS, OBIS_GROUP_OF_CODE
+
+if TYPE_CHECKING:
+    from . import WallboxCoordinator
+    from .sensor import WallboxSensorEntityDescription
+
+_LOGGER = logging.getLogger(__name__)
+
+# Statistic ids are slugs, so the domain loses its dash and capitals.
+STATISTICS_SOURCE = slugify(DOMAIN)
+
+
+def statistic_id(serial: str, code: str) -> str:
+    """Return the statistic id of an OBIS code of a station."""
+    return f"{STATISTICS_SOURCE}:{slugify(serial)}_{OBIS_FIELDS[code]}"
+
+
+def hour_start(moment: datetime) -> datetime:
+    """Return the start of the hour of a moment."""
+    return moment.replace(minute=0, second=0, microsecond=0)
+
+
+def spread(
+    state: float, reading: float, weights: list[float], partial: float
+) -> list[float]:
+    """Return the counter at the end of each missing hour.
+
+    The rise from state to reading is split by the weights of the missing
+    hours, while partial, the weight of the current hour so far, keeps its
+    share until that hour is compiled.
+    """
+    total = sum(weights) + partial
+    counters = []
+    cumulative = 0.0
+    for weight in weights:
+        cumulative += weight
+        counters.append(state + (reading - state) * cumulative / total)
+    return counters
+
+
+class StatisticsCompiler:
+    """Compile hourly statistics of the OBIS values of one station.
+
+    Every new meter sample is folded into running aggregates of the current
+    hour: mean, min and max of instantaneous values and the last reading of
+    energy counters, whose sum is the counter itself. Once an hour is over,
+    its rows are imported as external statistics, one bulk import per code,
+    so the recorder does not compile them from state rows.
+
+    The hour compiling started in is partial: its energy counters are
+    imported, as their last reading holds for the whole hour, but its mean,
+    min and max only cover part of it and are dropped.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        coordinator: WallboxCoordinator,
+        descriptions: Mapping[str, WallboxSensorEntityDescription],
+    ) -> None:
+        """Initialize."""
+        self._hass = hass
+        self._title = entry.title
+        self._coordinator = coordinator
+        self._descriptions = descriptions
+        self._metadata: dict[str, StatisticMetaData] = {}
+        self._hour: datetime | None = None
+        self._started: datetime | None = None
+        self._meter: Any = None
+        # OBIS code -> [sum, count, min, max, last] of the current hour.
+        self._aggregates: dict[str, list[float]] = {}
+        self._unsubscribe: Callable[[], None] | None = None
+        self.imported_rows = 0
+        self.backfilled_rows = 0
+
+    @callback
+    def async_start(self) -> None:
+        """Start folding the samples of the coordinator."""
+        self._started = dt_util.utcnow()
+        self._unsubscribe = self._coordinator.async_add_listener(self._async_sample)
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop folding samples, dropping the incomplete hour."""
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+            self._unsubscribe = None
+
+    async def async_backfill(self) -> None:
+        """Spread the energy counted while nothing was compiled over the gap.
+
+        The counters of the meter keep counting while Home Assistant is down,
+        so without a backfill the whole rise would land in the first hour
+        compiled after the restart. The last row of every energy statistic is
+        compared with the current reading, and the rise is split over the
+        missing hours in the shape of the hourly energy of the last
+        STATISTICS_PROFILE_DAYS, flat if there is none.
+        """
+        snapshot = self._coordinator.data
+        now = dt_util.utcnow()
+        hour = hour_start(now)
+        readings = {
+            code: value
+            for code in snapshot.meter.data.keys()
+            if OBIS_GROUP_OF_CODE[code] == OBIS_GROUP_ENERGY
+            and (value := getattr(snapshot.meter.data, OBIS_FIELDS[code])) is not None
+        }
+        if not readings:
+            return
+        statistic_ids = {code: self.metadata(code)["statistic_id"] for code in readings}
+        recorder = get_instance(self._hass)
+        if not await recorder.async_db_ready:
+            return
+        last_rows, changes = await recorder.async_add_executor_job(
+            self._load, statistic_ids, hour
+        )
+
+        for code, reading in readings.items():
+            if not (rows := last_rows.get(statistic_ids[code])):
+                continue
+            last = rows[0]
+            start = dt_util.utc_from_timestamp(last["start"]) + timedelta(hours=1)
+            missing = min(
+                int((hour - start).total_seconds() // 3600), STATISTICS_BACKFILL_MAX_HOURS
+            )
+            state, total = last["state"], last["sum"]
+            # Nothing missing, or the meter was replaced or reset.
+            if missing <= 0 or state is None or total is None or reading < state:
+                continue
+            start = hour - timedelta(hours=missing)
+            hours = [start + timedelta(hours=offset) for offset in range(missing)]
+            profile = changes.get(statistic_ids[code], {})
+            elapsed = (now - hour).total_seconds() / 3600
+            weights = [profile.get(moment.hour, 0.0) for moment in hours]
+            partial = profile.get(hour.hour, 0.0) * elapsed
+            if not any(weights) and not partial:
+                weights, partial = [1.0] * missing, elapsed
+            counters = spread(state, reading, weights, partial)
+            async_add_external_statistics(
+                self._hass,
+                self.metadata(code),
+                [
+                    StatisticData(start=moment, state=counter, sum=total - state + counter)
+                    for moment, counter in zip(hours, counters)
+                ],
+            )
+            self.backfilled_rows += missing
+            _LOGGER.debug(
+                "Backfilled %s hours of %s for %s", missing, code, self._title
+            )
+
+    def _load(
+        self, statistic_ids: dict[str, str], hour: datetime
+    ) -> tuple[dict[str, list[Any]], dict[str, dict[int, float]]]:
+        """Return the last rows and the mean energy per hour of day of statistics."""
+        last_rows: dict[str, list[Any]] = {}
+        for statistic in statistic_ids.values():
+            last_rows |= get_last_statistics(
+                self._hass, 1, statistic, False, {"state", "sum"}
+            )
+        rows = statistics_during_period(
+            self._hass,
+            hour - timedelta(days=STATISTICS_PROFILE_DAYS),
+            hour,
+            set(statistic_ids.values()),
+            "hour",
+            None,
+            {"change"},
+        )
+        changes: dict[str, dict[int, float]] = {}
+        for statistic, series in rows.items():
+            by_hour: dict[int, list[float]] = {}
+            for row in series:
+                if (change := row.get("change")) is not None:
+                    by_hour.setdefault(
+                        dt_util.utc_from_timestamp(row["start"]).hour, []
+                    ).append(max(change, 0.0))
+            changes[statistic] = {
+                of_day: sum(values) / len(values) for of_day, values in by_hour.items()
+            }
+        return last_rows, changes
+
+    def metadata(self, code: str) -> StatisticMetaData:
+        """Return the statistic metadata of an OBIS code, built once."""
+        if (metadata := self._metadata.get(code)) is None:
+            description = self._descriptions.get(code)
+            energy = OBIS_GROUP_OF_CODE[code] == OBIS_GROUP_ENERGY
+            metadata = self._metadata[code] = StatisticMetaData(
+                has_mean=not energy,
+                has_sum=energy,
+                name=f"{self._title} {str(description.name).strip() if description else code}",
+                source=STATISTICS_SOURCE,
+                statistic_id=statistic_id(self._coordinator.data.serial, code),
+                unit_of_measurement=description and description.native_unit_of_measurement,
+            )
+        return metadata
+
+    @callback
+    def _async_sample(self) -> None:
+        """Fold a new meter sample into the aggregates of its hour."""
+        snapshot = self._coordinator.data
+        # Snapshots that did not change the meter carry no new sample.
+        if snapshot is None or snapshot.meter is self._meter:
+            return
+        self._meter = snapshot.meter
+        hour = hour_start(dt_util.utcnow())
+        if self._hour is not None and hour > self._hour:
+            self._async_import(self._hour)
+        self._hour = hour
+
+        data = snapshot.meter.data
+        aggregates = self._aggregates
+        for code in data.keys():
+            if (value := getattr(data, OBIS_FIELDS[code])) is None:
+                continue
+            if (aggregate := aggregates.get(code)) is None:
+                aggregates[code] = [value, 1, value, value, value]
+                continue
+            aggregate[0] += value
+            aggregate[1] += 1
+            if value < aggregate[2]:
+                aggregate[2] = value
+            if value > aggregate[3]:
+                aggregate[3] = value
+            aggregate[4] = value
+
+    @callback
+    def _async_import(self, hour: datetime) -> None:
+        """Import the statistics of a finished hour."""
+        partial = self._started is not None and self._started > hour
+        imported = 0
+        for code, (total, count, low, high, last) in self._aggregates.items():
+            if OBIS_GROUP_OF_CODE[code] == OBIS_GROUP_ENERGY:
+                row = StatisticData(start=hour, state=last, sum=last)
+            elif partial:
+                continue
+            else:
+                row = StatisticData(start=hour, mean=total / count, min=low, max=high)
+            async_add_external_statistics(self._hass, self.metadata(code), [row])
+            imported += 1
+        self.imported_rows += imported
+        _LOGGER.debug(
+            "Imported %s statistics of %s for %s%s",
+            imported,
+            self._title,
+            hour,
+            " (partial hour)" if partial else "",
+        )
+        self._aggregates = {}
+
+    @property
+    def metrics(self) -> dict[str, Any]:
+        """Return the number of imported and backfilled rows."""
+        return {
+            "hour": self._hour.isoformat() if self._hour else None,
+            "codes": len(self._aggregates),
+            "imported_rows": self.imported_rows,
+            "backfilled_rows": self.backfilled_rows,
+        }
+
+
+async def async_start_statistics(
+    hass: HomeAssistant, entry: ConfigEntry, coordinator: WallboxCoordinator
+) -> None:
+    """Start the statistics compiler of an entry."""
+    from .sensor import get_sensor_types
+
+    if "recorder" not in hass.config.components:
+        _LOGGER.warning("Statistics of %s need the recorder, which is not loaded", entry.title)
+        return
+    descriptions = await hass.async_add_import_executor_job(get_sensor_types)
+    compiler = hass.data.setdefault(DATA_STATISTICS, {})[entry.entry_id] = (
+        StatisticsCompiler(hass, entry, coordinator, descriptions)
+    )
+    compiler.async_start()
+    entry.async_create_background_task(
+        hass, compiler.async_backfill(), f"{DOMAIN} statistics backfill {entry.title}"
+    )
@@ -0,0 +1,14 @@
+"""Load time measurement of the integration.
+
+The integration imports this module before its other modules, so the time
+spent loading them is measured from here.
+"""
+from __future__ import annotations
+
+import time
+
+# Set when the integration starts importing its own modules.
+IMPORT_STARTED = time.perf_counter()
+
+# Milliseconds spent loading the integration and its lazily loaded parts.
+LOAD_TIMES_MS: dict[str, float] = {}
@@ -6,10 +6,15 @@ import logging
 
 from homeassistant.components.lock import LockEntity, LockEntityDescription
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from . import InvalidAuth, WallboxCoordinator, WallboxEntity
+from . import (
+    InvalidAuth,
+    WallboxCoordinator,
+    WallboxEntity,
+    async_setup_entity_discovery,
+)
 from .const import (
     CONF_DATA_KEY,
     CONF_LOCKED_UNLOCKED_KEY,
@@ -35,22 +40,20 @@ async def async_setup_entry(
     # Check if the user is authorized to lock, if so, add lock component
     try:
         await coordinator.async_set_lock_unlock(
-            (coordinator.data[CONF_LOCKED_UNLOCKED_KEY] == "4")
-            or
-            (coordinator.data[CONF_LOCKED_UNLOCKED_KEY] == "5")
+            coordinator.data.chargecontrol.stateid in (4, 5)
         )
     except InvalidAuth:
         return
-    except KeyError:
-        #no log in data set!
-        return
+    except AttributeError:
+        # No status yet, the lock is added once the station reports one.
+        pass
 
-    async_add_entities(
-        [
-            WallboxLock(coordinator, entry, description)
-            for ent in coordinator.data
-            if (description := LOCK_TYPES.get(ent))
-        ]
+    async_setup_entity_discovery(
+        coordinator,
+        entry,
+        LOCK_TYPES,
+        lambda description: WallboxLock(coordinator, entry, description),
+        async_add_entities,
     )
 
 
@@ -65,22 +68,14 @@ class WallboxLock(WallboxEntity, LockEntity):
     ) -> None:
         """Initialize a Wallbox lock."""
 
-        super().__init__(coordinator)
-        self.entity_description = description
-        self._attr_name = f"{entry.title} {description.name}"
-        self._attr_unique_id = f"{description.key}-{coordinator.data[CONF_DATA_KEY][CONF_SERIAL_NUMBER_KEY]}"
-
+        super().__init__(coordinator, entry, description)
+        self._attr_is_locked = coordinator.data.chargecontrol.stateid == 17
 
-    @property
-    def is_locked(self) -> bool:
-        """Return the status of the lock."""
-        #_LOGGER.log(20, self.coordinator.data[CONF_LOCKED_UNLOCKED_KEY])
-        if (self.coordinator.data[CONF_LOCKED_UNLOCKED_KEY] == 17) :
-            return True # self.coordinator.data[CONF_LOCKED_UNLOCKED_KEY]  # type: ignore[no-any-return]
-        elif (self.coordinator.data[CONF_LOCKED_UNLOCKED_KEY] == "17"):
-            return True
-        else:
-            return False
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._attr_is_locked = self.coordinator.data.chargecontrol.stateid == 17
+        self.async_write_ha_state()
 
     async def async_lock(self, **kwargs: Any) -> None:
         """Lock charger."""
@@ -0,0 +1,239 @@
+"""OpenMetrics endpoint for the Wallbox integration.
+
+Serves the latest snapshot of every station that enabled it, plus the poll
+metrics of the integration, in one scrape that does not touch the state
+machine.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any
+
+from aiohttp import web
+
+from homeassistant.components.http import KEY_HASS, HomeAssistantView
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+
+from . import WallboxCoordinator
+from .const import BREAKER_OPEN, CONF_METRICS, DATA_BALANCER, DOMAIN, SOURCES
+from .decode import CHARGE_CONTROL_FIELDS, OBIS_FIELDS
+from .snapshot import WallboxSnapshot
+
+if TYPE_CHECKING:
+    from .balancer import SiteLoadBalancer
+
+DATA_METRICS_VIEW = f"{DOMAIN}_metrics_view"
+METRICS_URL = f"/api/{DOMAIN}/metrics"
+CONTENT_TYPE_OPENMETRICS = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+_NUMERIC_CHARGE_CONTROL_FIELDS = tuple(
+    name for name in CHARGE_CONTROL_FIELDS if name not in ("id", "type", "mode")
+)
+
+# Metric family -> value getter, in output order. Built once at import.
+_SNAPSHOT_FAMILIES: tuple[tuple[str, Callable[[WallboxSnapshot], Any]], ...] = (
+    ("ecb1_snapshot_version", lambda snapshot: snapshot.version),
+    ("ecb1_ai_mode", lambda snapshot: snapshot.ai_mode),
+    *(
+        (
+            f"ecb1_{name}",
+            lambda snapshot, name=name: snapshot.chargecontrol
+            and getattr(snapshot.chargecontrol, name),
+        )
+        for name in _NUMERIC_CHARGE_CONTROL_FIELDS
+    ),
+    *(
+        (f"ecb1_meter_{attr}", lambda snapshot, attr=attr: getattr(snapshot.meter.data, attr))
+        for attr in OBIS_FIELDS.values()
+    ),
+)
+
+
+_EXECUTOR_FAMILIES = (
+    ("active", "gauge"),
+    ("queued", "gauge"),
+    ("submitted", "counter"),
+    ("completed", "counter"),
+    ("failed", "counter"),
+    ("timed_out", "counter"),
+    ("busy_seconds", "counter"),
+)
+
+
+def _escape(value: Any) -> str:
+    """Escape a label value."""
+    return str(value).replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+
+
+def _format(value: Any) -> str | None:
+    """Format a sample value, None if there is no value."""
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    return repr(float(value))
+
+
+def _family(
+    lines: list[str], name: str, kind: str, samples: Iterable[tuple[str, str, Any]]
+) -> None:
+    """Append a metric family with its (suffix, labels, value) samples."""
+    rendered = [
+        f"{name}{suffix}{{{labels}}} {value}" if labels else f"{name}{suffix} {value}"
+        for suffix, labels, raw in samples
+        if (value := _format(raw)) is not None
+    ]
+    if rendered:
+        lines.append(f"# TYPE {name} {kind}")
+        lines.extend(rendered)
+
+
+def render_metrics(
+    stations: list[tuple[str, WallboxCoordinator]],
+    balancer: SiteLoadBalancer | None = None,
+) -> str:
+    """Render the OpenMetrics exposition of (label set, coordinator) pairs."""
+    lines: list[str] = []
+    _family(
+        lines,
+        "ecb1_station",
+        "info",
+        (
+            ("_info", f'{labels},model="{_escape(coordinator.data.model)}"', 1)
+            for labels, coordinator in stations
+        ),
+    )
+    for name, getter in _SNAPSHOT_FAMILIES:
+        _family(
+            lines,
+            name,
+            "gauge",
+            (("", labels, getter(coordinator.data)) for labels, coordinator in stations),
+        )
+    _family(
+        lines,
+        "ecb1_poll_interval_seconds",
+        "gauge",
+        (("", labels, coordinator.poll_interval) for labels, coordinator in stations),
+    )
+    _family(
+        lines,
+        "ecb1_source_age_seconds",
+        "gauge",
+        (
+            ("", f'{labels},source="{source}"', coordinator.source_age(source))
+            for labels, coordinator in stations
+            for source in SOURCES
+        ),
+    )
+
+    # Breakers, executors and Modbus clients are shared by the stations of a host.
+    breakers = {
+        breaker.host: breaker
+        for _, coordinator in stations
+        if (breaker := coordinator.breaker) is not None
+    }
+    _family(
+        lines,
+        "ecb1_circuit_breaker_open",
+        "gauge",
+        (
+            ("", f'host="{_escape(host)}"', breaker.state == BREAKER_OPEN)
+            for host, breaker in breakers.items()
+        ),
+    )
+    executors = {
+        executor.host: executor.metrics
+        for _, coordinator in stations
+        if (executor := coordinator.executor) is not None
+    }
+    for key, kind in _EXECUTOR_FAMILIES:
+        _family(
+            lines,
+            f"ecb1_executor_{key}",
+            kind,
+            (
+                ("_total" if kind == "counter" else "", f'host="{_escape(host)}"', metrics[key])
+                for host, metrics in executors.items()
+            ),
+        )
+    clients = {
+        transport.client.host: transport.client
+        for _, coordinator in stations
+        if (transport := coordinator.transport) is not None
+    }
+    _family(
+        lines,
+        "ecb1_modbus_requests",
+        "counter",
+        (
+            ("_total", f'host="{_escape(host)}"', client.requests)
+            for host, client in clients.items()
+        ),
+    )
+    if balancer is not None and (balanced := balancer.metrics)["limit"] is not None:
+        _family(lines, "ecb1_site_current_limit_amperes", "gauge", (("", "", balanced["limit"]),))
+        for key in ("cycles", "writes", "deferred", "failed"):
+            _family(lines, f"ecb1_balancer_{key}", "counter", (("_total", "", balanced[key]),))
+        _family(
+            lines,
+            "ecb1_balancer_latency_seconds",
+            "gauge",
+            (
+                ("", f'stat="{stat}"', None if value is None else value / 1000)
+                for stat, value in balanced["latency_ms"].items()
+            ),
+        )
+    lines.append("# EOF\n")
+    return "\n".join(lines)
+
+
+class WallboxMetricsView(HomeAssistantView):
+    """Serve the snapshots of the stations in OpenMetrics text format."""
+
+    url = METRICS_URL
+    name = f"api:{DOMAIN}:metrics"
+    requires_auth = True
+
+    def __init__(self) -> None:
+        """Initialize the view and its label sets."""
+        # Entry id -> (serial, label set), rebuilt only if the serial changes.
+        self._labels: dict[str, tuple[str, str]] = {}
+
+    def _label_set(self, entry: ConfigEntry, coordinator: WallboxCoordinator) -> str:
+        """Return the label set of a station."""
+        serial = coordinator.data.serial
+        if (cached := self._labels.get(entry.entry_id)) is None or cached[0] != serial:
+            cached = (serial, f'station="{_escape(entry.title)}",serial="{_escape(serial)}"')
+            self._labels[entry.entry_id] = cached
+        return cached[1]
+
+    async def get(self, request: web.Request) -> web.Response:
+        """Render the metrics of every station with the metrics option enabled."""
+        hass: HomeAssistant = request.app[KEY_HASS]
+        balancer: SiteLoadBalancer | None = hass.data.get(DATA_BALANCER)
+        coordinators: dict[str, WallboxCoordinator] = hass.data.get(DOMAIN, {})
+        stations = [
+            (self._label_set(entry, coordinator), coordinator)
+            for entry in hass.config_entries.async_entries(DOMAIN)
+            if entry.options.get(CONF_METRICS)
+            and (coordinator := coordinators.get(entry.entry_id)) is not None
+            and coordinator.data is not None
+        ]
+        if not stations:
+            return web.Response(status=HTTPStatus.NOT_FOUND)
+        return web.Response(
+            body=render_metrics(stations, balancer).encode(),
+            headers={"Content-Type": CONTENT_TYPE_OPENMETRICS},
+        )
+
+
+@callback
+def async_register_metrics_view(hass: HomeAssistant) -> None:
+    """Register the metrics view once."""
+    if hass.data.get(DATA_METRICS_VIEW):
+        return
+    hass.http.register_view(WallboxMetricsView())
+    hass.data[DATA_METRICS_VIEW] = True
@@ -0,0 +1,389 @@
+"""Modbus TCP transport for the Wallbox integration.
+
+EXPERIMENTAL: Hardy Barth publishes no Modbus register map for the eCB1, so
+the map below is an assumption, not taken from vendor documentation. The
+transport reads whatever the station serves at these addresses; check the
+values against the REST transport before relying on them.
+
+Reads the charge control status and the meter values of a station as input
+registers (function 0x04), with the station id as unit id. The assumed
+register map is:
+
+- MODBUS_STATUS_ADDRESS + 0: stateid (uint16)
+- MODBUS_STATUS_ADDRESS + 1: connected (uint16, 0 or 1)
+- MODBUS_STATUS_ADDRESS + 2: mode (uint16, key of the charging modes)
+- MODBUS_STATUS_ADDRESS + 3, 5, 7: manualmodeamp, supplylinemaxamp,
+  currentpwmamp (float32)
+- 100 to 325: one float32 per OBIS code at the address of METER_REGISTERS,
+  NaN if not measured. Totals come first, then L1, L2 and L3; within each,
+  the quantities follow the order of their OBIS C field, each with its
+  value, min and max (and energy counter, if any).
+
+Registers are fetched in as few contiguous block reads as possible.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable, Mapping
+from functools import lru_cache
+import logging
+import math
+import struct
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import (
+    DOMAIN,
+    MODBUS_MAX_GAP,
+    MODBUS_MAX_REGISTERS,
+    MODBUS_STATUS_ADDRESS,
+    REQUEST_TIMEOUT,
+)
+from .decode import (
+    OBIS_FIELDS,
+    ChargeControl,
+    MeterInfo,
+    charge_control_from_values,
+    meter_info_from_values,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_MODBUS_CLIENTS = f"{DOMAIN}_modbus_clients"
+
+_READ_INPUT_REGISTERS = 0x04
+_UINT16 = "uint16"
+_FLOAT32 = "float32"
+
+# Charge control field -> (offset from MODBUS_STATUS_ADDRESS, type).
+STATUS_REGISTERS: dict[str, tuple[int, str]] = {
+    "stateid": (0, _UINT16),
+    "connected": (1, _UINT16),
+    "mode": (2, _UINT16),
+    "manualmodeamp": (3, _FLOAT32),
+    "supplylinemaxamp": (5, _FLOAT32),
+    "currentpwmamp": (7, _FLOAT32),
+}
+
+# OBIS code -> address of its float32. Fixed addresses, so the map does not
+# move when codes are added to obis.py; a new code gets a new address.
+METER_REGISTERS: dict[str, int] = {
+    "1-0:1.4.0": 100,  # active_power_plus
+    "1-0:1.3.0": 102,  # active_power_plus_min
+    "1-0:1.6.0": 104,  # active_power_plus_max
+    "1-0:1.8.0": 106,  # active_energy_plus
+    "1-0:2.4.0": 108,  # active_power_minus
+    "1-0:2.3.0": 110,  # active_power_minus_min
+    "1-0:2.6.0": 112,  # active_power_minus_max
+    "1-0:2.8.0": 114,  # active_energy_minus
+    "1-0:3.4.0": 116,  # reactive_power_plus
+    "1-0:3.3.0": 118,  # reactive_power_plus_min
+    "1-0:3.6.0": 120,  # reactive_power_plus_max
+    "1-0:4.4.0": 122,  # reactive_power_minus
+    "1-0:4.3.0": 124,  # reactive_power_minus_min
+    "1-0:4.6.0": 126,  # reactive_power_minus_max
+    "1-0:9.4.0": 128,  # apparent_power_plus
+    "1-0:9.3.0": 130,  # apparent_power_plus_min
+    "1-0:9.6.0": 132,  # apparent_power_plus_max
+    "1-0:10.4.0": 134,  # apparent_power_minus
+    "1-0:10.3.0": 136,  # apparent_power_minus_min
+    "1-0:10.6.0": 138,  # apparent_power_minus_max
+    "1-0:13.4.0": 140,  # power_factor
+    "1-0:13.3.0": 142,  # power_factor_min
+    "1-0:13.6.0": 144,  # power_factor_max
+    "1-0:14.4.0": 146,  # supply_frequency
+    "1-0:14.3.0": 148,  # supply_frequency_min
+    "1-0:14.6.0": 150,  # supply_frequency_max
+    "1-0:21.4.0": 152,  # active_power_plus_l1
+    "1-0:21.3.0": 154,  # active_power_plus_l1_min
+    "1-0:21.6.0": 156,  # active_power_plus_l1_max
+    "1-0:21.8.0": 158,  # active_energy_plus_l1
+    "1-0:22.4.0": 160,  # active_power_minus_l1
+    "1-0:22.3.0": 162,  # active_power_minus_l1_min
+    "1-0:22.6.0": 164,  # active_power_minus_l1_max
+    "1-0:22.8.0": 166,  # active_energy_minus_l1
+    "1-0:23.4.0": 168,  # reactive_power_plus_l1
+    "1-0:23.3.0": 170,  # reactive_power_plus_l1_min
+    "1-0:23.6.0": 172,  # reactive_power_plus_l1_max
+    "1-0:24.4.0": 174,  # reactive_power_minus_l1
+    "1-0:24.3.0": 176,  # reactive_power_minus_l1_min
+    "1-0:24.6.0": 178,  # reactive_power_minus_l1_max
+    "1-0:29.4.0": 180,  # apparent_power_plus_l1
+    "1-0:29.3.0": 182,  # apparent_power_plus_l1_min
+    "1-0:29.6.0": 184,  # apparent_power_plus_l1_max
+    "1-0:30.4.0": 186,  # apparent_power_minus_l1
+    "1-0:30.3.0": 188,  # apparent_power_minus_l1_min
+    "1-0:30.6.0": 190,  # apparent_power_minus_l1_max
+    "1-0:31.4.0": 192,  # current_l1
+    "1-0:31.3.0": 194,  # current_l1_min
+    "1-0:31.6.0": 196,  # current_l1_max
+    "1-0:32.4.0": 198,  # voltage_l1
+    "1-0:32.3.0": 200,  # voltage_l1_min
+    "1-0:32.6.0": 202,  # voltage_l1_max
+    "1-0:33.4.0": 204,  # power_factor_l1
+    "1-0:33.3.0": 206,  # power_factor_l1_min
+    "1-0:33.6.0": 208,  # power_factor_l1_max
+    "1-0:41.4.0": 210,  # active_power_plus_l2
+    "1-0:41.3.0": 212,  # active_power_plus_l2_min
+    "1-0:41.6.0": 214,  # active_power_plus_l2_max
+    "1-0:41.8.0": 216,  # active_energy_plus_l2
+    "1-0:42.4.0": 218,  # active_power_minus_l2
+    "1-0:42.3.0": 220,  # active_power_minus_l2_min
+    "1-0:42.6.0": 222,  # active_power_minus_l2_max
+    "1-0:42.8.0": 224,  # active_energy_minus_l2
+    "1-0:43.4.0": 226,  # reactive_power_plus_l2
+    "1-0:43.3.0": 228,  # reactive_power_plus_l2_min
+    "1-0:43.6.0": 230,  # reactive_power_plus_l2_max
+    "1-0:44.4.0": 232,  # reactive_power_minus_l2
+    "1-0:44.3.0": 234,  # reactive_power_minus_l2_min
+    "1-0:44.6.0": 236,  # reactive_power_minus_l2_max
+    "1-0:49.4.0": 238,  # apparent_power_plus_l2
+    "1-0:49.3.0": 240,  # apparent_power_plus_l2_min
+    "1-0:49.6.0": 242,  # apparent_power_plus_l2_max
+    "1-0:50.4.0": 244,  # apparent_power_minus_l2
+    "1-0:50.3.0": 246,  # apparent_power_minus_l2_min
+    "1-0:50.6.0": 248,  # apparent_power_minus_l2_max
+    "1-0:51.4.0": 250,  # current_l2
+    "1-0:51.3.0": 252,  # current_l2_min
+    "1-0:51.6.0": 254,  # current_l2_max
+    "1-0:52.4.0": 256,  # voltage_l2
+    "1-0:52.3.0": 258,  # voltage_l2_min
+    "1-0:52.6.0": 260,  # voltage_l2_max
+    "1-0:53.4.0": 262,  # power_factor_l2
+    "1-0:53.3.0": 264,  # power_factor_l2_min
+    "1-0:53.6.0": 266,  # power_factor_l2_max
+    "1-0:61.4.0": 268,  # active_power_plus_l3
+    "1-0:61.3.0": 270,  # active_power_plus_l3_min
+    "1-0:61.6.0": 272,  # active_power_plus_l3_max
+    "1-0:61.8.0": 274,  # active_energy_plus_l3
+    "1-0:62.4.0": 276,  # active_power_minus_l3
+    "1-0:62.3.0": 278,  # active_power_minus_l3_min
+    "1-0:62.6.0": 280,  # active_power_minus_l3_max
+    "1-0:62.8.0": 282,  # active_energy_minus_l3
+    "1-0:63.4.0": 284,  # reactive_power_plus_l3
+    "1-0:63.3.0": 286,  # reactive_power_plus_l3_min
+    "1-0:63.6.0": 288,  # reactive_power_plus_l3_max
+    "1-0:64.4.0": 290,  # reactive_power_minus_l3
+    "1-0:64.3.0": 292,  # reactive_power_minus_l3_min
+    "1-0:64.6.0": 294,  # reactive_power_minus_l3_max
+    "1-0:69.4.0": 296,  # apparent_power_plus_l3
+    "1-0:69.3.0": 298,  # apparent_power_plus_l3_min
+    "1-0:69.6.0": 300,  # apparent_power_plus_l3_max
+    "1-0:70.4.0": 302,  # apparent_power_minus_l3
+    "1-0:70.3.0": 304,  # apparent_power_minus_l3_min
+    "1-0:70.6.0": 306,  # apparent_power_minus_l3_max
+    "1-0:71.4.0": 308,  # current_l3
+    "1-0:71.3.0": 310,  # current_l3_min
+    "1-0:71.6.0": 312,  # current_l3_max
+    "1-0:72.4.0": 314,  # voltage_l3
+    "1-0:72.3.0": 316,  # voltage_l3_min
+    "1-0:72.6.0": 318,  # voltage_l3_max
+    "1-0:73.4.0": 320,  # power_factor_l3
+    "1-0:73.3.0": 322,  # power_factor_l3_min
+    "1-0:73.6.0": 324,  # power_factor_l3_max
+}
+
+
+class ModbusError(ConnectionError):
+    """Error to indicate the server answered with a Modbus exception."""
+
+
+def plan_blocks(
+    registers: Iterable[tuple[int, int]],
+    max_gap: int = MODBUS_MAX_GAP,
+    max_count: int = MODBUS_MAX_REGISTERS,
+) -> tuple[tuple[int, int], ...]:
+    """Merge (address, count) ranges into as few block reads as possible.
+
+    Ranges separated by at most max_gap unused registers are read together,
+    which is cheaper than another round trip.
+    """
+    blocks: list[tuple[int, int]] = []
+    for address, count in sorted(set(registers)):
+        if blocks:
+            start, length = blocks[-1]
+            if (
+                address - (start + length) <= max_gap
+                and address + count - start <= max_count
+            ):
+                blocks[-1] = (start, max(length, address + count - start))
+                continue
+        blocks.append((address, count))
+    return tuple(blocks)
+
+
+_STATUS_BLOCKS = plan_blocks(
+    (MODBUS_STATUS_ADDRESS + offset, 2 if kind == _FLOAT32 else 1)
+    for offset, kind in STATUS_REGISTERS.values()
+)
+
+
+@lru_cache(maxsize=8)
+def meter_blocks(codes: frozenset[str] | None) -> tuple[tuple[int, int], ...]:
+    """Return the block reads covering the meter registers of codes (None for all)."""
+    return plan_blocks(
+        (address, 2)
+        for code, address in METER_REGISTERS.items()
+        if codes is None or code in codes
+    )
+
+
+def _float32(registers: Mapping[int, int], address: int) -> float | None:
+    """Return the big endian float32 at address, None if absent or NaN."""
+    high = registers.get(address)
+    low = registers.get(address + 1)
+    if high is None or low is None:
+        return None
+    value: float = struct.unpack(">f", struct.pack(">HH", high, low))[0]
+    return None if math.isnan(value) else value
+
+
+class ModbusTcpClient:
+    """Minimal asyncio Modbus TCP client reading input registers.
+
+    Requests share one connection and are serialized; the connection is
+    dropped on any transport error and reopened by the next request.
+    """
+
+    def __init__(self, host: str, port: int, timeout: float = REQUEST_TIMEOUT) -> None:
+        """Initialize."""
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.requests = 0
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._lock = asyncio.Lock()
+        self._transaction = 0
+
+    async def async_read_input_registers(
+        self, unit: int, address: int, count: int
+    ) -> tuple[int, ...]:
+        """Read count input registers starting at address."""
+        async with self._lock:
+            try:
+                return await asyncio.wait_for(
+                    self._async_request(unit, address, count), self.timeout
+                )
+            except ModbusError:
+                raise
+            except (OSError, asyncio.IncompleteReadError, TimeoutError) as err:
+                self.close()
+                raise ConnectionError(
+                    f"Modbus read of {count} registers at {address} from {self.host} failed"
+                ) from err
+            except asyncio.CancelledError:
+                # A response may still be in flight, it must not be read as
+                # the answer to the next request.
+                self.close()
+                raise
+
+    async def _async_request(self, unit: int, address: int, count: int) -> tuple[int, ...]:
+        """Send one read request and return the registers of its response."""
+        if self._writer is None:
+            self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+        assert self._reader is not None
+        self._transaction = (self._transaction + 1) & 0xFFFF
+        pdu = struct.pack(">BHH", _READ_INPUT_REGISTERS, address, count)
+        self._writer.write(struct.pack(">HHHB", self._transaction, 0, len(pdu) + 1, unit) + pdu)
+        await self._writer.drain()
+        self.requests += 1
+
+        transaction, _, length, _ = struct.unpack(">HHHB", await self._reader.readexactly(7))
+        body = await self._reader.readexactly(length - 1)
+        if transaction != self._transaction:
+            raise OSError(f"Unexpected transaction {transaction} from {self.host}")
+        if body[0] & 0x80:
+            raise ModbusError(
+                f"{self.host} answered exception {body[1]} reading {count} registers at {address}"
+            )
+        return struct.unpack(f">{body[1] // 2}H", body[2 : 2 + body[1]])
+
+    @callback
+    def close(self) -> None:
+        """Close the connection."""
+        if self._writer is not None:
+            self._writer.close()
+        self._reader = self._writer = None
+
+
+class ModbusTransport:
+    """Reads the status and meter values of one station over Modbus TCP."""
+
+    def __init__(
+        self, client: ModbusTcpClient, unit: int, charging_modes: Mapping[str, str]
+    ) -> None:
+        """Initialize."""
+        self.client = client
+        self.unit = unit
+        self._charging_modes = charging_modes
+
+    async def _async_read(self, blocks: Iterable[tuple[int, int]]) -> dict[int, int]:
+        """Read register blocks, return the registers by address."""
+        registers: dict[int, int] = {}
+        for address, count in blocks:
+            values = await self.client.async_read_input_registers(self.unit, address, count)
+            registers.update(zip(range(address, address + count), values))
+        return registers
+
+    async def async_get_status(self, precision: Mapping[str, int]) -> ChargeControl:
+        """Read the charge control status."""
+        registers = await self._async_read(_STATUS_BLOCKS)
+        values: dict[str, Any] = {"id": self.unit}
+        for name, (offset, kind) in STATUS_REGISTERS.items():
+            address = MODBUS_STATUS_ADDRESS + offset
+            values[name] = (
+                _float32(registers, address) if kind == _FLOAT32 else registers.get(address)
+            )
+        values["mode"] = self._charging_modes.get(str(values["mode"]))
+        return charge_control_from_values(values, precision)
+
+    async def async_get_meters(
+        self,
+        precision: Mapping[str, int],
+        codes: frozenset[str] | None,
+        deadbands: Mapping[str, float],
+        previous: MeterInfo | None,
+    ) -> MeterInfo:
+        """Read the meter values of codes (None for all)."""
+        registers = await self._async_read(meter_blocks(codes))
+        return meter_info_from_values(
+            previous.name if previous else None,
+            previous.type if previous else None,
+            {
+                code: _float32(registers, address)
+                for code, address in METER_REGISTERS.items()
+                if codes is None or code in codes
+            },
+            precision,
+            codes,
+            deadbands,
+            previous.data if previous else None,
+        )
+
+
+@callback
+def async_get_modbus_client(hass: HomeAssistant, host: str, port: int) -> ModbusTcpClient:
+    """Return the Modbus client of a host, creating it on first use."""
+    clients: dict[tuple[str, int], list[Any]] = hass.data.setdefault(DATA_MODBUS_CLIENTS, {})
+    if (host, port) not in clients:
+        _LOGGER.warning(
+            "The Modbus transport of %s is experimental, its register map is "
+            "assumed and not documented by the vendor",
+            host,
+        )
+        clients[(host, port)] = [ModbusTcpClient(host, port), 0]
+    clients[(host, port)][1] += 1
+    return clients[(host, port)][0]
+
+
+@callback
+def async_release_modbus_client(hass: HomeAssistant, host: str, port: int) -> None:
+    """Release a reference to the Modbus client of a host, close it when unused."""
+    clients: dict[tuple[str, int], list[Any]] = hass.data.get(DATA_MODBUS_CLIENTS, {})
+    if (host, port) not in clients:
+        return
+    clients[(host, port)][1] -= 1
+    if clients[(host, port)][1] <= 0:
+        clients.pop((host, port))[0].close()
@@ -9,6 +9,7 @@ from homeassistant.components.number import (
     NumberDeviceClass,
     NumberEntity,
     NumberEntityDescription,
+    NumberMode,
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
@@ -21,13 +22,18 @@ from homeassistant.helpers.update_coordinator import (
 )
 
 
-from . import InvalidAuth, WallboxCoordinator, WallboxEntity
+from . import (
+    InvalidAuth,
+    WallboxCoordinator,
+    WallboxEntity,
+    async_setup_entity_discovery,
+)
 from .const import *
 import logging
 
 _LOGGER = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(frozen=True)
 class WallboxNumberEntityDescription(NumberEntityDescription):
     """Describes Wallbox sensor entity."""
 
@@ -50,20 +56,20 @@ async def async_setup_entry(
     # Check if the user is authorized to change current, if so, add number component:
     try:
         await coordinator.async_set_charging_current(
-            coordinator.data[CONF_DATA_KEY][CONF_MAN_CHARGING_CURRENT_KEY]
+            coordinator.data.chargecontrol.manualmodeamp
         )
     except InvalidAuth:
         return
-    except KeyError:
-        #no number in data set
-        return
-
-    async_add_entities(
-        [
-            WallboxNumber(coordinator, entry, description)
-            for ent in coordinator.data[CONF_DATA_KEY]
-            if (description := NUMBER_TYPES.get(ent))
-        ]
+    except (AttributeError, TypeError):
+        # No status yet, the number is added once the station reports one.
+        pass
+
+    async_setup_entity_discovery(
+        coordinator,
+        entry,
+        NUMBER_TYPES,
+        lambda description: WallboxNumber(coordinator, entry, description),
+        async_add_entities,
     )
 
 
@@ -71,6 +77,7 @@ class WallboxNumber(WallboxEntity, NumberEntity):
     """Representation of the Wallbox portal."""
 
     entity_description: WallboxNumberEntityDescription
+    _attr_mode = NumberMode.SLIDER
 
     def __init__(
         self,
@@ -79,12 +86,9 @@ class WallboxNumber(WallboxEntity, NumberEntity):
         description: WallboxNumberEntityDescription,
     ) -> None:
         """Initialize a Wallbox sensor."""
-        super().__init__(coordinator)
-        self.entity_description = description
+        super().__init__(coordinator, entry, description)
         #self._coordinator = coordinator
-        self._attr_name = f"{entry.title} {description.name}"
-        self._attr_unique_id = f"{description.key}-{coordinator.data[CONF_DATA_KEY][CONF_SERIAL_NUMBER_KEY]}"
-        self._attr_mode = "slider"
+        self._attr_native_value = self._value(coordinator.data)
 
 
 
@@ -98,7 +102,7 @@ class WallboxNumber(WallboxEntity, NumberEntity):
     def native_max_value(self) -> float:
         """Return the maximum available current."""
         if self.entity_description.key == CONF_MAN_CHARGING_CURRENT_KEY:
-            return cast(float, self.coordinator.data[CONF_DATA_KEY][CONF_MAX_AVAILABLE_POWER_KEY])
+            return cast(float, self.coordinator.data.chargecontrol.supplylinemaxamp)
 
 
     # @property
@@ -108,13 +112,6 @@ class WallboxNumber(WallboxEntity, NumberEntity):
     #         Optional[float], self.coordinator.data[CONF_DATA_KEY][self.entity_description.key]
     #     )
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the state of the sensor."""
-        return cast(
-            Optional[float], self.coordinator.data[CONF_DATA_KEY][self.entity_description.key]
-        )
-
     async def async_set_native_value(self, value: float) -> None:
         """Set the value of the entity."""
         if self.entity_description.key == CONF_MAN_CHARGING_CURRENT_KEY:
@@ -123,5 +120,5 @@ class WallboxNumber(WallboxEntity, NumberEntity):
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        self._attr_native_value = self.coordinator.data[CONF_DATA_KEY][self.entity_description.key]
+        self._attr_native_value = self._value(self.coordinator.data)
         self.async_write_ha_state()
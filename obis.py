@@ -1,5 +1,3 @@
-OBIS_KWH_OUT_KEY = "1-0:1.8.0"
-OBIS_KWH_IN_KEY = "1-0:2.8.0"
 OBIS_ACTIVE_POWER_PLUS = "1-0:1.4.0"
 OBIS_ACTIVE_POWER_PLUS_MIN = "1-0:1.3.0"
 OBIS_ACTIVE_POWER_PLUS_MAX = "1-0:1.6.0"
@@ -0,0 +1,444 @@
+"""Memory-mapped on-disk history of meter samples for the Wallbox integration."""
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+import logging
+import math
+import mmap
+import os
+import struct
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+import zlib
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+
+from .const import (
+    CONF_SAMPLE_HISTORY,
+    DATA_SAMPLE_HISTORY,
+    DOMAIN,
+    SAMPLE_HISTORY_CHUNK,
+    SAMPLE_HISTORY_FLUSH_INTERVAL,
+)
+from .decode import OBIS_FIELDS
+
+if TYPE_CHECKING:
+    from . import WallboxCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+MAGIC = b"ECB1HIST"
+VERSION = 1
+HEADER_SIZE = mmap.PAGESIZE * ((4096 + mmap.PAGESIZE - 1) // mmap.PAGESIZE)
+_HEADER = struct.Struct("<8sHHI")
+
+# Every record holds every OBIS code, so the layout never depends on options.
+CODES: tuple[str, ...] = tuple(OBIS_FIELDS)
+CODE_INDEX: dict[str, int] = {code: index for index, code in enumerate(CODES)}
+
+# Timestamp, one float32 per code (NaN if missing) and a CRC32 of both,
+# padded to 8 bytes so timestamps and values can be read as strided views.
+_BODY = struct.Struct(f"<d{len(CODES)}f")
+RECORD_SIZE = (_BODY.size + 4 + 7) // 8 * 8
+_RECORD = struct.Struct(f"<d{len(CODES)}fI{RECORD_SIZE - _BODY.size - 4}x")
+
+
+def _header() -> bytes:
+    """Return the header of a history file."""
+    codes = ",".join(CODES).encode()
+    return _HEADER.pack(MAGIC, VERSION, len(CODES), RECORD_SIZE) + codes
+
+
+class SampleSegment:
+    """One fixed-size history file, mapped into memory.
+
+    The file is allocated at its full size up front, so a slot with a zero
+    timestamp is free. Records are appended in time order and carry a CRC32,
+    so after a crash the count is recovered by a binary search for the first
+    free slot, dropping a torn last record.
+    """
+
+    def __init__(self, path: str, capacity: int, writable: bool) -> None:
+        """Open or create the file at path."""
+        self.path = path
+        size = HEADER_SIZE + capacity * RECORD_SIZE
+        header = _header()
+        fd = os.open(path, os.O_RDWR | os.O_CREAT if writable else os.O_RDONLY)
+        try:
+            if writable and os.fstat(fd).st_size != size:
+                if os.fstat(fd).st_size:
+                    raise ValueError(f"{path} has another size")
+                os.ftruncate(fd, size)
+                os.pwrite(fd, header, 0)
+            self._mmap = mmap.mmap(
+                fd, 0, access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ
+            )
+        finally:
+            os.close(fd)
+        if self._mmap[: len(header)] != header:
+            self._mmap.close()
+            raise ValueError(f"{path} has another layout")
+        self.capacity = (len(self._mmap) - HEADER_SIZE) // RECORD_SIZE
+        self.timestamps = self.view_of(-1)
+        self.count = bisect_left(_FreeSlots(self.timestamps), True, 0, self.capacity)
+        if self.count and not self._valid(self.count - 1):
+            _LOGGER.debug("Dropping a torn record of %s", path)
+            self.count -= 1
+            if writable:
+                self._mmap[self._offset(self.count) : self._offset(self.count + 1)] = bytes(
+                    RECORD_SIZE
+                )
+
+    def _offset(self, index: int) -> int:
+        """Return the file offset of a record."""
+        return HEADER_SIZE + index * RECORD_SIZE
+
+    def _valid(self, index: int) -> bool:
+        """Return True if the checksum of a record matches."""
+        offset = self._offset(index)
+        *_, crc = _RECORD.unpack_from(self._mmap, offset)
+        return zlib.crc32(self._mmap[offset : offset + _BODY.size]) == crc
+
+    def view_of(self, index: int) -> memoryview:
+        """Return a strided view of the timestamps (-1) or of a code over all slots.
+
+        The view reads the mapped pages in place, without copying.
+        """
+        records = memoryview(self._mmap)[HEADER_SIZE : self._offset(self.capacity)]
+        if index < 0:
+            return records.cast("d")[:: RECORD_SIZE // 8]
+        return records.cast("f")[2 + index :: RECORD_SIZE // 4]
+
+    @property
+    def first(self) -> float | None:
+        """Return the time of the first record."""
+        return self.timestamps[0] if self.count else None
+
+    @property
+    def last(self) -> float | None:
+        """Return the time of the last record."""
+        return self.timestamps[self.count - 1] if self.count else None
+
+    @property
+    def full(self) -> bool:
+        """Return True if no slot is free."""
+        return self.count >= self.capacity
+
+    def append(self, timestamp: float, values: list[float]) -> None:
+        """Write a record into the next free slot."""
+        offset = self._offset(self.count)
+        body = _BODY.pack(timestamp, *values)
+        # The timestamp goes last, so a slot never looks used before it is complete.
+        self._mmap[offset + 8 : offset + _BODY.size] = body[8:]
+        struct.pack_into("<I", self._mmap, offset + _BODY.size, zlib.crc32(body))
+        self._mmap[offset : offset + 8] = body[:8]
+        self.count += 1
+
+    def window(self, start: float, end: float) -> tuple[int, int]:
+        """Return the slots of the records from start to before end."""
+        return (
+            bisect_left(self.timestamps, start, 0, self.count),
+            bisect_left(self.timestamps, end, 0, self.count),
+        )
+
+    def flush(self) -> None:
+        """Write the mapped pages to disk."""
+        self._mmap.flush()
+
+    def close(self) -> None:
+        """Unmap the file."""
+        self.timestamps.release()
+        self._mmap.close()
+
+
+class _FreeSlots:
+    """Sequence telling free slots apart from used ones, for a binary search."""
+
+    def __init__(self, timestamps: memoryview) -> None:
+        """Initialize."""
+        self._timestamps = timestamps
+
+    def __getitem__(self, index: int) -> bool:
+        """Return True if the slot is free."""
+        return self._timestamps[index] == 0
+
+    def __len__(self) -> int:
+        """Return the number of slots."""
+        return len(self._timestamps)
+
+
+class SampleHistory:
+    """Meter samples of one station in two rotating history files.
+
+    Samples go into the current file until it is full, which then replaces
+    the previous one. The history thus holds between one and two files worth
+    of samples. All file access runs in the executor, serialized by a lock.
+    """
+
+    def __init__(self, path: str, size_mb: float) -> None:
+        """Initialize."""
+        self.path = path
+        self.size_mb = size_mb
+        self.capacity = max(int(size_mb * 2**20 / 2) // RECORD_SIZE, 1)
+        self._lock = threading.Lock()
+        self._current: SampleSegment | None = None
+        self._flushed = time.monotonic()
+        self.appended = 0
+        self.rotations = 0
+
+    @property
+    def previous_path(self) -> str:
+        """Return the path of the previous file."""
+        return f"{self.path}.1"
+
+    def open(self) -> None:
+        """Open the current file, starting a new one if it does not fit."""
+        with self._lock:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            try:
+                self._current = SampleSegment(self.path, self.capacity, True)
+            except ValueError as err:
+                _LOGGER.info("Starting a new sample history: %s", err)
+                os.replace(self.path, self.previous_path)
+                self._current = SampleSegment(self.path, self.capacity, True)
+
+    def close(self) -> None:
+        """Flush and unmap the current file."""
+        with self._lock:
+            if self._current is not None:
+                self._current.flush()
+                self._current.close()
+                self._current = None
+
+    def append(self, timestamp: float, values: list[float]) -> None:
+        """Append a sample, rotating the files when the current one is full."""
+        with self._lock:
+            if (current := self._current) is None:
+                return
+            if current.last is not None and timestamp <= current.last:
+                return
+            if current.full:
+                current.flush()
+                current.close()
+                os.replace(self.path, self.previous_path)
+                self._current = current = SampleSegment(self.path, self.capacity, True)
+                self.rotations += 1
+            current.append(timestamp, values)
+            self.appended += 1
+            if time.monotonic() - self._flushed >= SAMPLE_HISTORY_FLUSH_INTERVAL:
+                current.flush()
+                self._flushed = time.monotonic()
+
+    @contextmanager
+    def _segments(self) -> Iterator[list[SampleSegment]]:
+        """Hold the lock and yield the previous and the current file, oldest first."""
+        with self._lock:
+            previous: SampleSegment | None = None
+            if os.path.exists(self.previous_path):
+                try:
+                    previous = SampleSegment(self.previous_path, self.capacity, False)
+                except ValueError:
+                    pass
+            try:
+                yield [
+                    segment for segment in (previous, self._current) if segment is not None
+                ]
+            finally:
+                if previous is not None:
+                    previous.close()
+
+    def read(
+        self, codes: list[str], start: float, end: float, limit: int
+    ) -> list[tuple[float, ...]]:
+        """Return up to limit samples from start to before end, NaN if missing."""
+        rows: list[tuple[float, ...]] = []
+        with self._segments() as segments:
+            for segment in segments:
+                low, high = segment.window(start, end)
+                high = min(high, low + limit - len(rows))
+                if low >= high:
+                    continue
+                rows.extend(
+                    zip(
+                        segment.timestamps[low:high].tolist(),
+                        *(
+                            segment.view_of(CODE_INDEX[code])[low:high].tolist()
+                            for code in codes
+                        ),
+                    )
+                )
+        return rows
+
+    def iter_rows(
+        self, codes: list[str], start: float, end: float
+    ) -> Iterator[list[tuple[float, ...]]]:
+        """Yield the samples from start to before end in chunks.
+
+        The lock is released between chunks, so appends go on during a long
+        read and memory stays bounded by the chunk size.
+        """
+        while rows := self.read(codes, start, end, SAMPLE_HISTORY_CHUNK):
+            yield rows
+            start = math.nextafter(rows[-1][0], math.inf)
+
+    def query(
+        self, codes: list[str], start: float, end: float, points: int
+    ) -> dict[str, Any]:
+        """Return the samples from start to end downsampled to at most points buckets.
+
+        Only the pages of the time range are read. Every bucket has the mean,
+        min and max per code, None for a bucket without values.
+        """
+        step = (end - start) / points
+        # Code -> [sum, count, min, max] per bucket.
+        buckets: dict[str, list[list[float]]] = {
+            code: [[0.0, 0, math.inf, -math.inf] for _ in range(points)] for code in codes
+        }
+        with self._segments() as segments:
+            for segment in segments:
+                low, high = segment.window(start, end)
+                if low >= high:
+                    continue
+                timestamps = segment.timestamps[low:high]
+                # Bucket boundaries are found by binary search, not per sample.
+                edges = [
+                    bisect_left(timestamps, start + step * bucket)
+                    for bucket in range(points + 1)
+                ]
+                for code in codes:
+                    series = segment.view_of(CODE_INDEX[code])[low:high]
+                    for bucket, aggregate in enumerate(buckets[code]):
+                        if edges[bucket] == edges[bucket + 1]:
+                            continue
+                        values = [
+                            value
+                            for value in series[edges[bucket] : edges[bucket + 1]]
+                            if not math.isnan(value)
+                        ]
+                        if values:
+                            aggregate[0] += sum(values)
+                            aggregate[1] += len(values)
+                            aggregate[2] = min(aggregate[2], *values)
+                            aggregate[3] = max(aggregate[3], *values)
+                    series.release()
+                timestamps.release()
+
+        return {
+            "start": [start + step * bucket for bucket in range(points)],
+            "series": {
+                code: {
+                    "mean": [
+                        round(total / count, 3) if count else None
+                        for total, count, _, _ in aggregates
+                    ],
+                    "min": [
+                        round(low, 3) if count else None
+                        for _, count, low, _ in aggregates
+                    ],
+                    "max": [
+                        round(high, 3) if count else None
+                        for _, count, _, high in aggregates
+                    ],
+                }
+                for code, aggregates in buckets.items()
+            },
+        }
+
+    @property
+    def metrics(self) -> dict[str, Any]:
+        """Return the number of samples, rotations and the time span held."""
+        current = self._current
+        return {
+            "path": self.path,
+            "capacity": self.capacity,
+            "count": current.count if current else None,
+            "first": current.first if current else None,
+            "last": current.last if current else None,
+            "appended": self.appended,
+            "rotations": self.rotations,
+        }
+
+
+class SampleRecorder:
+    """Append every new meter sample of a coordinator to its history."""
+
+    def __init__(
+        self, hass: HomeAssistant, coordinator: WallboxCoordinator, history: SampleHistory
+    ) -> None:
+        """Initialize."""
+        self._hass = hass
+        self._coordinator = coordinator
+        self.history = history
+        self._meter: Any = None
+        self._unsubscribe: Callable[[], None] | None = None
+
+    @callback
+    def async_start(self) -> None:
+        """Start appending samples."""
+        self._unsubscribe = self._coordinator.async_add_listener(self._async_sample)
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop appending samples."""
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+            self._unsubscribe = None
+
+    @callback
+    def _async_sample(self) -> None:
+        """Append a new meter sample."""
+        snapshot = self._coordinator.data
+        if snapshot is None or snapshot.meter is self._meter:
+            return
+        self._meter = snapshot.meter
+        data = snapshot.meter.data
+        values = [
+            math.nan if (value := getattr(data, attr)) is None else value
+            for attr in OBIS_FIELDS.values()
+        ]
+        self._hass.async_add_executor_job(self.history.append, time.time(), values)
+
+
+async def async_apply_sample_history(
+    hass: HomeAssistant, entry: ConfigEntry, coordinator: WallboxCoordinator
+) -> None:
+    """Start, restart or stop the sample history of an entry per its options."""
+    recorders: dict[str, SampleRecorder] = hass.data.setdefault(DATA_SAMPLE_HISTORY, {})
+    size_mb = entry.options.get(CONF_SAMPLE_HISTORY, 0)
+    if (recorder := recorders.get(entry.entry_id)) is not None:
+        if recorder.history.size_mb == size_mb:
+            return
+        recorders.pop(entry.entry_id).async_stop()
+        await hass.async_add_executor_job(recorder.history.close)
+    if not size_mb:
+        return
+    history = SampleHistory(
+        hass.config.path(DOMAIN, f"{entry.entry_id}.samples"), size_mb
+    )
+    await hass.async_add_executor_job(history.open)
+    recorder = recorders[entry.entry_id] = SampleRecorder(hass, coordinator, history)
+    recorder.async_start()
+
+
+@callback
+def async_stop_sample_history(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Stop the sample history of an entry, closing its file in the executor."""
+    if (
+        recorder := hass.data.get(DATA_SAMPLE_HISTORY, {}).pop(entry.entry_id, None)
+    ) is not None:
+        recorder.async_stop()
+        hass.async_add_executor_job(recorder.history.close)
+
+
+@callback
+def async_get_sample_history(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> SampleHistory | None:
+    """Return the sample history of an entry, None if it is disabled."""
+    if (recorder := hass.data.get(DATA_SAMPLE_HISTORY, {}).get(entry.entry_id)) is None:
+        return None
+    return recorder.history
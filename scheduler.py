@@ -0,0 +1,144 @@
+"""Phase-spread poll scheduling for the Wallbox integration."""
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+import logging
+import math
+import random
+from typing import Any
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .const import DATA_SCHEDULER, SCHEDULER_JITTER
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class _Member:
+    """A coordinator polled by the scheduler."""
+
+    coordinator: DataUpdateCoordinator[Any]
+    interval: float
+    phase: float = 0.0
+    handle: asyncio.TimerHandle | None = None
+    task: asyncio.Task[None] | None = None
+
+
+class WallboxScheduler:
+    """Spread the polls of all configured stations evenly over their interval.
+
+    A station joining takes the middle of the widest gap between the phases
+    of the stations sharing its interval, slightly jittered, on a fixed time
+    grid. The phases of the other stations stay where they are, so restarts
+    do not make all chargers poll in lockstep and the grid does not drift
+    with the duration of a refresh.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize."""
+        self._hass = hass
+        self._epoch = hass.loop.time()
+        self._members: dict[str, _Member] = {}
+
+    @callback
+    def async_register(
+        self, key: str, coordinator: DataUpdateCoordinator[Any], interval: float
+    ) -> None:
+        """Start polling a coordinator in the widest gap of its interval."""
+        self.async_unregister(key)
+        member = self._members[key] = _Member(coordinator, interval)
+        self._async_place(key, member)
+
+    @callback
+    def async_unregister(self, key: str) -> None:
+        """Stop polling a coordinator, cancelling a refresh still running."""
+        if (member := self._members.pop(key, None)) is None:
+            return
+        if member.handle is not None:
+            member.handle.cancel()
+        if member.task is not None:
+            member.task.cancel()
+
+    @callback
+    def async_set_interval(self, key: str, interval: float) -> None:
+        """Change the poll interval of a registered coordinator."""
+        if (member := self._members.get(key)) is None or member.interval == interval:
+            return
+        member.interval = interval
+        self._async_place(key, member)
+
+    @callback
+    def async_stop(self, _event: Event | None = None) -> None:
+        """Cancel all pending polls."""
+        for member in self._members.values():
+            if member.handle is not None:
+                member.handle.cancel()
+                member.handle = None
+
+    @property
+    def phases(self) -> dict[str, float]:
+        """Return the phase offset of every registered coordinator."""
+        return {key: round(member.phase, 3) for key, member in self._members.items()}
+
+    @callback
+    def _async_place(self, key: str, member: _Member) -> None:
+        """Give a member a phase in the widest gap of its interval and schedule it."""
+        interval = member.interval
+        phases = sorted(
+            other.phase
+            for other_key, other in self._members.items()
+            if other_key != key and other.interval == interval
+        )
+        if phases:
+            gap, start = max(
+                (end - begin, begin)
+                for begin, end in zip(phases, [*phases[1:], phases[0] + interval])
+            )
+            phase = start + gap / 2 + random.uniform(0, gap / 2 * SCHEDULER_JITTER)
+        else:
+            phase = random.uniform(0, interval * SCHEDULER_JITTER)
+        member.phase = phase % interval
+        self._async_schedule(member)
+
+    @callback
+    def _async_schedule(self, member: _Member) -> None:
+        """Schedule the next poll of a member on its grid slot."""
+        if member.handle is not None:
+            member.handle.cancel()
+        loop = self._hass.loop
+        cycles = math.floor(
+            (loop.time() - self._epoch - member.phase) / member.interval
+        ) + 1
+        member.handle = loop.call_at(
+            self._epoch + member.phase + cycles * member.interval,
+            self._async_fire,
+            member,
+        )
+
+    @callback
+    def _async_fire(self, member: _Member) -> None:
+        """Start a refresh unless the previous one is still running."""
+        member.handle = None
+        if member.task is None or member.task.done():
+            member.task = self._hass.async_create_task(
+                member.coordinator.async_refresh()
+            )
+        else:
+            _LOGGER.debug(
+                "Skipping poll of %s, previous one still running",
+                member.coordinator.name,
+            )
+        self._async_schedule(member)
+
+
+@callback
+def async_get_scheduler(hass: HomeAssistant) -> WallboxScheduler:
+    """Return the scheduler shared by all config entries."""
+    if (scheduler := hass.data.get(DATA_SCHEDULER)) is None:
+        scheduler = hass.data[DATA_SCHEDULER] = WallboxScheduler(hass)
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, scheduler.async_stop)
+    return scheduler
@@ -17,7 +17,7 @@ from homeassistant.helpers.update_coordinator import (
     UpdateFailed,
 )
 
-from . import WallboxCoordinator, WallboxEntity
+from . import WallboxCoordinator, WallboxEntity, async_setup_entity_discovery
 from .const import *
 
 _LOGGER = logging.getLogger(__name__)
@@ -36,17 +36,13 @@ async def async_setup_entry(
 ) -> None:
     """Create wallbox lock entities in HASS."""
     coordinator: WallboxCoordinator = hass.data[DOMAIN][entry.entry_id]
-    # Check if the user is authorized to lock, if so, add lock component
-    try:
-        async_add_entities(
-            [
-                WallboxModeSelector(coordinator, entry, description)
-                for ent in coordinator.data
-                if (description := SELECT_TYPES.get(ent))
-            ]
-        )
-    except:
-        return
+    async_setup_entity_discovery(
+        coordinator,
+        entry,
+        SELECT_TYPES,
+        lambda description: WallboxModeSelector(coordinator, entry, description),
+        async_add_entities,
+    )
 
 class WallboxModeSelector(WallboxEntity, SelectEntity):
     """Representation of a wallbox Mode Selector."""
@@ -60,24 +56,15 @@ class WallboxModeSelector(WallboxEntity, SelectEntity):
     ) -> None:
 
         """Initialize a Wallbox Mode Selector."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, entry, description)
 
-        self.entity_description = description
-        self._attr_name = f"{entry.title} {description.name}"
-        self._attr_unique_id = f"{description.key}-{coordinator.data[CONF_DATA_KEY][CONF_SERIAL_NUMBER_KEY]}"
-        self._attr_current_option = coordinator.data[CONF_DATA_KEY][CONF_CURRENT_MODE_KEY]
-        self._attr_options = coordinator.data[CONF_CHARGING_MODES_KEY]
-        self._attr_available = True
-
-    @property
-    def current_option(self) -> str | None:
-        """return the current preset"""
-        return self.coordinator.data[CONF_DATA_KEY][CONF_CURRENT_MODE_KEY]
+        self._attr_current_option = coordinator.data.chargecontrol.mode
+        self._attr_options = list(coordinator.data.charging_modes)
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        self._attr_current_option = self.coordinator.data[CONF_DATA_KEY][CONF_CURRENT_MODE_KEY]
+        self._attr_current_option = self.coordinator.data.chargecontrol.mode
         self.async_write_ha_state()
 
     async def async_select_option(self, option: str) -> None:
@@ -2,7 +2,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cache
 import logging
+import time
 from typing import cast
 
 from homeassistant.components.sensor import (
@@ -12,19 +14,17 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import *
-# (
-#     ELECTRIC_CURRENT_AMPERE,
-#     ENERGY_KILO_WATT_HOUR,
-#     LENGTH_KILOMETERS,
-#     PERCENTAGE,
-#     POWER_KILO_WATT,
-# )
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EntityCategory, UnitOfElectricCurrent
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import StateType
 
-from . import WallboxCoordinator, WallboxEntity
+from . import (
+    LOAD_TIMES_MS,
+    WallboxCoordinator,
+    WallboxEntity,
+    async_setup_entity_discovery,
+)
 from .const import *
 
 # (
@@ -44,867 +44,14 @@ from .const import *
 #     DOMAIN,
 # )
 
-UPDATE_INTERVAL = 30
-
 _LOGGER = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True)
 class WallboxSensorEntityDescription(SensorEntityDescription):
     """Describes Wallbox sensor entity."""
     precision: int | None = None
 
-OBIS_SENSORS: dict[str, WallboxSensorEntityDescription] = {
-
-    OBIS_ACTIVE_POWER_PLUS: WallboxSensorEntityDescription(
-            key=OBIS_ACTIVE_POWER_PLUS,
-            name='Active Power +',
-            #native_unit_of_measurement=POWER_WATT,
-            native_unit_of_measurement=UnitOfPower.WATT,
-            device_class=SensorDeviceClass.POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_ACTIVE_POWER_PLUS_MIN: WallboxSensorEntityDescription(
-            key=OBIS_ACTIVE_POWER_PLUS_MIN,
-            name='Active Power + min ',
-            #native_unit_of_measurement=POWER_WATT,
-            native_unit_of_measurement=UnitOfPower.WATT,
-            device_class=SensorDeviceClass.POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_ACTIVE_POWER_PLUS_MAX: WallboxSensorEntityDescription(
-            key=OBIS_ACTIVE_POWER_PLUS_MAX,
-            name='Active Power + max',
-            #native_unit_of_measurement=POWER_WATT,
-            native_unit_of_measurement=UnitOfPower.WATT,
-            device_class=SensorDeviceClass.POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_ACTIVE_ENERGY_PLUS: WallboxSensorEntityDescription(
-            key=OBIS_ACTIVE_ENERGY_PLUS,
-            name='Active energy + ',
-            #native_unit_of_measurement=ENERGY_KILO_WATT_HOUR,
-            native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-            device_class=SensorDeviceClass.ENERGY,
-            state_class=SensorStateClass.TOTAL_INCREASING
-        ),
-    OBIS_ACTIVE_POWER_MINUS: WallboxSensorEntityDescription(
-            key=OBIS_ACTIVE_POWER_MINUS,
-            name='Active power -',
-            #native_unit_of_measurement=POWER_WATT,
-            native_unit_of_measurement=UnitOfPower.WATT,
-            device_class=SensorDeviceClass.POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_ACTIVE_POWER_MINUS_MIN: WallboxSensorEntityDescription(
-            key=OBIS_ACTIVE_POWER_MINUS_MIN,
-            name='Active power - min ',
-            #native_unit_of_measurement=POWER_WATT,
-            native_unit_of_measurement=UnitOfPower.WATT,
-            device_class=SensorDeviceClass.POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_ACTIVE_POWER_MINUS_MAX: WallboxSensorEntityDescription(
-            key=OBIS_ACTIVE_POWER_MINUS_MAX,
-            name='Active power - max ',
-            #native_unit_of_measurement=POWER_WATT,
-            native_unit_of_measurement=UnitOfPower.WATT,
-            device_class=SensorDeviceClass.POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_ACTIVE_ENERGY_MINUS: WallboxSensorEntityDescription(
-            key=OBIS_ACTIVE_ENERGY_MINUS,
-            name='Active energy - ',
-            #native_unit_of_measurement=ENERGY_KILO_WATT_HOUR,
-            native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-            device_class=SensorDeviceClass.ENERGY,
-            state_class=SensorStateClass.TOTAL_INCREASING
-        ),
-    OBIS_REACTIVE_POWER_PLUS: WallboxSensorEntityDescription(
-            key=OBIS_REACTIVE_POWER_PLUS,
-            name='Reactive power +  ',
-            #native_unit_of_measurement=POWER_VOLT_AMPERE,
-            native_unit_of_measurement=UnitOfApparentPower.VOLT_AMPERE,
-            device_class=SensorDeviceClass.REACTIVE_POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_REACTIVE_POWER_PLUS_MIN: WallboxSensorEntityDescription(
-            key=OBIS_REACTIVE_POWER_PLUS_MIN,
-            name='Reactive power +  min ',
-            #native_unit_of_measurement=POWER_VOLT_AMPERE,
-            native_unit_of_measurement=UnitOfApparentPower.VOLT_AMPERE,
-            device_class=SensorDeviceClass.REACTIVE_POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_REACTIVE_POWER_PLUS_MAX: WallboxSensorEntityDescription(
-            key=OBIS_REACTIVE_POWER_PLUS_MAX,
-            name='Reactive power + max ',
-            #native_unit_of_measurement=POWER_VOLT_AMPERE,
-            native_unit_of_measurement=UnitOfApparentPower.VOLT_AMPERE,
-            device_class=SensorDeviceClass.REACTIVE_POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_REACTIVE_POWER_MINUS: WallboxSensorEntityDescription(
-            key=OBIS_REACTIVE_POWER_MINUS,
-            name='Reactive power - ',
-            #native_unit_of_measurement=POWER_VOLT_AMPERE,
-            native_unit_of_measurement=UnitOfApparentPower.VOLT_AMPERE,
-            device_class=SensorDeviceClass.REACTIVE_POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_REACTIVE_POWER_MINUS_MIN: WallboxSensorEntityDescription(
-            key=OBIS_REACTIVE_POWER_MINUS_MIN,
-            name='Reactive power - min ',
-            #native_unit_of_measurement=POWER_VOLT_AMPERE,
-            native_unit_of_measurement=UnitOfApparentPower.VOLT_AMPERE,
-            device_class=SensorDeviceClass.REACTIVE_POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_REACTIVE_POWER_MINUS_MAX: WallboxSensorEntityDescription(
-            key=OBIS_REACTIVE_POWER_MINUS_MAX,
-            name='Reactive power - max ',
-            #native_unit_of_measurement=POWER_VOLT_AMPERE,
-            native_unit_of_measurement=UnitOfApparentPower.VOLT_AMPERE,
-            device_class=SensorDeviceClass.REACTIVE_POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_APPARENT_POWER_PLUS: WallboxSensorEntityDescription(
-            key=OBIS_APPARENT_POWER_PLUS,
-            name='Apparent power + ',
-            #native_unit_of_measurement=POWER_VOLT_AMPERE,
-            native_unit_of_measurement=UnitOfApparentPower.VOLT_AMPERE,
-            device_class=SensorDeviceClass.APPARENT_POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_APPARENT_POWER_PLUS_MIN: WallboxSensorEntityDescription(
-            key=OBIS_APPARENT_POWER_PLUS_MIN,
-            name='Apparent power + min ',
-            #native_unit_of_measurement=POWER_VOLT_AMPERE,
-            native_unit_of_measurement=UnitOfApparentPower.VOLT_AMPERE,
-            device_class=SensorDeviceClass.APPARENT_POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_APPARENT_POWER_PLUS_MAX: WallboxSensorEntityDescription(
-            key=OBIS_APPARENT_POWER_PLUS_MAX,
-            name='Apparent power + max ',
-            #native_unit_of_measurement=POWER_VOLT_AMPERE,
-            native_unit_of_measurement=UnitOfApparentPower.VOLT_AMPERE,
-            device_class=SensorDeviceClass.APPARENT_POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_APPARENT_POWER_MINUS: WallboxSensorEntityDescription(
-            key=OBIS_APPARENT_POWER_MINUS,
-            name='Apparent power - ',
-            #native_unit_of_measurement=POWER_VOLT_AMPERE,
-            native_unit_of_measurement=UnitOfApparentPower.VOLT_AMPERE,
-            device_class=SensorDeviceClass.APPARENT_POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_APPARENT_POWER_MINUS_MIN: WallboxSensorEntityDescription(
-            key=OBIS_APPARENT_POWER_MINUS_MIN,
-            name='Apparent power - min ',
-            #native_unit_of_measurement=POWER_VOLT_AMPERE,
-            native_unit_of_measurement=UnitOfApparentPower.VOLT_AMPERE,
-            device_class=SensorDeviceClass.APPARENT_POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_APPARENT_POWER_MINUS_MAX: WallboxSensorEntityDescription(
-            key=OBIS_APPARENT_POWER_MINUS_MAX,
-            name='Apparent power - max',
-            #native_unit_of_measurement=POWER_VOLT_AMPERE,
-            native_unit_of_measurement=UnitOfApparentPower.VOLT_AMPERE,
-            device_class=SensorDeviceClass.APPARENT_POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_POWER_FACTOR: WallboxSensorEntityDescription(
-            key=OBIS_POWER_FACTOR,
-            name='Power factor',
-            native_unit_of_measurement=PERCENTAGE,
-            device_class=SensorDeviceClass.POWER_FACTOR,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_POWER_FACTOR_MIN: WallboxSensorEntityDescription(
-            key=OBIS_POWER_FACTOR_MIN,
-            name='Power factor min',
-            native_unit_of_measurement=PERCENTAGE,
-            device_class=SensorDeviceClass.POWER_FACTOR,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_POWER_FACTOR_MAX: WallboxSensorEntityDescription(
-            key=OBIS_POWER_FACTOR_MAX,
-            name='Power factor max',
-            native_unit_of_measurement=PERCENTAGE,
-            device_class=SensorDeviceClass.POWER_FACTOR,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_SUPPLY_FREQUENCY: WallboxSensorEntityDescription(
-            key=OBIS_SUPPLY_FREQUENCY,
-            name='Supply frequency',
-            native_unit_of_measurement=UnitOfFrequency.HERTZ,
-            device_class=SensorDeviceClass.FREQUENCY,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_SUPPLY_FREQUENCY_MIN: WallboxSensorEntityDescription(
-            key=OBIS_SUPPLY_FREQUENCY_MIN,
-            name='Supply frequency min',
-            native_unit_of_measurement=UnitOfFrequency.HERTZ,
-            device_class=SensorDeviceClass.FREQUENCY,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_SUPPLY_FREQUENCY_MAX: WallboxSensorEntityDescription(
-            key=OBIS_SUPPLY_FREQUENCY_MAX,
-            name='Supply frequency max',
-            native_unit_of_measurement=UnitOfFrequency.HERTZ,
-            device_class=SensorDeviceClass.FREQUENCY,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_ACTIVE_POWER_PLUS_L1: WallboxSensorEntityDescription(
-            key=OBIS_ACTIVE_POWER_PLUS_L1,
-            name='Active power + (L1)',
-            #native_unit_of_measurement=POWER_WATT,
-            native_unit_of_measurement=UnitOfPower.WATT,
-            device_class=SensorDeviceClass.POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_ACTIVE_POWER_PLUS_L1_MIN: WallboxSensorEntityDescription(
-            key=OBIS_ACTIVE_POWER_PLUS_L1_MIN,
-            name='Active power + (L1) min',
-            #native_unit_of_measurement=POWER_WATT,
-            native_unit_of_measurement=UnitOfPower.WATT,
-            device_class=SensorDeviceClass.POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_ACTIVE_POWER_PLUS_L1_MAX: WallboxSensorEntityDescription(
-            key=OBIS_ACTIVE_POWER_PLUS_L1_MAX,
-            name='Active power + (L1) max',
-            #native_unit_of_measurement=POWER_WATT,
-            native_unit_of_measurement=UnitOfPower.WATT,
-            device_class=SensorDeviceClass.POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_ACTIVE_ENERGY_PLUS_L1: WallboxSensorEntityDescription(
-            key=OBIS_ACTIVE_ENERGY_PLUS_L1,
-            name='Active energy + (L1)',
-            #native_unit_of_measurement=ENERGY_KILO_WATT_HOUR,
-            native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-            device_class=SensorDeviceClass.ENERGY,
-            state_class=SensorStateClass.TOTAL_INCREASING
-        ),
-    OBIS_ACTIVE_POWER_MINUS_L1: WallboxSensorEntityDescription(
-            key=OBIS_ACTIVE_POWER_MINUS_L1,
-            name='Active power - (L1)',
-            #native_unit_of_measurement=POWER_WATT,
-            native_unit_of_measurement=UnitOfPower.WATT,
-            device_class=SensorDeviceClass.POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_ACTIVE_POWER_MINUS_L1_MIN: WallboxSensorEntityDescription(
-            key=OBIS_ACTIVE_POWER_MINUS_L1_MIN,
-            name='Active power - (L1) min',
-            #native_unit_of_measurement=POWER_WATT,
-            native_unit_of_measurement=UnitOfPower.WATT,
-            device_class=SensorDeviceClass.POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_ACTIVE_POWER_MINUS_L1_MAX: WallboxSensorEntityDescription(
-            key=OBIS_ACTIVE_POWER_MINUS_L1_MAX,
-            name='Active power - (L1) max',
-            #native_unit_of_measurement=POWER_WATT,
-            native_unit_of_measurement=UnitOfPower.WATT,
-            device_class=SensorDeviceClass.POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_ACTIVE_ENERGY_MINUS_L1: WallboxSensorEntityDescription(
-            key=OBIS_ACTIVE_ENERGY_MINUS_L1,
-            name='Active energy - (L1)',
-            #native_unit_of_measurement=ENERGY_KILO_WATT_HOUR,
-            native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-            device_class=SensorDeviceClass.ENERGY,
-            state_class=SensorStateClass.TOTAL_INCREASING
-        ),
-    OBIS_REACTIVE_POWER_PLUS_L1: WallboxSensorEntityDescription(
-            key=OBIS_REACTIVE_POWER_PLUS_L1,
-            name='Reactive power + (L1)',
-            #native_unit_of_measurement=POWER_VOLT_AMPERE,
-            native_unit_of_measurement=UnitOfApparentPower.VOLT_AMPERE,
-            device_class=SensorDeviceClass.REACTIVE_POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_REACTIVE_POWER_PLUS_L1_MIN: WallboxSensorEntityDescription(
-            key=OBIS_REACTIVE_POWER_PLUS_L1_MIN,
-            name='Reactive power + (L1) min',
-            #native_unit_of_measurement=POWER_VOLT_AMPERE,
-            native_unit_of_measurement=UnitOfApparentPower.VOLT_AMPERE,
-            device_class=SensorDeviceClass.REACTIVE_POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_REACTIVE_POWER_PLUS_L1_MAX: WallboxSensorEntityDescription(
-            key=OBIS_REACTIVE_POWER_PLUS_L1_MAX,
-            name='Reactive power + (L1) max',
-            #native_unit_of_measurement=POWER_VOLT_AMPERE,
-            native_unit_of_measurement=UnitOfApparentPower.VOLT_AMPERE,
-            device_class=SensorDeviceClass.REACTIVE_POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_REACTIVE_POWER_MINUS_L1: WallboxSensorEntityDescription(
-            key=OBIS_REACTIVE_POWER_MINUS_L1,
-            name='Reactive power - (L1)',
-            #native_unit_of_measurement=POWER_VOLT_AMPERE,
-            native_unit_of_measurement=UnitOfApparentPower.VOLT_AMPERE,
-            device_class=SensorDeviceClass.REACTIVE_POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_REACTIVE_POWER_MINUS_L1_MIN: WallboxSensorEntityDescription(
-            key=OBIS_REACTIVE_POWER_MINUS_L1_MIN,
-            name='Reactive power - (L1) min',
-            #native_unit_of_measurement=POWER_VOLT_AMPERE,
-            native_unit_of_measurement=UnitOfApparentPower.VOLT_AMPERE,
-            device_class=SensorDeviceClass.REACTIVE_POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_REACTIVE_POWER_MINUS_L1_MAX: WallboxSensorEntityDescription(
-            key=OBIS_REACTIVE_POWER_MINUS_L1_MAX,
-            name='Reactive power - (L1) max',
-            #native_unit_of_measurement=POWER_VOLT_AMPERE,
-            native_unit_of_measurement=UnitOfApparentPower.VOLT_AMPERE,
-            device_class=SensorDeviceClass.REACTIVE_POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_APPARENT_POWER_PLUS_L1: WallboxSensorEntityDescription(
-            key=OBIS_APPARENT_POWER_PLUS_L1,
-            name='Apparent power + (L1)',
-            #native_unit_of_measurement=POWER_VOLT_AMPERE,
-            native_unit_of_measurement=UnitOfApparentPower.VOLT_AMPERE,
-            device_class=SensorDeviceClass.APPARENT_POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_APPARENT_POWER_PLUS_L1_MIN: WallboxSensorEntityDescription(
-            key=OBIS_APPARENT_POWER_PLUS_L1_MIN,
-            name='Apparent power + (L1) min',
-            #native_unit_of_measurement=POWER_VOLT_AMPERE,
-            native_unit_of_measurement=UnitOfApparentPower.VOLT_AMPERE,
-            device_class=SensorDeviceClass.APPARENT_POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_APPARENT_POWER_PLUS_L1_MAX: WallboxSensorEntityDescription(
-            key=OBIS_APPARENT_POWER_PLUS_L1_MAX,
-            name='Apparent power + (L1) max',
-            #native_unit_of_measurement=POWER_VOLT_AMPERE,
-            native_unit_of_measurement=UnitOfApparentPower.VOLT_AMPERE,
-            device_class=SensorDeviceClass.APPARENT_POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_APPARENT_POWER_MINUS_L1: WallboxSensorEntityDescription(
-            key=OBIS_APPARENT_POWER_MINUS_L1,
-            name='Apparent power - (L1)',
-            #native_unit_of_measurement=POWER_VOLT_AMPERE,
-            native_unit_of_measurement=UnitOfApparentPower.VOLT_AMPERE,
-            device_class=SensorDeviceClass.APPARENT_POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_APPARENT_POWER_MINUS_L1_MIN: WallboxSensorEntityDescription(
-            key=OBIS_APPARENT_POWER_MINUS_L1_MIN,
-            name='Apparent power - (L1) min',
-            #native_unit_of_measurement=POWER_VOLT_AMPERE,
-            native_unit_of_measurement=UnitOfApparentPower.VOLT_AMPERE,
-            device_class=SensorDeviceClass.APPARENT_POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_APPARENT_POWER_MINUS_L1_MAX: WallboxSensorEntityDescription(
-            key=OBIS_APPARENT_POWER_MINUS_L1_MAX,
-            name='Apparent power - (L1) max ',
-            #native_unit_of_measurement=POWER_VOLT_AMPERE,
-            native_unit_of_measurement=UnitOfApparentPower.VOLT_AMPERE,
-            device_class=SensorDeviceClass.APPARENT_POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_CURRENT_L1: WallboxSensorEntityDescription(
-            key=OBIS_CURRENT_L1,
-            name='Current (L1)',
-            native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-            device_class=SensorDeviceClass.CURRENT,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_CURRENT_L1_MIN: WallboxSensorEntityDescription(
-            key=OBIS_CURRENT_L1_MIN,
-            name='Current (L1) min ',
-            native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-            device_class=SensorDeviceClass.CURRENT,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_CURRENT_L1_MAX: WallboxSensorEntityDescription(
-            key=OBIS_CURRENT_L1_MAX,
-            name='Current (L1) max ',
-            native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-            device_class=SensorDeviceClass.CURRENT,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_VOLTAGE_L1: WallboxSensorEntityDescription(
-            key=OBIS_VOLTAGE_L1,
-            name='Voltage (L1) ',
-            native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-            device_class=SensorDeviceClass.VOLTAGE,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_VOLTAGE_L1_MIN: WallboxSensorEntityDescription(
-            key=OBIS_VOLTAGE_L1_MIN,
-            name='Voltage (L1) min',
-            native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-            device_class=SensorDeviceClass.VOLTAGE,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_VOLTAGE_L1_MAX: WallboxSensorEntityDescription(
-            key=OBIS_VOLTAGE_L1_MAX,
-            name='Voltage (L1) max',
-            native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-            device_class=SensorDeviceClass.VOLTAGE,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_POWER_FACTOR_L1: WallboxSensorEntityDescription(
-            key=OBIS_POWER_FACTOR_L1,
-            name='Power factor (L1)',
-            native_unit_of_measurement=PERCENTAGE,
-            device_class=SensorDeviceClass.POWER_FACTOR,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_POWER_FACTOR_L1_MIN: WallboxSensorEntityDescription(
-            key=OBIS_POWER_FACTOR_L1_MIN,
-            name='Power factor (L1) min ',
-            native_unit_of_measurement=PERCENTAGE,
-            device_class=SensorDeviceClass.POWER_FACTOR,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_POWER_FACTOR_L1_MAX: WallboxSensorEntityDescription(
-            key=OBIS_POWER_FACTOR_L1_MAX,
-            name='Power factor (L1) max ',
-            native_unit_of_measurement=PERCENTAGE,
-            device_class=SensorDeviceClass.POWER_FACTOR,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_ACTIVE_POWER_PLUS_L2: WallboxSensorEntityDescription(
-            key=OBIS_ACTIVE_POWER_PLUS_L2,
-            name='Active power + (L2)',
-            #native_unit_of_measurement=POWER_WATT,
-            native_unit_of_measurement=UnitOfPower.WATT,
-            device_class=SensorDeviceClass.POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_ACTIVE_POWER_PLUS_L2_MIN: WallboxSensorEntityDescription(
-            key=OBIS_ACTIVE_POWER_PLUS_L2_MIN,
-            name='Active power + (L2) min ',
-            #native_unit_of_measurement=POWER_WATT,
-            native_unit_of_measurement=UnitOfPower.WATT,
-            device_class=SensorDeviceClass.POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_ACTIVE_POWER_PLUS_L2_MAX: WallboxSensorEntityDescription(
-            key=OBIS_ACTIVE_POWER_PLUS_L2_MAX,
-            name='Active power + (L2) max ',
-            #native_unit_of_measurement=POWER_WATT,
-            native_unit_of_measurement=UnitOfPower.WATT,
-            device_class=SensorDeviceClass.POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_ACTIVE_ENERGY_PLUS_L2: WallboxSensorEntityDescription(
-            key=OBIS_ACTIVE_ENERGY_PLUS_L2,
-            name='Active energy + (L2)',
-            #native_unit_of_measurement=ENERGY_KILO_WATT_HOUR,
-            native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-            device_class=SensorDeviceClass.ENERGY,
-            state_class=SensorStateClass.TOTAL_INCREASING
-        ),
-    OBIS_ACTIVE_POWER_MINUS_L2: WallboxSensorEntityDescription(
-            key=OBIS_ACTIVE_POWER_MINUS_L2,
-            name='Active power - (L2)',
-            #native_unit_of_measurement=POWER_WATT,
-            native_unit_of_measurement=UnitOfPower.WATT,
-            device_class=SensorDeviceClass.POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_ACTIVE_POWER_MINUS_L2_MIN: WallboxSensorEntityDescription(
-            key=OBIS_ACTIVE_POWER_MINUS_L2_MIN,
-            name='Active power - (L2) min ',
-            #native_unit_of_measurement=POWER_WATT,
-            native_unit_of_measurement=UnitOfPower.WATT,
-            device_class=SensorDeviceClass.POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_ACTIVE_POWER_MINUS_L2_MAX: WallboxSensorEntityDescription(
-            key=OBIS_ACTIVE_POWER_MINUS_L2_MAX,
-            name='Active power - (L2) max ',
-            #native_unit_of_measurement=POWER_WATT,
-            native_unit_of_measurement=UnitOfPower.WATT,
-            device_class=SensorDeviceClass.POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_ACTIVE_ENERGY_MINUS_L2: WallboxSensorEntityDescription(
-            key=OBIS_ACTIVE_ENERGY_MINUS_L2,
-            name='Active energy - (L2) ',
-            #native_unit_of_measurement=ENERGY_KILO_WATT_HOUR,
-            native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-            device_class=SensorDeviceClass.ENERGY,
-            state_class=SensorStateClass.TOTAL_INCREASING
-        ),
-    OBIS_REACTIVE_POWER_PLUS_L2: WallboxSensorEntityDescription(
-            key=OBIS_REACTIVE_POWER_PLUS_L2,
-            name='Reactive power + (L2) ',
-            native_unit_of_measurement=UnitOfApparentPower.VOLT_AMPERE,
-            device_class=SensorDeviceClass.REACTIVE_POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_REACTIVE_POWER_PLUS_L2_MIN: WallboxSensorEntityDescription(
-            key=OBIS_REACTIVE_POWER_PLUS_L2_MIN,
-            name='Reactive power + (L2) min ',
-            native_unit_of_measurement=UnitOfApparentPower.VOLT_AMPERE,
-            device_class=SensorDeviceClass.REACTIVE_POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_REACTIVE_POWER_PLUS_L2_MAX: WallboxSensorEntityDescription(
-            key=OBIS_REACTIVE_POWER_PLUS_L2_MAX,
-            name='Reactive power + (L2) max ',
-            native_unit_of_measurement=UnitOfApparentPower.VOLT_AMPERE,
-            device_class=SensorDeviceClass.REACTIVE_POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_REACTIVE_POWER_MINUS_L2: WallboxSensorEntityDescription(
-            key=OBIS_REACTIVE_POWER_MINUS_L2,
-            name='Reactive power - (L2) ',
-            native_unit_of_measurement=UnitOfApparentPower.VOLT_AMPERE,
-            device_class=SensorDeviceClass.REACTIVE_POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_REACTIVE_POWER_MINUS_L2_MIN: WallboxSensorEntityDescription(
-            key=OBIS_REACTIVE_POWER_MINUS_L2_MIN,
-            name='Reactive power - (L2) min ',
-            native_unit_of_measurement=UnitOfApparentPower.VOLT_AMPERE,
-            device_class=SensorDeviceClass.REACTIVE_POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_REACTIVE_POWER_MINUS_L2_MAX: WallboxSensorEntityDescription(
-            key=OBIS_REACTIVE_POWER_MINUS_L2_MAX,
-            name='Reactive power - (L2) max ',
-            native_unit_of_measurement=UnitOfApparentPower.VOLT_AMPERE,
-            device_class=SensorDeviceClass.REACTIVE_POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_APPARENT_POWER_PLUS_L2: WallboxSensorEntityDescription(
-            key=OBIS_APPARENT_POWER_PLUS_L2,
-            name='Apparent power + (L2) ',
-            native_unit_of_measurement=UnitOfApparentPower.VOLT_AMPERE,
-            device_class=SensorDeviceClass.APPARENT_POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_APPARENT_POWER_PLUS_L2_MIN: WallboxSensorEntityDescription(
-            key=OBIS_APPARENT_POWER_PLUS_L2_MIN,
-            name='Apparent power + (L2) min ',
-            native_unit_of_measurement=UnitOfApparentPower.VOLT_AMPERE,
-            device_class=SensorDeviceClass.APPARENT_POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_APPARENT_POWER_PLUS_L2_MAX: WallboxSensorEntityDescription(
-            key=OBIS_APPARENT_POWER_PLUS_L2_MAX,
-            name='Apparent power + (L2) max ',
-            native_unit_of_measurement=UnitOfApparentPower.VOLT_AMPERE,
-            device_class=SensorDeviceClass.APPARENT_POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_APPARENT_POWER_MINUS_L2: WallboxSensorEntityDescription(
-            key=OBIS_APPARENT_POWER_MINUS_L2,
-            name='Apparent power - (L2) ',
-            native_unit_of_measurement=UnitOfApparentPower.VOLT_AMPERE,
-            device_class=SensorDeviceClass.APPARENT_POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_APPARENT_POWER_MINUS_L2_MIN: WallboxSensorEntityDescription(
-            key=OBIS_APPARENT_POWER_MINUS_L2_MIN,
-            name='Apparent power - (L2) min ',
-            native_unit_of_measurement=UnitOfApparentPower.VOLT_AMPERE,
-            device_class=SensorDeviceClass.APPARENT_POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_APPARENT_POWER_MINUS_L2_MAX: WallboxSensorEntityDescription(
-            key=OBIS_APPARENT_POWER_MINUS_L2_MAX,
-            name='Apparent power - (L2) max ',
-            native_unit_of_measurement=UnitOfApparentPower.VOLT_AMPERE,
-            device_class=SensorDeviceClass.APPARENT_POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_CURRENT_L2: WallboxSensorEntityDescription(
-            key=OBIS_CURRENT_L2,
-            name='Current (L2) ',
-            native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-            device_class=SensorDeviceClass.CURRENT,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_CURRENT_L2_MIN: WallboxSensorEntityDescription(
-            key=OBIS_CURRENT_L2_MIN,
-            name='Current (L2) min',
-            native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-            device_class=SensorDeviceClass.CURRENT,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_CURRENT_L2_MAX: WallboxSensorEntityDescription(
-            key=OBIS_CURRENT_L2_MAX,
-            name='Current (L2) max',
-            native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-            device_class=SensorDeviceClass.CURRENT,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_VOLTAGE_L2: WallboxSensorEntityDescription(
-            key=OBIS_VOLTAGE_L2,
-            name='Voltage (L2)',
-            native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-            device_class=SensorDeviceClass.VOLTAGE,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_VOLTAGE_L2_MIN: WallboxSensorEntityDescription(
-            key=OBIS_VOLTAGE_L2_MIN,
-            name='Voltage (L2) min',
-            native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-            device_class=SensorDeviceClass.VOLTAGE,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_VOLTAGE_L2_MAX: WallboxSensorEntityDescription(
-            key=OBIS_VOLTAGE_L2_MAX,
-            name='Voltage (L2) max',
-            native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-            device_class=SensorDeviceClass.VOLTAGE,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_POWER_FACTOR_L2: WallboxSensorEntityDescription(
-            key=OBIS_POWER_FACTOR_L2,
-            name='Power factor (L2)',
-            native_unit_of_measurement=PERCENTAGE,
-            device_class=SensorDeviceClass.POWER_FACTOR,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_POWER_FACTOR_L2_MIN: WallboxSensorEntityDescription(
-            key=OBIS_POWER_FACTOR_L2_MIN,
-            name='Power factor (L2) min ',
-            native_unit_of_measurement=PERCENTAGE,
-            device_class=SensorDeviceClass.POWER_FACTOR,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_POWER_FACTOR_L2_MAX: WallboxSensorEntityDescription(
-            key=OBIS_POWER_FACTOR_L2_MAX,
-            name='Power factor (L2) max ',
-            native_unit_of_measurement=PERCENTAGE,
-            device_class=SensorDeviceClass.POWER_FACTOR,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_ACTIVE_POWER_PLUS_L3: WallboxSensorEntityDescription(
-            key=OBIS_ACTIVE_POWER_PLUS_L3,
-            name='Active power + (L3)',
-            #native_unit_of_measurement=POWER_WATT,
-            native_unit_of_measurement=UnitOfPower.WATT,
-            device_class=SensorDeviceClass.POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_ACTIVE_POWER_PLUS_L3_MIN: WallboxSensorEntityDescription(
-            key=OBIS_ACTIVE_POWER_PLUS_L3_MIN,
-            name='Active power + (L3) min ',
-            #native_unit_of_measurement=POWER_WATT,
-            native_unit_of_measurement=UnitOfPower.WATT,
-            device_class=SensorDeviceClass.POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_ACTIVE_POWER_PLUS_L3_MAX: WallboxSensorEntityDescription(
-            key=OBIS_ACTIVE_POWER_PLUS_L3_MAX,
-            name='Active power + (L3) max ',
-            #native_unit_of_measurement=POWER_WATT,
-            native_unit_of_measurement=UnitOfPower.WATT,
-            device_class=SensorDeviceClass.POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_ACTIVE_ENERGY_PLUS_L3: WallboxSensorEntityDescription(
-            key=OBIS_ACTIVE_ENERGY_PLUS_L3,
-            name='Active energy + (L3)',
-            #native_unit_of_measurement=ENERGY_KILO_WATT_HOUR,
-            native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-            device_class=SensorDeviceClass.ENERGY,
-            state_class=SensorStateClass.TOTAL_INCREASING
-        ),
-    OBIS_ACTIVE_POWER_MINUS_L3: WallboxSensorEntityDescription(
-            key=OBIS_ACTIVE_POWER_MINUS_L3,
-            name='Active power - (L3)',
-            #native_unit_of_measurement=POWER_WATT,
-            native_unit_of_measurement=UnitOfPower.WATT,
-            device_class=SensorDeviceClass.POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_ACTIVE_POWER_MINUS_L3_MIN: WallboxSensorEntityDescription(
-            key=OBIS_ACTIVE_POWER_MINUS_L3_MIN,
-            name='Active power - (L3) min ',
-            #native_unit_of_measurement=POWER_WATT,
-            native_unit_of_measurement=UnitOfPower.WATT,
-            device_class=SensorDeviceClass.POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_ACTIVE_POWER_MINUS_L3_MAX: WallboxSensorEntityDescription(
-            key=OBIS_ACTIVE_POWER_MINUS_L3_MAX,
-            name='Active power - (L3) max ',
-            #native_unit_of_measurement=POWER_WATT,
-            native_unit_of_measurement=UnitOfPower.WATT,
-            device_class=SensorDeviceClass.POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_ACTIVE_ENERGY_MINUS_L3: WallboxSensorEntityDescription(
-            key=OBIS_ACTIVE_ENERGY_MINUS_L3,
-            name='Active energy - (L3) ',
-            #native_unit_of_measurement=ENERGY_KILO_WATT_HOUR,
-            native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
-            device_class=SensorDeviceClass.ENERGY,
-            state_class=SensorStateClass.TOTAL_INCREASING
-        ),
-    OBIS_REACTIVE_POWER_PLUS_L3: WallboxSensorEntityDescription(
-            key=OBIS_REACTIVE_POWER_PLUS_L3,
-            name='Reactive power + (L3) ',
-            native_unit_of_measurement=UnitOfApparentPower.VOLT_AMPERE,
-            device_class=SensorDeviceClass.REACTIVE_POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_REACTIVE_POWER_PLUS_L3_MIN: WallboxSensorEntityDescription(
-            key=OBIS_REACTIVE_POWER_PLUS_L3_MIN,
-            name='Reactive power + (L3) min ',
-            native_unit_of_measurement=UnitOfApparentPower.VOLT_AMPERE,
-            device_class=SensorDeviceClass.REACTIVE_POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_REACTIVE_POWER_PLUS_L3_MAX: WallboxSensorEntityDescription(
-            key=OBIS_REACTIVE_POWER_PLUS_L3_MAX,
-            name='Reactive power + (L3) max ',
-            native_unit_of_measurement=UnitOfApparentPower.VOLT_AMPERE,
-            device_class=SensorDeviceClass.REACTIVE_POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_REACTIVE_POWER_MINUS_L3: WallboxSensorEntityDescription(
-            key=OBIS_REACTIVE_POWER_MINUS_L3,
-            name='Reactive power - (L3) ',
-            native_unit_of_measurement=UnitOfApparentPower.VOLT_AMPERE,
-            device_class=SensorDeviceClass.REACTIVE_POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_REACTIVE_POWER_MINUS_L3_MIN: WallboxSensorEntityDescription(
-            key=OBIS_REACTIVE_POWER_MINUS_L3_MIN,
-            name='Reactive power - (L3) min ',
-            native_unit_of_measurement=UnitOfApparentPower.VOLT_AMPERE,
-            device_class=SensorDeviceClass.REACTIVE_POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_REACTIVE_POWER_MINUS_L3_MAX: WallboxSensorEntityDescription(
-            key=OBIS_REACTIVE_POWER_MINUS_L3_MAX,
-            name='Reactive power - (L3) max ',
-            native_unit_of_measurement=UnitOfApparentPower.VOLT_AMPERE,
-            device_class=SensorDeviceClass.REACTIVE_POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_APPARENT_POWER_PLUS_L3: WallboxSensorEntityDescription(
-            key=OBIS_APPARENT_POWER_PLUS_L3,
-            name='Apparent power + (L3) ',
-            native_unit_of_measurement=UnitOfApparentPower.VOLT_AMPERE,
-            device_class=SensorDeviceClass.APPARENT_POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_APPARENT_POWER_PLUS_L3_MIN: WallboxSensorEntityDescription(
-            key=OBIS_APPARENT_POWER_PLUS_L3_MIN,
-            name='Apparent power + (L3) min ',
-            native_unit_of_measurement=UnitOfApparentPower.VOLT_AMPERE,
-            device_class=SensorDeviceClass.APPARENT_POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_APPARENT_POWER_PLUS_L3_MAX: WallboxSensorEntityDescription(
-            key=OBIS_APPARENT_POWER_PLUS_L3_MAX,
-            name='Apparent power + (L3) max ',
-            native_unit_of_measurement=UnitOfApparentPower.VOLT_AMPERE,
-            device_class=SensorDeviceClass.APPARENT_POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_APPARENT_POWER_MINUS_L3: WallboxSensorEntityDescription(
-            key=OBIS_APPARENT_POWER_MINUS_L3,
-            name='Apparent power - (L3) ',
-            native_unit_of_measurement=UnitOfApparentPower.VOLT_AMPERE,
-            device_class=SensorDeviceClass.APPARENT_POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_APPARENT_POWER_MINUS_L3_MIN: WallboxSensorEntityDescription(
-            key=OBIS_APPARENT_POWER_MINUS_L3_MIN,
-            name='Apparent power - (L3) min ',
-            native_unit_of_measurement=UnitOfApparentPower.VOLT_AMPERE,
-            device_class=SensorDeviceClass.APPARENT_POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_APPARENT_POWER_MINUS_L3_MAX: WallboxSensorEntityDescription(
-            key=OBIS_APPARENT_POWER_MINUS_L3_MAX,
-            name='Apparent power - (L3) max ',
-            native_unit_of_measurement=UnitOfApparentPower.VOLT_AMPERE,
-            device_class=SensorDeviceClass.APPARENT_POWER,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_CURRENT_L3: WallboxSensorEntityDescription(
-            key=OBIS_CURRENT_L3,
-            name='Current (L3) ',
-            native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-            device_class=SensorDeviceClass.CURRENT,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_CURRENT_L3_MIN: WallboxSensorEntityDescription(
-            key=OBIS_CURRENT_L3_MIN,
-            name='Current (L3) min ',
-            native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-            device_class=SensorDeviceClass.CURRENT,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_CURRENT_L3_MAX: WallboxSensorEntityDescription(
-            key=OBIS_CURRENT_L3_MAX,
-            name='Current (L3) max ',
-            native_unit_of_measurement=UnitOfElectricCurrent.AMPERE,
-            device_class=SensorDeviceClass.CURRENT,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_VOLTAGE_L3: WallboxSensorEntityDescription(
-            key=OBIS_VOLTAGE_L3,
-            name='Voltage (L3) ',
-            native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-            device_class=SensorDeviceClass.VOLTAGE,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_VOLTAGE_L3_MIN: WallboxSensorEntityDescription(
-            key=OBIS_VOLTAGE_L3_MIN,
-            name='Voltage (L3) min ',
-            native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-            device_class=SensorDeviceClass.VOLTAGE,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_VOLTAGE_L3_MAX: WallboxSensorEntityDescription(
-            key=OBIS_VOLTAGE_L3_MAX,
-            name='Voltage (L3) max ',
-            native_unit_of_measurement=UnitOfElectricPotential.VOLT,
-            device_class=SensorDeviceClass.VOLTAGE,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_POWER_FACTOR_L3: WallboxSensorEntityDescription(
-            key=OBIS_POWER_FACTOR_L3,
-            name='Power factor (L3) ',
-            native_unit_of_measurement=PERCENTAGE,
-            device_class=SensorDeviceClass.POWER_FACTOR,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_POWER_FACTOR_L3_MIN: WallboxSensorEntityDescription(
-            key=OBIS_POWER_FACTOR_L3_MIN,
-            name='Power factor (L3) min ',
-            native_unit_of_measurement=PERCENTAGE,
-            device_class=SensorDeviceClass.POWER_FACTOR,
-            state_class=SensorStateClass.MEASUREMENT
-        ),
-    OBIS_POWER_FACTOR_L3_MAX: WallboxSensorEntityDescription(
-            key=OBIS_POWER_FACTOR_L3_MAX,
-            name='Power factor (L3) max ',
-            native_unit_of_measurement=PERCENTAGE,
-            device_class=SensorDeviceClass.POWER_FACTOR,
-            state_class=SensorStateClass.MEASUREMENT
-        )
-}
-
 SENSOR_TYPES: dict[str, WallboxSensorEntityDescription] = {
     # CONF_CHARGING_POWER_KEY: WallboxSensorEntityDescription(
     #     key=CONF_CHARGING_POWER_KEY,
@@ -1011,20 +158,48 @@ SENSOR_TYPES: dict[str, WallboxSensorEntityDescription] = {
     # )
 }
 
-SENSOR_TYPES = SENSOR_TYPES | OBIS_SENSORS
+
+@cache
+def get_sensor_types() -> dict[str, WallboxSensorEntityDescription]:
+    """Return every sensor description, loading the OBIS catalog on first use."""
+    started = time.perf_counter()
+    from .obis_sensors import OBIS_SENSORS
+
+    LOAD_TIMES_MS["obis_sensors"] = round((time.perf_counter() - started) * 1000, 2)
+    return SENSOR_TYPES | OBIS_SENSORS
+
+
+BREAKER_SENSOR = WallboxSensorEntityDescription(
+    key=CONF_BREAKER_KEY,
+    name="Circuit Breaker",
+    icon="mdi:lan-disconnect",
+    device_class=SensorDeviceClass.ENUM,
+    options=[BREAKER_CLOSED, BREAKER_HALF_OPEN, BREAKER_OPEN],
+    entity_category=EntityCategory.DIAGNOSTIC,
+)
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
     """Create wallbox sensor entities in HASS."""
     coordinator: WallboxCoordinator = hass.data[DOMAIN][entry.entry_id]
+    sensor_types = await hass.async_add_import_executor_job(get_sensor_types)
+    coordinator.precision.update(
+        {
+            key: description.precision
+            for key, description in sensor_types.items()
+            if description.precision is not None
+        }
+    )
 
-    async_add_entities(
-        [
-            WallboxSensor(coordinator, entry, description)
-            for ent in coordinator.data[CONF_DATA_KEY]
-            if (description := SENSOR_TYPES.get(ent))
-        ]
+    if coordinator.breaker is not None:
+        async_add_entities([WallboxBreakerSensor(coordinator, entry, BREAKER_SENSOR)])
+    async_setup_entity_discovery(
+        coordinator,
+        entry,
+        sensor_types,
+        lambda description: WallboxSensor(coordinator, entry, description),
+        async_add_entities,
     )
 
 
@@ -1040,23 +215,15 @@ class WallboxSensor(WallboxEntity, SensorEntity):
         description: WallboxSensorEntityDescription,
     ) -> None:
         """Initialize a Wallbox sensor."""
-        super().__init__(coordinator)
-        self.entity_description = description
-        self._attr_name = f"{entry.title} {description.name}"
-        self._attr_unique_id = f"{description.key}-{coordinator.data[CONF_DATA_KEY][CONF_SERIAL_NUMBER_KEY]}"
+        super().__init__(coordinator, entry, description)
+        self._attr_native_value = self._value(coordinator.data)
 
-    @property
-    def native_value(self) -> StateType:
-        """Return the state of the sensor."""
-        if (sensor_round := self.entity_description.precision) is not None:
-            return cast(
-                StateType,
-                round(self.coordinator.data[CONF_DATA_KEY][self.entity_description.key], sensor_round),
-            )
-        return cast(
-                StateType,
-                round(self.coordinator.data[CONF_DATA_KEY][self.entity_description.key], 2)
-            )
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        # Values are already converted and rounded at ingest.
+        self._attr_native_value = self._value(self.coordinator.data)
+        self.async_write_ha_state()
 
     # def update(self) -> None:
     #     if (sensor_round := self.entity_description.precision) is not None:
@@ -1068,3 +235,43 @@ class WallboxSensor(WallboxEntity, SensorEntity):
     #             StateType,
     #             round(self.coordinator.data[CONF_DATA_KEY][self.entity_description.key], 2)
     #         )
+
+
+class WallboxBreakerSensor(WallboxEntity, SensorEntity):
+    """Diagnostic sensor for the circuit breaker of the station's host."""
+
+    entity_description: WallboxSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: WallboxCoordinator,
+        entry: ConfigEntry,
+        description: WallboxSensorEntityDescription,
+    ) -> None:
+        """Initialize a circuit breaker sensor."""
+        super().__init__(coordinator, entry, description)
+
+    @property
+    def available(self) -> bool:
+        """Stay available while the charger is unreachable."""
+        return True
+
+    @property
+    def native_value(self) -> str:
+        """Return the state of the circuit breaker."""
+        return self.coordinator.breaker.state
+
+    @property
+    def extra_state_attributes(self) -> dict[str, int]:
+        """Return the failure counters of the circuit breaker."""
+        return {
+            "failures": self.coordinator.breaker.failures,
+            "trips": self.coordinator.breaker.trips,
+        }
+
+    async def async_added_to_hass(self) -> None:
+        """Write the state whenever the circuit breaker changes."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.breaker.async_add_listener(self.async_write_ha_state)
+        )
@@ -0,0 +1,419 @@
+"""Integration services of the Wallbox integration."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import timedelta
+import logging
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import ATTR_DEVICE_ID
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv, device_registry as dr
+from homeassistant.util import dt as dt_util, slugify
+
+from . import STATION_ERRORS, WallboxCoordinator
+from .const import (
+    ATTR_COMMAND,
+    ATTR_END,
+    ATTR_FORMAT,
+    ATTR_KIND,
+    ATTR_KEYS,
+    ATTR_MERGE,
+    ATTR_POINTS,
+    ATTR_START,
+    ATTR_VALUE,
+    BALANCER_MIN_CURRENT,
+    COMMAND_AI_MODE,
+    COMMAND_CHARGING_CURRENT,
+    COMMAND_CHARGING_MODE,
+    COMMAND_LOCK,
+    CONF_AI_MODE_KEY,
+    CONF_BASEURL,
+    CONF_CURRENT_MODE_KEY,
+    CONF_LOCKED_UNLOCKED_KEY,
+    CONF_MAN_CHARGING_CURRENT_KEY,
+    DATA_SAMPLE_HISTORY,
+    DOMAIN,
+    EXPORT_FORMAT_CSV,
+    EXPORT_FORMATS,
+    EXPORT_KIND_SESSIONS,
+    EXPORT_KINDS,
+    SAMPLE_HISTORY_POINTS,
+    SERVICE_BULK_COMMAND,
+    SERVICE_EXPORT,
+    SERVICE_QUERY_HISTORY,
+    SERVICE_READ_VALUES,
+)
+from .decode import CHARGE_CONTROL_FIELDS, OBIS_FIELDS
+from .executor import host_key
+from .export import export
+
+if TYPE_CHECKING:
+    from .sample_history import SampleHistory
+
+_LOGGER = logging.getLogger(__name__)
+
+# Command -> (value validator, write without read-back, key the write changes).
+COMMANDS: dict[
+    str,
+    tuple[
+        Callable[[Any], Any],
+        Callable[[WallboxCoordinator, Any], Awaitable[None]],
+        str,
+    ],
+] = {
+    COMMAND_CHARGING_CURRENT: (
+        vol.All(vol.Coerce(float), vol.Range(min=BALANCER_MIN_CURRENT)),
+        lambda coordinator, value: coordinator.async_set_charging_current(
+            value, refresh=False
+        ),
+        CONF_MAN_CHARGING_CURRENT_KEY,
+    ),
+    COMMAND_CHARGING_MODE: (
+        cv.string,
+        lambda coordinator, value: coordinator.async_set_charging_mode(
+            value, refresh=False
+        ),
+        CONF_CURRENT_MODE_KEY,
+    ),
+    COMMAND_LOCK: (
+        cv.boolean,
+        lambda coordinator, value: coordinator.async_set_lock_unlock(
+            value, refresh=False
+        ),
+        CONF_LOCKED_UNLOCKED_KEY,
+    ),
+    COMMAND_AI_MODE: (
+        cv.boolean,
+        lambda coordinator, value: coordinator.aysnc_set_start_stop_mode(
+            value, refresh=False
+        ),
+        CONF_AI_MODE_KEY,
+    ),
+}
+
+BULK_COMMAND_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_DEVICE_ID, default=[]): vol.All(cv.ensure_list, [cv.string]),
+        vol.Required(ATTR_COMMAND): vol.In(COMMANDS),
+        vol.Required(ATTR_VALUE): cv.match_all,
+    }
+)
+
+READ_VALUES_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_DEVICE_ID): vol.All(cv.ensure_list, [cv.string]),
+        vol.Required(ATTR_KEYS): vol.All(
+            cv.ensure_list,
+            [vol.In([*CHARGE_CONTROL_FIELDS, CONF_AI_MODE_KEY, *OBIS_FIELDS])],
+        ),
+        vol.Optional(ATTR_MERGE, default=False): cv.boolean,
+    }
+)
+
+QUERY_HISTORY_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_DEVICE_ID): vol.All(cv.ensure_list, [cv.string]),
+        vol.Required(ATTR_KEYS): vol.All(cv.ensure_list, [vol.In(OBIS_FIELDS)]),
+        vol.Optional(ATTR_START): cv.datetime,
+        vol.Optional(ATTR_END): cv.datetime,
+        vol.Optional(ATTR_POINTS, default=SAMPLE_HISTORY_POINTS): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=5000)
+        ),
+    }
+)
+
+EXPORT_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_DEVICE_ID): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(ATTR_KIND, default=EXPORT_KIND_SESSIONS): vol.In(EXPORT_KINDS),
+        vol.Optional(ATTR_FORMAT, default=EXPORT_FORMAT_CSV): vol.In(EXPORT_FORMATS),
+        vol.Optional(ATTR_KEYS): vol.All(cv.ensure_list, [vol.In(OBIS_FIELDS)]),
+        vol.Required(ATTR_START): cv.datetime,
+        vol.Optional(ATTR_END): cv.datetime,
+    }
+)
+
+
+@callback
+def async_get_stations(
+    hass: HomeAssistant, device_ids: list[str]
+) -> list[tuple[ConfigEntry, WallboxCoordinator]]:
+    """Return the loaded stations of devices, every loaded station if none."""
+    coordinators: dict[str, WallboxCoordinator] = hass.data.get(DOMAIN, {})
+    if device_ids:
+        registry = dr.async_get(hass)
+        entry_ids: set[str] = set()
+        for device_id in device_ids:
+            if (device := registry.async_get(device_id)) is None or not (
+                device.config_entries & coordinators.keys()
+            ):
+                raise ServiceValidationError(f"{device_id} is not a loaded station")
+            entry_ids |= device.config_entries & coordinators.keys()
+    else:
+        entry_ids = set(coordinators)
+    return [
+        (entry, coordinators[entry.entry_id])
+        for entry in hass.config_entries.async_entries(DOMAIN)
+        if entry.entry_id in entry_ids
+    ]
+
+
+def _station_error(coordinator: WallboxCoordinator, command: str, value: Any) -> str | None:
+    """Return why a station cannot take a command value, None if it can."""
+    if (data := coordinator.data) is None:
+        return None
+    if command == COMMAND_CHARGING_MODE and value not in data.charging_modes:
+        return f"Unsupported charging mode {value}"
+    if (
+        command == COMMAND_CHARGING_CURRENT
+        and data.chargecontrol is not None
+        and (maximum := data.chargecontrol.supplylinemaxamp) is not None
+        and value > maximum
+    ):
+        return f"Charging current {value} A is above the supply line maximum of {maximum} A"
+    return None
+
+
+async def _async_read_back(
+    written: list[tuple[ConfigEntry, WallboxCoordinator]], key: str
+) -> None:
+    """Read the key a command wrote back from the written stations of one host.
+
+    The charge control fields of every station of a host come with one read
+    of the host. The AI mode is only served per station, so it is read from
+    each written station in turn.
+    """
+    try:
+        if key == CONF_AI_MODE_KEY or written[0][1].transport is not None:
+            for _, coordinator in written:
+                await coordinator.async_read_values([key], merge=True)
+            return
+        statuses = await written[0][1].async_read_host_statuses()
+    except STATION_ERRORS as err:
+        # The writes went through, the next poll reads the stations back.
+        _LOGGER.debug("Read-back of %s failed: %r", written[0][0].title, err)
+        return
+    for _, coordinator in written:
+        coordinator.async_merge_host_statuses(statuses)
+
+
+async def _async_command_host(
+    stations: list[tuple[ConfigEntry, WallboxCoordinator]],
+    command: str,
+    value: Any,
+) -> dict[str, dict[str, Any]]:
+    """Write to the stations of one host in turn, then read them back once.
+
+    The read-back covers only the key the command wrote, instead of a full
+    refresh of every station competing for the pool of the host.
+    """
+    _, write, key = COMMANDS[command]
+    results: dict[str, dict[str, Any]] = {}
+    written: list[tuple[ConfigEntry, WallboxCoordinator]] = []
+    for entry, coordinator in stations:
+        try:
+            if error := _station_error(coordinator, command, value):
+                raise ServiceValidationError(error)
+            await write(coordinator, value)
+        except STATION_ERRORS as err:
+            _LOGGER.debug("Command on %s failed: %r", entry.title, err)
+            results[entry.entry_id] = {
+                "station": entry.title,
+                "success": False,
+                "error": str(err) or type(err).__name__,
+            }
+            continue
+        written.append((entry, coordinator))
+        results[entry.entry_id] = {"station": entry.title, "success": True}
+    if written:
+        await _async_read_back(written, key)
+    return results
+
+
+async def _async_bulk_command(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Run one command on many stations, concurrently across hosts."""
+    command = call.data[ATTR_COMMAND]
+    validate, _, _ = COMMANDS[command]
+    try:
+        value = validate(call.data[ATTR_VALUE])
+    except vol.Invalid as err:
+        raise ServiceValidationError(f"Invalid value: {err}") from err
+
+    hosts: dict[str, list[tuple[ConfigEntry, WallboxCoordinator]]] = {}
+    for entry, coordinator in async_get_stations(hass, call.data[ATTR_DEVICE_ID]):
+        hosts.setdefault(host_key(entry.data[CONF_BASEURL]), []).append(
+            (entry, coordinator)
+        )
+    results: dict[str, dict[str, Any]] = {}
+    for host_results in await asyncio.gather(
+        *(_async_command_host(stations, command, value) for stations in hosts.values())
+    ):
+        results |= host_results
+    return {"results": results}
+
+
+async def _async_read_station(
+    entry: ConfigEntry, coordinator: WallboxCoordinator, keys: list[str], merge: bool
+) -> dict[str, Any]:
+    """Read values of one station with the time they were read."""
+    try:
+        values = await coordinator.async_read_values(keys, merge)
+    except STATION_ERRORS as err:
+        return {"station": entry.title, "error": str(err) or type(err).__name__}
+    return {
+        "station": entry.title,
+        "timestamp": dt_util.utcnow().isoformat(),
+        "values": values,
+    }
+
+
+async def _async_read_values(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Read values of stations right away, without refreshing them."""
+    stations = async_get_stations(hass, call.data[ATTR_DEVICE_ID])
+    keys = list(dict.fromkeys(call.data[ATTR_KEYS]))
+    results = await asyncio.gather(
+        *(
+            _async_read_station(entry, coordinator, keys, call.data[ATTR_MERGE])
+            for entry, coordinator in stations
+        )
+    )
+    return {
+        "results": {
+            entry.entry_id: result for (entry, _), result in zip(stations, results)
+        }
+    }
+
+
+@callback
+def _async_get_sample_history(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> SampleHistory | None:
+    """Return the sample history of an entry, without importing its module."""
+    if (recorder := hass.data.get(DATA_SAMPLE_HISTORY, {}).get(entry.entry_id)) is None:
+        return None
+    return recorder.history
+
+
+async def _async_query_history(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Return the downsampled sample history of stations for a time range."""
+    end = dt_util.as_utc(call.data.get(ATTR_END) or dt_util.utcnow())
+    start = dt_util.as_utc(call.data.get(ATTR_START) or end - timedelta(hours=1))
+    if start >= end:
+        raise ServiceValidationError("The start must be before the end")
+    keys = list(dict.fromkeys(call.data[ATTR_KEYS]))
+    results: dict[str, dict[str, Any]] = {}
+    for entry, _ in async_get_stations(hass, call.data[ATTR_DEVICE_ID]):
+        if (history := _async_get_sample_history(hass, entry)) is None:
+            results[entry.entry_id] = {
+                "station": entry.title,
+                "error": "Sample history is disabled",
+            }
+            continue
+        samples = await hass.async_add_executor_job(
+            history.query,
+            keys,
+            start.timestamp(),
+            end.timestamp(),
+            call.data[ATTR_POINTS],
+        )
+        results[entry.entry_id] = {
+            "station": entry.title,
+            "start": [
+                dt_util.utc_from_timestamp(moment).isoformat()
+                for moment in samples["start"]
+            ],
+            "series": samples["series"],
+        }
+    return {"results": results}
+
+
+async def _async_export(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Export sessions or samples of stations to files in the config directory."""
+    start = dt_util.as_utc(call.data[ATTR_START])
+    end = dt_util.as_utc(call.data.get(ATTR_END) or dt_util.utcnow())
+    if start >= end:
+        raise ServiceValidationError("The start must be before the end")
+    kind, file_format = call.data[ATTR_KIND], call.data[ATTR_FORMAT]
+    results: dict[str, dict[str, Any]] = {}
+    for entry, coordinator in async_get_stations(hass, call.data[ATTR_DEVICE_ID]):
+        if (history := _async_get_sample_history(hass, entry)) is None:
+            results[entry.entry_id] = {
+                "station": entry.title,
+                "error": "Sample history is disabled",
+            }
+            continue
+        codes = list(
+            dict.fromkeys(call.data.get(ATTR_KEYS) or ())
+        ) or [code for code in OBIS_FIELDS if code in coordinator.profile_codes]
+        path = hass.config.path(
+            DOMAIN,
+            "exports",
+            f"{slugify(entry.title)}_{entry.entry_id}_{kind}"
+            f"_{start:%Y%m%dT%H%M}_{end:%Y%m%dT%H%M}.{file_format}",
+        )
+        rows = await hass.async_add_executor_job(
+            export, history, path, kind, file_format, codes, start, end
+        )
+        results[entry.entry_id] = {"station": entry.title, "path": path, "rows": rows}
+    return {"results": results}
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the services of the integration."""
+
+    async def _async_handle_bulk_command(call: ServiceCall) -> ServiceResponse:
+        return await _async_bulk_command(hass, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_BULK_COMMAND,
+        _async_handle_bulk_command,
+        schema=BULK_COMMAND_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    async def _async_handle_read_values(call: ServiceCall) -> ServiceResponse:
+        return await _async_read_values(hass, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_READ_VALUES,
+        _async_handle_read_values,
+        schema=READ_VALUES_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    async def _async_handle_query_history(call: ServiceCall) -> ServiceResponse:
+        return await _async_query_history(hass, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_QUERY_HISTORY,
+        _async_handle_query_history,
+        schema=QUERY_HISTORY_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+    async def _async_handle_export(call: ServiceCall) -> ServiceResponse:
+        return await _async_export(hass, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_EXPORT,
+        _async_handle_export,
+        schema=EXPORT_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
@@ -0,0 +1,86 @@
+"""Immutable, versioned station snapshots for the Wallbox integration."""
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, fields, replace
+from functools import cache
+from operator import attrgetter
+from typing import Any
+
+from .const import CONF_AI_MODE_KEY, CONF_CHARGING_MODES_KEY
+from .decode import OBIS_FIELDS, ChargeControl, MeterInfo
+
+
+@dataclass(frozen=True, slots=True)
+class WallboxSnapshot:
+    """State of a station after one refresh.
+
+    Snapshots are never mutated. A new version shares every section that did
+    not change with its predecessor, so keeping old versions around is cheap
+    and unchanged sections can be detected by identity.
+    """
+
+    version: int
+    serial: str
+    model: str | None
+    system: Mapping[str, Any]
+    meter: MeterInfo
+    chargecontrol: ChargeControl | None = None
+    ai_mode: Any = None
+    charging_modes: tuple[str, ...] = ()
+
+    def evolve(self, **changes: Any) -> WallboxSnapshot:
+        """Return the next version with some sections replaced.
+
+        Sections equal to the current ones keep the existing object, and if
+        nothing changed at all the snapshot itself is returned.
+        """
+        changes = {
+            name: value
+            for name, value in changes.items()
+            if value is not getattr(self, name) and value != getattr(self, name)
+        }
+        if not changes:
+            return self
+        return replace(self, version=self.version + 1, **changes)
+
+    def changed(self, other: WallboxSnapshot | None) -> set[str]:
+        """Return the sections that differ from another version."""
+        if other is None:
+            return set(SNAPSHOT_SECTIONS)
+        return {
+            name
+            for name in SNAPSHOT_SECTIONS
+            if getattr(self, name) is not getattr(other, name)
+        }
+
+    def value(self, key: str) -> Any:
+        """Return a charge control field, OBIS value, AI mode or charging modes."""
+        return accessor_for_key(key)(self)
+
+    def keys(self) -> list[str]:
+        """Return every key the station currently reports."""
+        keys: list[str] = []
+        if self.chargecontrol is not None:
+            keys += self.chargecontrol.keys()
+            keys.append(CONF_CHARGING_MODES_KEY)
+        if self.ai_mode is not None:
+            keys.append(CONF_AI_MODE_KEY)
+        return keys + self.meter.data.keys()
+
+
+SNAPSHOT_SECTIONS: tuple[str, ...] = tuple(
+    field.name for field in fields(WallboxSnapshot) if field.name != "version"
+)
+
+
+@cache
+def accessor_for_key(key: str) -> Callable[[WallboxSnapshot], Any]:
+    """Return a precompiled getter reading a data key from any snapshot."""
+    if (attr := OBIS_FIELDS.get(key)) is not None:
+        return attrgetter(f"meter.data.{attr}")
+    if key == CONF_AI_MODE_KEY:
+        return attrgetter("ai_mode")
+    if key == CONF_CHARGING_MODES_KEY:
+        return attrgetter("charging_modes")
+    return attrgetter(f"chargecontrol.{key}")
@@ -0,0 +1,302 @@
+"""PV surplus charging for the Wallbox integration."""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Callable
+from dataclasses import replace
+from datetime import timedelta
+import logging
+import math
+import time
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import UnitOfPower
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.event import (
+    async_track_state_change_event,
+    async_track_time_interval,
+)
+
+from . import STATION_ERRORS
+from .balancer import latency_metrics, phase_draw
+from .const import (
+    BALANCER_MIN_CURRENT,
+    BALANCER_MIN_STEP,
+    CONF_SURPLUS,
+    CONF_SURPLUS_PHASES,
+    CONF_SURPLUS_SENSOR,
+    DATA_BALANCER,
+    DATA_SURPLUS,
+    SURPLUS_HYSTERESIS,
+    SURPLUS_INTERVAL,
+    SURPLUS_LATENCY_SAMPLES,
+    SURPLUS_START_DELAY,
+    SURPLUS_STOP_DELAY,
+    SURPLUS_VOLTAGE,
+    SURPLUS_WRITE_INTERVAL,
+)
+from .obis import (
+    OBIS_ACTIVE_POWER_MINUS,
+    OBIS_ACTIVE_POWER_PLUS,
+    OBIS_CURRENT_L1,
+    OBIS_CURRENT_L2,
+    OBIS_CURRENT_L3,
+)
+
+if TYPE_CHECKING:
+    from . import WallboxCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+# Read by the fast loop when no external grid sensor is configured.
+SURPLUS_CODES = frozenset(
+    {
+        OBIS_ACTIVE_POWER_PLUS,
+        OBIS_ACTIVE_POWER_MINUS,
+        OBIS_CURRENT_L1,
+        OBIS_CURRENT_L2,
+        OBIS_CURRENT_L3,
+    }
+)
+
+
+class SurplusController:
+    """Follow the PV surplus with the charging current of one station.
+
+    The grid power (positive import, negative export) comes either from the
+    meter of the station, read on a fast loop of its own, or from a power
+    sensor of Home Assistant, followed on every state change. Charging starts
+    once the surplus covers the minimum current plus the hysteresis for
+    SURPLUS_START_DELAY and pauses once it stays below the minimum minus the
+    hysteresis for SURPLUS_STOP_DELAY, by locking the station. Lower setpoints
+    are written at once, higher ones at most every SURPLUS_WRITE_INTERVAL.
+    Nothing is read or written while the circuit breaker of the host is open.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        key: str,
+        coordinator: WallboxCoordinator,
+        sensor: str | None = None,
+        phases: int = 3,
+    ) -> None:
+        """Initialize."""
+        self._hass = hass
+        self._key = key
+        self._coordinator = coordinator
+        self.sensor = sensor
+        self.phases = phases
+        self.setpoint: float | None = None
+        self._written = -math.inf
+        self._above_since: float | None = None
+        self._below_since: float | None = None
+        self._unsubscribe: Callable[[], None] | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._latency_ms: deque[float] = deque(maxlen=SURPLUS_LATENCY_SAMPLES)
+        self._samples = 0
+        self._writes = 0
+        self._deferred = 0
+        self._failed = 0
+
+    @callback
+    def async_start(self) -> None:
+        """Start following the grid power."""
+        if self.sensor:
+            self._unsubscribe = async_track_state_change_event(
+                self._hass, [self.sensor], self._async_sensor_changed
+            )
+        else:
+            self._unsubscribe = async_track_time_interval(
+                self._hass,
+                self._async_tick,
+                timedelta(seconds=SURPLUS_INTERVAL),
+                cancel_on_shutdown=True,
+            )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop following the grid power, leaving the last setpoint in place."""
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+            self._unsubscribe = None
+        if self._task is not None:
+            self._task.cancel()
+        self._coordinator.current_caps.pop(CONF_SURPLUS, None)
+        if CONF_SURPLUS in self._coordinator.paused_by:
+            self._hass.async_create_task(self._coordinator.async_resume(CONF_SURPLUS))
+
+    @callback
+    def _async_run(self, grid_power: float, draw: float | None, sampled: float) -> None:
+        """Control on a sample unless the previous one is still being written."""
+        if not self._coordinator.reachable or (
+            self._task is not None and not self._task.done()
+        ):
+            return
+        self._task = self._hass.async_create_task(
+            self._async_control(grid_power, draw, sampled)
+        )
+
+    @callback
+    def _async_sensor_changed(self, event: Event) -> None:
+        """Control on a new state of the grid power sensor."""
+        sampled = time.monotonic()
+        if (state := event.data.get("new_state")) is None:
+            return
+        try:
+            grid_power = float(state.state)
+        except ValueError:
+            return
+        if state.attributes.get("unit_of_measurement") == UnitOfPower.KILO_WATT:
+            grid_power *= 1000
+        data = self._coordinator.data
+        self._async_run(grid_power, data and phase_draw(data.meter.data), sampled)
+
+    async def _async_tick(self, _now: Any = None) -> None:
+        """Read the meter of the station and control on it."""
+        if not self._coordinator.reachable or (
+            self._task is not None and not self._task.done()
+        ):
+            return
+        sampled = time.monotonic()
+        try:
+            data = await self._coordinator.async_read_meter_values(SURPLUS_CODES)
+        except STATION_ERRORS as err:
+            self._failed += 1
+            _LOGGER.debug("Reading the surplus of %s failed: %r", self._key, err)
+            return
+        if data.active_power_plus is None or data.active_power_minus is None:
+            return
+        self._async_run(
+            data.active_power_plus - data.active_power_minus, phase_draw(data), sampled
+        )
+
+    def target(self, grid_power: float, draw: float) -> float:
+        """Return the current the surplus allows at a draw, in amperes."""
+        return draw - grid_power / (SURPLUS_VOLTAGE * self.phases)
+
+    async def _async_control(
+        self, grid_power: float, draw: float | None, sampled: float
+    ) -> None:
+        """Derive the setpoint from one grid power sample and write it if due."""
+        self._samples += 1
+        coordinator = self._coordinator
+        control = coordinator.data.chargecontrol if coordinator.data else None
+        if control is None or not control.connected:
+            self._above_since = self._below_since = None
+            return
+        now = time.monotonic()
+        maximum = control.supplylinemaxamp or BALANCER_MIN_CURRENT
+        setpoint = self.setpoint
+        if setpoint is None:
+            setpoint = control.manualmodeamp if control.currentpwmamp else 0.0
+        # Without phase currents the car is assumed to draw its setpoint.
+        target = self.target(grid_power, setpoint if draw is None else draw)
+
+        current: float | None = None
+        if not setpoint:
+            self._below_since = None
+            if target < BALANCER_MIN_CURRENT + SURPLUS_HYSTERESIS:
+                self._above_since = None
+            elif self._above_since is None:
+                self._above_since = now
+            elif now - self._above_since >= SURPLUS_START_DELAY:
+                current = min(math.floor(target), maximum)
+        else:
+            self._above_since = None
+            if target >= BALANCER_MIN_CURRENT - SURPLUS_HYSTERESIS:
+                self._below_since = None
+                current = max(min(math.floor(target), maximum), BALANCER_MIN_CURRENT)
+            elif self._below_since is None:
+                self._below_since = now
+                current = BALANCER_MIN_CURRENT
+            elif now - self._below_since >= SURPLUS_STOP_DELAY:
+                current = 0
+            else:
+                current = BALANCER_MIN_CURRENT
+
+        if current is None:
+            return
+        # Other controllers, like demand response, may hold the current lower.
+        for source, cap in coordinator.current_caps.items():
+            if source != CONF_SURPLUS:
+                current = min(current, cap)
+        # The station takes no current below the minimum, so it pauses.
+        if current < BALANCER_MIN_CURRENT:
+            current = 0
+        if abs(current - setpoint) < BALANCER_MIN_STEP:
+            return
+        if current > setpoint and now - self._written < SURPLUS_WRITE_INTERVAL:
+            self._deferred += 1
+            return
+        current = float(current)
+        balancer = self._hass.data.get(DATA_BALANCER)
+        if balancer is not None and balancer.is_member(self._key):
+            # The site balancer writes, the surplus only caps its share.
+            coordinator.current_caps[CONF_SURPLUS] = current
+            balancer.async_request_cycle()
+        else:
+            try:
+                if current:
+                    await coordinator.async_set_charging_current(current, refresh=False)
+                await coordinator.async_pause(CONF_SURPLUS, not current)
+            except STATION_ERRORS as err:
+                self._failed += 1
+                _LOGGER.warning("Setting %s A on %s failed: %r", current, self._key, err)
+                return
+            if current and (control := coordinator.data.chargecontrol) is not None:
+                coordinator.async_set_optimistic(
+                    chargecontrol=replace(control, manualmodeamp=current)
+                )
+        self.setpoint = current
+        self._written = time.monotonic()
+        self._writes += 1
+        self._latency_ms.append(round((self._written - sampled) * 1000, 1))
+
+    @property
+    def metrics(self) -> dict[str, Any]:
+        """Return the setpoint, counters and sample to write latency."""
+        return {
+            "source": self.sensor or "meter",
+            "setpoint": self.setpoint,
+            "samples": self._samples,
+            "writes": self._writes,
+            "deferred": self._deferred,
+            "failed": self._failed,
+            "latency_ms": latency_metrics(self._latency_ms),
+        }
+
+
+@callback
+def async_apply_surplus(
+    hass: HomeAssistant, entry: ConfigEntry, coordinator: WallboxCoordinator
+) -> None:
+    """Start, restart or stop the surplus controller of an entry per its options."""
+    controllers: dict[str, SurplusController] = hass.data.setdefault(DATA_SURPLUS, {})
+    if (controller := controllers.pop(entry.entry_id, None)) is not None:
+        controller.async_stop()
+    if not entry.options.get(CONF_SURPLUS):
+        return
+    controller = controllers[entry.entry_id] = SurplusController(
+        hass,
+        entry.entry_id,
+        coordinator,
+        entry.options.get(CONF_SURPLUS_SENSOR),
+        int(entry.options.get(CONF_SURPLUS_PHASES, 3)),
+    )
+    controller.async_start()
+
+
+@callback
+def async_stop_surplus(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Stop the surplus controller of an entry."""
+    if (controller := hass.data.get(DATA_SURPLUS, {}).pop(entry.entry_id, None)) is not None:
+        controller.async_stop()
+
+
+@callback
+def async_get_surplus(hass: HomeAssistant, entry: ConfigEntry) -> SurplusController | None:
+    """Return the surplus controller of an entry, None if it is disabled."""
+    return hass.data.get(DATA_SURPLUS, {}).get(entry.entry_id)
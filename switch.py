@@ -20,14 +20,14 @@ from homeassistant.helpers.update_coordinator import (
     UpdateFailed,
 )
 
-from . import WallboxCoordinator, WallboxEntity
+from . import WallboxCoordinator, WallboxEntity, async_setup_entity_discovery
 from .const import *
 
 #UPDATE_INTERVAL = 30
 
 _LOGGER = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(frozen=True)
 class WallboxSwitchEntityDescription(SwitchEntityDescription):
     device_class: SwitchDeviceClass | str | None = None
 
@@ -46,12 +46,12 @@ async def async_setup_entry(
     """Create wallbox switch entities in HASS."""
     coordinator: WallboxCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    async_add_entities(
-        [
-            WallboxSwitch(coordinator, entry, description)
-            for ent in coordinator.data
-            if (description := SWITCH_TYPES.get(ent))
-        ]
+    async_setup_entity_discovery(
+        coordinator,
+        entry,
+        SWITCH_TYPES,
+        lambda description: WallboxSwitch(coordinator, entry, description),
+        async_add_entities,
     )
 
 class WallboxSwitch(WallboxEntity, SwitchEntity):
@@ -65,41 +65,23 @@ class WallboxSwitch(WallboxEntity, SwitchEntity):
     ) -> None:
         """Initialize a Wallbox switch."""
 
-        super().__init__(coordinator)
-        self.entity_description = description
-        self._attr_name = f"{entry.title} {description.name}"
-        self._attr_is_on = coordinator.data[self.entity_description.key]
-        self._attr_unique_id = f"{description.key}-{coordinator.data[CONF_DATA_KEY][CONF_SERIAL_NUMBER_KEY]}"
-
-    @property
-    def is_on(self) -> bool:
-        """Return the state of the switch."""
-        return self.coordinator.data[self.entity_description.key]
-
-    def turn_on(self) -> None:
-        if self.entity_description.key == "autostartstop":
-            self.coordinator.data[self.entity_description.key] = True
-            self.coordinator.aysnc_set_start_stop_mode(bool(1))
+        super().__init__(coordinator, entry, description)
+        self._attr_is_on = self._value(coordinator.data)
 
     async def async_turn_on(self) -> None:
         if self.entity_description.key == "autostartstop":
-            self.coordinator.data[self.entity_description.key] = True
+            self.coordinator.async_set_optimistic(ai_mode=True)
             await self.coordinator.aysnc_set_start_stop_mode(bool(1))
 
-    def turn_off(self) -> None:
-        if self.entity_description.key == "autostartstop":
-            self.coordinator.data[self.entity_description.key] = False
-            self.coordinator.aysnc_set_start_stop_mode(bool(0))
-
     async def async_turn_off(self) -> None:
         if self.entity_description.key == "autostartstop":
-            self.coordinator.data[self.entity_description.key] = False
+            self.coordinator.async_set_optimistic(ai_mode=False)
             await self.coordinator.aysnc_set_start_stop_mode(bool(0))
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        self._attr_is_on = self.coordinator.data[self.entity_description.key]
+        self._attr_is_on = self._value(self.coordinator.data)
         self.async_write_ha_state()
     # def update(self) -> str | None:
     #     _LOGGER.log(20, "update called")
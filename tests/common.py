@@ -0,0 +1,106 @@
+"""Helpers for the Wallbox integration tests."""
+from __future__ import annotations
+
+import importlib
+from types import ModuleType
+from typing import Any
+
+DOMAIN = "ha-eCB1"
+
+CHARGING_MODES = {"1": "eco", "2": "quick", "3": "manual"}
+
+
+def integration_module(name: str = "") -> ModuleType:
+    """Return a module of the integration, the package itself by default."""
+    return importlib.import_module(
+        f"custom_components.{DOMAIN}{'.' + name if name else ''}"
+    )
+
+
+class FakeWallbox:
+    """Stand-in for the Wallbox API client of one eCB1."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.baseUrl = "http://eCB1/"
+        self.headers: dict[str, str] = {}
+        self.calls: list[str] = []
+        self.set_values: list[float] = []
+        # Overrides of the charge control status and the meter values.
+        self.control: dict[str, Any] = {}
+        self.meter: dict[str, float] = {}
+        self.ai_mode: dict[int, bool] = {}
+        # Stations set up on this eCB1.
+        self.stations: set[int] = set()
+
+    def authenticate(self) -> bool:
+        """Authenticate."""
+        return True
+
+    def _status(self, station: int) -> dict[str, Any]:
+        """Return the raw charge control fields of a station."""
+        return {
+            "id": station,
+            "type": "eCB1",
+            "connected": "false",
+            "stateid": "194",
+            "mode": "manual",
+            "manualmodeamp": 16,
+            "supplylinemaxamp": 32,
+            "currentpwmamp": 0,
+            **self.control,
+        }
+
+    def getChargerStatus(self, station: int) -> dict[str, Any]:
+        """Return the charge control status of a station."""
+        self.calls.append("status")
+        return {"chargecontrol": self._status(station)}
+
+    def getChargeControls(self) -> dict[str, Any]:
+        """Return the charge control status of every station."""
+        self.calls.append("statuses")
+        return {
+            "chargecontrols": [self._status(station) for station in sorted(self.stations)]
+        }
+
+    def getAutoStartStopMode(self, station: int) -> dict[str, Any]:
+        """Return the AI mode of a station."""
+        self.calls.append("ai")
+        return {"autostartstop": self.ai_mode.get(station, False)}
+
+    def getSystemInformation(self) -> dict[str, Any]:
+        """Return the system information."""
+        self.calls.append("system")
+        return {"serial": "123", "company": "Hardy Barth", "os_version": "1.0"}
+
+    def getChargingModes(self) -> dict[str, str]:
+        """Return the charging modes."""
+        return CHARGING_MODES
+
+    def getMetersData(self, station: int) -> dict[str, Any]:
+        """Return the meter of a station."""
+        self.calls.append("meters")
+        return {"meter": {"name": "meter", "type": "EM", "data": dict(self.meter)}}
+
+    def setMaxChargingCurrent(self, station: int, value: float) -> None:
+        """Set the charging current."""
+        self.calls.append("set")
+        self.set_values.append(value)
+        self.control["manualmodeamp"] = value
+
+    def lockCharger(self, station: int) -> None:
+        """Lock the station."""
+        self.calls.append("lock")
+
+    def unlockCharger(self, station: int) -> None:
+        """Unlock the station."""
+        self.calls.append("unlock")
+
+    def setChargingMode(self, station: int, mode: str) -> None:
+        """Set the charging mode."""
+        self.calls.append("mode")
+
+    def setAutoStartStopMode(self, station: int, value: bool) -> None:
+        """Set the AI mode."""
+        self.calls.append("ai_set")
+        self.ai_mode[station] = value
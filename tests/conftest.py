@@ -0,0 +1,89 @@
+"""Fixtures for the Wallbox integration tests.
+
+The repository root is the integration itself, so it is linked into a
+temporary custom_components directory for Home Assistant to load it.
+"""
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+from typing import Any
+
+import orjson
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from common import DOMAIN, FakeWallbox, integration_module
+
+_ROOT = tempfile.mkdtemp(prefix="ha-ecb1-tests-")
+os.makedirs(os.path.join(_ROOT, "custom_components"))
+os.symlink(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    os.path.join(_ROOT, "custom_components", DOMAIN),
+)
+sys.path.insert(0, _ROOT)
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations: None) -> None:
+    """Enable the integration in every test."""
+
+
+@pytest.fixture
+def wallboxes(monkeypatch: pytest.MonkeyPatch) -> dict[str, FakeWallbox]:
+    """Serve every base url with a fake eCB1 instead of the network."""
+    module = integration_module()
+    boxes: dict[str, FakeWallbox] = {}
+
+    def _get_raw(coordinator: Any, path: str) -> bytes:
+        wallbox = coordinator._wallbox
+        if path.endswith("chargecontrols"):
+            return orjson.dumps(wallbox.getChargeControls())
+        if "chargecontrols" in path:
+            return orjson.dumps(wallbox.getChargerStatus(coordinator._station))
+        return orjson.dumps(wallbox.getMetersData(coordinator._station))
+
+    def create_wallbox(data: dict[str, Any]) -> FakeWallbox:
+        wallbox = boxes.setdefault(data["url"], FakeWallbox())
+        wallbox.stations.add(data["station"])
+        return wallbox
+
+    monkeypatch.setattr(module, "create_wallbox", create_wallbox)
+    monkeypatch.setattr(module.WallboxCoordinator, "_get_raw", _get_raw)
+    return boxes
+
+
+@pytest.fixture
+def add_entry(hass: HomeAssistant, wallboxes: dict[str, FakeWallbox]) -> Any:
+    """Return a function setting up a station."""
+
+    async def _add_entry(
+        url: str = "http://10.0.0.1/",
+        station: int = 1,
+        title: str = "eCB1",
+        options: dict[str, Any] | None = None,
+        data: dict[str, Any] | None = None,
+    ) -> ConfigEntry:
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            title=title,
+            data={
+                "url": url,
+                "station": station,
+                "username": "",
+                "password": "",
+                **(data or {}),
+            },
+            options=options or {},
+            unique_id=f"{url}{station}",
+        )
+        entry.add_to_hass(hass)
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        return entry
+
+    return _add_entry
@@ -0,0 +1,77 @@
+"""Local stand-in for the Modbus TCP server of an eCB1.
+
+It serves the register map assumed by modbus.py, so tests against it cover
+the framing and decoding of the client, not compatibility with a station.
+"""
+from __future__ import annotations
+
+import asyncio
+import math
+import struct
+
+_NAN = struct.unpack(">HH", struct.pack(">f", math.nan))
+
+
+class ModbusServer:
+    """Serve input registers per unit id over Modbus TCP on localhost.
+
+    Unset registers read as NaN float32 halves. Other function codes, unknown
+    units and reads of more than 125 registers are answered with exception 2.
+    """
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.units: dict[int, dict[int, int]] = {}
+        self.requests: list[tuple[int, int, int]] = []
+        self._server: asyncio.AbstractServer | None = None
+
+    def set_uint16(self, unit: int, address: int, value: int) -> None:
+        """Set a uint16 register."""
+        self.units.setdefault(unit, {})[address] = value
+
+    def set_float32(self, unit: int, address: int, value: float) -> None:
+        """Set a big endian float32 in two registers."""
+        high, low = struct.unpack(">HH", struct.pack(">f", value))
+        registers = self.units.setdefault(unit, {})
+        registers[address] = high
+        registers[address + 1] = low
+
+    async def async_start(self) -> int:
+        """Start serving and return the port."""
+        self._server = await asyncio.start_server(self._async_handle, "127.0.0.1", 0)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def async_stop(self) -> None:
+        """Stop serving."""
+        assert self._server is not None
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _async_handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Answer the requests of one connection."""
+        try:
+            while True:
+                transaction, _, length, unit = struct.unpack(
+                    ">HHHB", await reader.readexactly(7)
+                )
+                function, address, count = struct.unpack(
+                    ">BHH", await reader.readexactly(length - 1)
+                )
+                self.requests.append((unit, address, count))
+                registers = self.units.get(unit)
+                if function != 0x04 or registers is None or count > 125:
+                    pdu = struct.pack(">BB", function | 0x80, 2)
+                else:
+                    values = [
+                        registers.get(register, _NAN[(register - address) % 2])
+                        for register in range(address, address + count)
+                    ]
+                    pdu = struct.pack(f">BB{count}H", function, 2 * count, *values)
+                writer.write(struct.pack(">HHHB", transaction, 0, len(pdu) + 1, unit) + pdu)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
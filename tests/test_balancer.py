@@ -0,0 +1,131 @@
+"""Tests for the site load balancer."""
+from __future__ import annotations
+
+from datetime import timedelta
+
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from common import integration_module
+
+balancer = integration_module("balancer")
+
+CURRENTS = ("1-0:31.4.0", "1-0:51.4.0", "1-0:71.4.0")
+
+
+def test_distribute() -> None:
+    """Sessions share the budget evenly, those that do not fit get 0."""
+    assert balancer.distribute(20, {"a": 16, "b": 16}) == {"a": 10.0, "b": 10.0}
+    assert balancer.distribute(20, {"a": 6, "b": 32}) == {"a": 6.0, "b": 14.0}
+    assert balancer.distribute(10, {"a": 16, "b": 16}) == {"a": 10.0, "b": 0.0}
+
+
+async def _setup(hass: HomeAssistant, add_entry, wallboxes, limit: int) -> list:
+    """Set up two charging stations sharing a site limit."""
+    entries = [
+        await add_entry(url="http://10.0.0.1/", title="a"),
+        await add_entry(url="http://10.0.0.2/", station=2, title="b"),
+    ]
+    for wallbox in wallboxes.values():
+        wallbox.control["connected"] = "true"
+        wallbox.meter.update(dict.fromkeys(CURRENTS, 15.0))
+    for entry in entries:
+        await hass.data["ha-eCB1"][entry.entry_id].async_refresh()
+        hass.config_entries.async_update_entry(
+            entry, options={"site_current_limit": limit}
+        )
+    await hass.async_block_till_done()
+    return entries
+
+
+async def test_control_loop(hass: HomeAssistant, add_entry, wallboxes) -> None:
+    """Cycles run on their own interval, on freshly read phase currents."""
+    first, second = await _setup(hass, add_entry, wallboxes, 20)
+    site = balancer.async_get_balancer(hass)
+    metrics = site.metrics
+    assert metrics["setpoints"] == {first.entry_id: 10.0, second.entry_id: 10.0}
+    assert metrics["latency_ms"]["last"] is not None
+
+    # The car on b draws 6 A, without any poll of the stations.
+    wallboxes["http://10.0.0.2/"].meter.update(dict.fromkeys(CURRENTS, 6.0))
+    cycles = metrics["cycles"]
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+    metrics = site.metrics
+    assert metrics["cycles"] > cycles
+    assert metrics["setpoints"][second.entry_id] == 8.0
+    # Raising a is rate limited.
+    assert metrics["setpoints"][first.entry_id] == 10.0
+    assert metrics["deferred"] >= 1
+
+    for entry in (first, second):
+        await hass.config_entries.async_unload(entry.entry_id)
+    assert site.limit is None and site._unsubscribe is None
+
+
+async def test_pause_sessions_that_do_not_fit(
+    hass: HomeAssistant, add_entry, wallboxes
+) -> None:
+    """A session without room is paused by locking and resumes once it fits."""
+    first, second = await _setup(hass, add_entry, wallboxes, 10)
+    site = balancer.async_get_balancer(hass)
+    paused = hass.data["ha-eCB1"][second.entry_id]
+    wallbox = wallboxes["http://10.0.0.2/"]
+    unlocks = wallbox.calls.count("unlock")
+    assert site.metrics["setpoints"] == {first.entry_id: 10.0, second.entry_id: 0.0}
+    assert site.metrics["paused"] == [second.entry_id]
+    assert paused.paused_by == {"site_current_limit"}
+    assert wallbox.calls.count("lock") == 1 and 0 not in wallbox.set_values
+
+    # Resuming raises the current, which is rate limited like any raise.
+    for member in site._members.values():
+        member.written -= 60
+    for entry in (first, second):
+        hass.config_entries.async_update_entry(entry, options={"site_current_limit": 32})
+    await hass.async_block_till_done()
+    assert site.metrics["setpoints"][second.entry_id] >= 6
+    assert not paused.paused_by and wallbox.calls.count("unlock") == unlocks + 1
+
+    # Leaving the balancer resumes a paused station.
+    for entry in (first, second):
+        hass.config_entries.async_update_entry(entry, options={"site_current_limit": 10})
+    await hass.async_block_till_done()
+    (key,) = site.metrics["paused"]
+    entry = hass.config_entries.async_get_entry(key)
+    coordinator = hass.data["ha-eCB1"][key]
+    wallbox = wallboxes[entry.data["url"]]
+    unlocks = wallbox.calls.count("unlock")
+    hass.config_entries.async_update_entry(entry, options={})
+    await hass.async_block_till_done()
+    assert not coordinator.paused_by and wallbox.calls.count("unlock") == unlocks + 1
+
+    for entry in (first, second):
+        await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_idle_stations_within_budget(
+    hass: HomeAssistant, add_entry, wallboxes
+) -> None:
+    """Idle stations wait at the floor out of the budget, or are parked at 0 A."""
+    first, second = await _setup(hass, add_entry, wallboxes, 20)
+    site = balancer.async_get_balancer(hass)
+    idle = hass.data["ha-eCB1"][second.entry_id]
+    wallboxes["http://10.0.0.2/"].control["connected"] = "false"
+    await idle.async_refresh()
+    for member in site._members.values():
+        member.written -= 60
+    await site._async_cycle()
+    await hass.async_block_till_done()
+    assert site.metrics["setpoints"] == {first.entry_id: 14.0, second.entry_id: 6.0}
+
+    # Without room for the floor, the idle station is locked at 0 A.
+    for entry in (first, second):
+        hass.config_entries.async_update_entry(entry, options={"site_current_limit": 10})
+    await hass.async_block_till_done()
+    assert site.metrics["setpoints"] == {first.entry_id: 10.0, second.entry_id: 0.0}
+    assert idle.paused_by == {"site_current_limit"}
+
+    for entry in (first, second):
+        await hass.config_entries.async_unload(entry.entry_id)
@@ -0,0 +1,88 @@
+"""Tests for the circuit breaker of unreachable chargers."""
+from __future__ import annotations
+
+import time
+from typing import Any
+
+import pytest
+import requests
+
+from homeassistant.core import HomeAssistant
+
+from common import integration_module
+
+breaker = integration_module("breaker")
+
+
+def _offline(*args: Any) -> None:
+    """Fail like requests does when the charger does not answer."""
+    raise requests.exceptions.ConnectionError("offline")
+
+
+def test_transitions(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The breaker opens at the threshold, backs off and closes on success."""
+    monkeypatch.setattr(breaker.random, "uniform", lambda low, high: high)
+    changes: list[str] = []
+    host = breaker.CircuitBreaker("host", threshold=2, backoff=10, max_backoff=30)
+    host.async_add_listener(lambda: changes.append(host.state))
+
+    host.async_record_failure()
+    assert host.state == "closed" and not host.probe_due
+    host.async_record_failure()
+    assert host.state == "open" and host.trips == 1
+    assert host.next_probe - time.monotonic() == pytest.approx(10, abs=1)
+    assert not host.probe_due
+
+    # A failed probe opens it again, with twice the backoff up to the maximum.
+    for backoff in (20, 30, 30):
+        host.next_probe = 0
+        assert host.probe_due
+        host.async_start_probe()
+        assert host.state == "half_open" and not host.probe_due
+        host.async_record_failure()
+        assert host.state == "open"
+        assert host.next_probe - time.monotonic() == pytest.approx(backoff, abs=1)
+
+    host.async_start_probe()
+    host.async_record_success()
+    assert (host.state, host.failures, host.trips) == ("closed", 0, 0)
+    assert host.attributes["next_probe_in"] is None
+    assert changes == ["open"] + ["half_open", "open"] * 3 + ["half_open", "closed"]
+
+
+async def test_unreachable_host(hass: HomeAssistant, add_entry, wallboxes) -> None:
+    """Stations of an unreachable host stop polling until a probe answers."""
+    first = await add_entry()
+    second = await add_entry(station=2)
+    coordinator = hass.data["ha-eCB1"][first.entry_id]
+    other = hass.data["ha-eCB1"][second.entry_id]
+    assert coordinator.breaker is other.breaker
+    wallbox = wallboxes["http://10.0.0.1/"]
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(wallbox, "authenticate", _offline)
+        patch.setattr(wallbox, "getAutoStartStopMode", _offline)
+        for _ in range(3):
+            await coordinator.async_refresh()
+        assert coordinator.breaker.state == "open"
+        assert not coordinator.reachable and not other.reachable
+
+        # No request is sent before the backoff expired.
+        wallbox.calls.clear()
+        await other.async_refresh()
+        assert wallbox.calls == []
+        assert other.data is not None
+
+        # A failed probe keeps it open.
+        coordinator.breaker.next_probe = 0
+        await coordinator.async_refresh()
+        assert coordinator.breaker.state == "open"
+
+    coordinator.breaker.next_probe = 0
+    await coordinator.async_refresh()
+    assert coordinator.breaker.state == "closed" and other.reachable
+    assert coordinator.last_update_success
+
+    await hass.config_entries.async_unload(first.entry_id)
+    assert "10.0.0.1" in hass.data["ha-eCB1_breakers"]
+    await hass.config_entries.async_unload(second.entry_id)
+    assert not hass.data["ha-eCB1_breakers"]
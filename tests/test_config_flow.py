@@ -0,0 +1,75 @@
+"""Tests for the options flow of the Wallbox integration."""
+from __future__ import annotations
+
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+
+
+async def _configure(
+    hass: HomeAssistant, entry_id: str, section: str, user_input: dict
+) -> dict:
+    """Open a section from the menu and submit it."""
+    result = await hass.config_entries.options.async_init(entry_id)
+    assert result["type"] == FlowResultType.MENU
+    assert result["menu_options"] == [
+        "polling",
+        "entities",
+        "load_management",
+        "recording",
+    ]
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {"next_step_id": section}
+    )
+    assert result["type"] == FlowResultType.FORM and result["step_id"] == section
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], user_input
+    )
+    await hass.async_block_till_done()
+    return result
+
+
+async def test_options_sections(hass: HomeAssistant, add_entry, wallboxes) -> None:
+    """Each section saves its options and keeps those of the other sections."""
+    entry = await add_entry(
+        options={"pv_surplus": True, "pv_surplus_sensor": "sensor.grid"}
+    )
+    coordinator = hass.data["ha-eCB1"][entry.entry_id]
+
+    result = await _configure(
+        hass,
+        entry.entry_id,
+        "polling",
+        {"scan_interval": 3, "timeout": 2, "poll_deadline": 4, "stale_after": 30},
+    )
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    assert entry.options["pv_surplus_sensor"] == "sensor.grid"
+    assert coordinator.poll_interval == 3 and coordinator.endpoint_timeout == 2
+
+    # Clearing the optional sensor removes it.
+    await _configure(hass, entry.entry_id, "load_management", {"pv_surplus": True})
+    assert "pv_surplus_sensor" not in entry.options
+    assert entry.options["pv_surplus"] is True
+    assert entry.options["scan_interval"] == 3
+
+    await _configure(hass, entry.entry_id, "entities", {"obis_profile": "minimal"})
+    assert entry.options["obis_profile"] == "minimal"
+    assert entry.options["deadband_energy"] == 0
+    assert coordinator.poll_interval == 3
+
+
+async def test_demand_thresholds(hass: HomeAssistant, add_entry, wallboxes) -> None:
+    """Pausing at or above the reduce threshold is rejected."""
+    entry = await add_entry()
+    result = await _configure(
+        hass,
+        entry.entry_id,
+        "load_management",
+        {
+            "demand_response": True,
+            "demand_response_reduce_below": 49.5,
+            "demand_response_pause_below": 49.8,
+        },
+    )
+    assert result["type"] == FlowResultType.FORM
+    assert result["errors"] == {"demand_response_pause_below": "pause_not_below_reduce"}
+    assert "demand_response" not in entry.options
@@ -0,0 +1,101 @@
+"""Tests for the decoding of eCB1 responses."""
+from __future__ import annotations
+
+import orjson
+
+from common import integration_module
+
+decode = integration_module("decode")
+
+POWER = "1-0:1.4.0"
+ENERGY = "1-0:1.8.0"
+VOLTAGE_L1 = "1-0:32.4.0"
+
+
+def _meters(data: dict) -> bytes:
+    """Return a body of the meters endpoint."""
+    return orjson.dumps({"meter": {"name": "meter", "type": "EM", "data": data}})
+
+
+def test_obis_codes() -> None:
+    """Codes map to fields, groups and profiles."""
+    assert decode.OBIS_FIELDS[POWER] == "active_power_plus"
+    assert decode.OBIS_FIELDS[VOLTAGE_L1] == "voltage_l1"
+    assert decode.OBIS_GROUP_OF_CODE[POWER] == "active_power"
+    assert decode.OBIS_GROUP_OF_CODE[VOLTAGE_L1] == "voltage"
+    assert decode.OBIS_GROUP_OF_CODE[ENERGY] == "energy"
+    assert decode.OBIS_GROUP_OF_CODE["1-0:31.6.0"] == "current"
+    profiles = decode.OBIS_PROFILE_CODES
+    assert {POWER, ENERGY} <= profiles["minimal"]
+    assert VOLTAGE_L1 not in profiles["minimal"]
+    assert VOLTAGE_L1 in profiles["per_phase"]
+    assert "1-0:31.6.0" not in profiles["per_phase"]
+    assert profiles["minimal"] < profiles["per_phase"] < profiles["full"]
+    assert profiles["full"] == frozenset(decode.OBIS_FIELDS)
+
+
+def test_decode_meters() -> None:
+    """Values become rounded floats, unknown codes and bad values are dropped."""
+    meter = decode.decode_meters(
+        _meters({POWER: "2300.456", ENERGY: 12.3456, VOLTAGE_L1: "n/a", "9-9:9.9.9": 1}),
+        {POWER: 1},
+    )
+    assert (meter.name, meter.type) == ("meter", "EM")
+    assert meter.data.active_power_plus == 2300.5
+    assert meter.data.active_energy_plus == 12.35
+    assert meter.data.voltage_l1 is None
+    assert meter.data.keys() == [POWER, ENERGY]
+    assert type(meter.data) is decode.meter_data_class()
+
+
+def test_decode_meters_codes_and_deadbands() -> None:
+    """Only the codes asked for are decoded, small moves keep the last value."""
+    previous = decode.decode_meters(_meters({POWER: 1000, ENERGY: 5}))
+    meter = decode.decode_meters(
+        _meters({POWER: 1040, ENERGY: 5.2, VOLTAGE_L1: 230}),
+        codes={POWER, ENERGY},
+        deadbands={POWER: 50, ENERGY: 0.1},
+        previous=previous.data,
+    )
+    assert meter.data.active_power_plus == 1000
+    assert meter.data.active_energy_plus == 5.2
+    assert meter.data.voltage_l1 is None
+
+
+def test_decode_status() -> None:
+    """The eCB1 spellings of the charge control fields are normalized."""
+    status = decode.decode_status(
+        orjson.dumps(
+            {
+                "chargecontrol": {
+                    "id": "1",
+                    "type": "eCB1",
+                    "connected": "false",
+                    "stateid": "194",
+                    "mode": "manual",
+                    "manualmodeamp": "16",
+                    "supplylinemaxamp": 32,
+                    "currentpwmamp": None,
+                }
+            }
+        )
+    )
+    assert status == decode.ChargeControl(
+        id=1,
+        type="eCB1",
+        connected=False,
+        stateid=194,
+        mode="manual",
+        manualmodeamp=16.0,
+        supplylinemaxamp=32.0,
+        currentpwmamp=None,
+    )
+    assert "currentpwmamp" not in status.keys()
+    assert [decode.to_bool(value) for value in ("1", "off", "", True, 0, None)] == [
+        True,
+        False,
+        False,
+        True,
+        False,
+        None,
+    ]
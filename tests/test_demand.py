@@ -0,0 +1,94 @@
+"""Tests for grid frequency demand response."""
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import Mock
+
+from homeassistant.core import HomeAssistant
+
+from common import integration_module
+
+demand = integration_module("demand")
+
+FREQUENCY = "1-0:14.4.0"
+
+
+async def _setup(hass: HomeAssistant, add_entry, wallboxes) -> tuple[Any, Any, Any]:
+    """Set up a station charging at 16 A with demand response."""
+    entry = await add_entry(options={"demand_response": True})
+    wallbox = wallboxes["http://10.0.0.1/"]
+    wallbox.control.update({"connected": "true", "currentpwmamp": 16})
+    # Forget the write probing the permissions at setup.
+    wallbox.set_values.clear()
+    coordinator = hass.data["ha-eCB1"][entry.entry_id]
+    await coordinator.async_refresh()
+    return hass.data["ha-eCB1_demand_response"][entry.entry_id], coordinator, wallbox
+
+
+async def _sample(hass: HomeAssistant, controller: Any, wallbox: Any, hertz: float) -> None:
+    """Run the fast loop once on a supply frequency."""
+    wallbox.meter[FREQUENCY] = hertz
+    await controller._async_tick()
+    await hass.async_block_till_done()
+
+
+def test_cap_for() -> None:
+    """Below the reduce threshold the minimum applies, below the pause one 0 A."""
+    controller = demand.DemandResponseController(None, "key", Mock(transport=None))
+    assert controller.cap_for(50.0) is None
+    assert controller.cap_for(49.7) == 6
+    assert controller.cap_for(49.4) == 0
+
+
+async def test_reduce_pause_recover(hass: HomeAssistant, add_entry, wallboxes) -> None:
+    """An event reduces, then pauses, and recovery ramps back to the old current."""
+    controller, coordinator, wallbox = await _setup(hass, add_entry, wallboxes)
+    await _sample(hass, controller, wallbox, 50.0)
+    assert controller.state == "normal" and not wallbox.set_values
+
+    await _sample(hass, controller, wallbox, 49.7)
+    assert controller.state == "reduced" and wallbox.set_values == [6]
+    assert coordinator.current_caps == {"demand_response": 6}
+    await _sample(hass, controller, wallbox, 49.4)
+    assert controller.state == "paused" and coordinator.paused_by == {"demand_response"}
+    assert wallbox.calls[-1] == "lock" and 0 not in wallbox.set_values
+    # The frequency rising above the pause threshold does not resume yet.
+    await _sample(hass, controller, wallbox, 49.7)
+    assert controller.state == "reduced" and coordinator.paused_by
+
+    await _sample(hass, controller, wallbox, 50.0)
+    assert controller.state == "recovering"
+    await _sample(hass, controller, wallbox, 50.0)
+    assert wallbox.set_values == [6] and coordinator.paused_by
+
+    # After the recovery delay, charging resumes at the minimum and ramps up.
+    controller._recovered_since -= 30
+    await _sample(hass, controller, wallbox, 50.0)
+    assert wallbox.set_values[-1] == 6 and wallbox.calls[-1] == "unlock"
+    assert not coordinator.paused_by
+    await _sample(hass, controller, wallbox, 50.0)
+    assert wallbox.set_values[-1] == 6
+    while controller.state != "normal":
+        controller._ramped -= 5
+        await _sample(hass, controller, wallbox, 50.0)
+    assert wallbox.set_values[1:] == [6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16]
+    assert not coordinator.current_caps
+    metrics = controller.metrics
+    assert metrics["events"] == 1 and metrics["cap"] is None
+    # Nothing looked up a site balancer into existence.
+    assert "ha-eCB1_balancer" not in hass.data
+
+
+async def test_failed_read(hass: HomeAssistant, add_entry, wallboxes) -> None:
+    """A malformed reading is counted, not raised, and nothing is read while open."""
+    controller, coordinator, wallbox = await _setup(hass, add_entry, wallboxes)
+    coordinator._get_raw = lambda path: b"{}"
+    await _sample(hass, controller, wallbox, 49.0)
+    assert controller.metrics["failed"] == 1 and controller.state == "normal"
+    del coordinator._get_raw
+
+    while coordinator.breaker.state != "open":
+        coordinator.breaker.async_record_failure()
+    calls = len(wallbox.calls)
+    await _sample(hass, controller, wallbox, 49.0)
+    assert len(wallbox.calls) == calls and controller.metrics["samples"] == 0
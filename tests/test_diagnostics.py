@@ -0,0 +1,33 @@
+"""Tests for the diagnostics of the Wallbox integration."""
+from __future__ import annotations
+
+import importlib
+import sys
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from common import integration_module
+
+diagnostics = integration_module("diagnostics")
+
+# Modules loaded only once a feature needs them.
+LAZY_MODULES = ("balancer", "demand", "modbus", "scheduler", "surplus")
+
+
+async def test_diagnostics(hass: HomeAssistant, add_entry, wallboxes) -> None:
+    """Diagnostics report the poll phase and the load times."""
+    entry = await add_entry()
+    result = await diagnostics.async_get_config_entry_diagnostics(hass, entry)
+    assert result["poll_phase"] is not None
+    assert result["load_time_ms"]["integration"] > 0
+
+
+def test_diagnostics_imports_lazily(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Loading the diagnostics platform loads none of the optional modules."""
+    package = diagnostics.__name__.rpartition(".")[0]
+    for name in (*LAZY_MODULES, "diagnostics"):
+        monkeypatch.delitem(sys.modules, f"{package}.{name}", raising=False)
+    importlib.import_module(diagnostics.__name__)
+    assert not [name for name in LAZY_MODULES if f"{package}.{name}" in sys.modules]
@@ -0,0 +1,82 @@
+"""Tests for the lifecycle events of the Wallbox integration."""
+from __future__ import annotations
+
+from dataclasses import replace
+
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+
+from common import DOMAIN, integration_module
+
+const = integration_module("const")
+
+
+async def test_lifecycle_events(hass: HomeAssistant, add_entry, wallboxes) -> None:
+    """Changes a read shows fire one event each, once the read is published."""
+    events: list[tuple[Event, int]] = []
+    coordinators: list = []
+
+    @callback
+    def _record(event: Event) -> None:
+        events.append((event, coordinators[0].data.version))
+
+    for event_type in const.LIFECYCLE_EVENTS.values():
+        hass.bus.async_listen(event_type, _record)
+    entry = await add_entry()
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinators.append(coordinator)
+    # The first read has nothing to compare with.
+    assert not events
+
+    wallbox = wallboxes["http://10.0.0.1/"]
+    wallbox.control.update({"connected": "true", "stateid": "17", "mode": "eco"})
+    wallbox.ai_mode[1] = True
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert {event.event_type for event, _ in events} == {
+        "ha_ecb1_connected_changed",
+        "ha_ecb1_stateid_changed",
+        "ha_ecb1_mode_changed",
+        "ha_ecb1_ai_mode_changed",
+    }
+    device = dr.async_get(hass).async_get_device(identifiers={(DOMAIN, "123-1")})
+    for event, version in events:
+        assert event.data["device_id"] == device.id
+        assert event.data["version"] == version == coordinator.data.version
+    changes = {event.data["key"]: event.data for event, _ in events}
+    assert (changes["connected"]["before"], changes["connected"]["after"]) == (False, True)
+    assert (changes["mode"]["before"], changes["mode"]["after"]) == ("manual", "eco")
+
+    # Reading the same values again fires nothing.
+    events.clear()
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert not events
+
+
+async def test_optimistic_writes_fire_nothing(
+    hass: HomeAssistant, add_entry, wallboxes
+) -> None:
+    """A write is reported once the station confirms it, not when it is sent."""
+    entry = await add_entry()
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    events: list[Event] = []
+    hass.bus.async_listen(const.EVENT_MODE_CHANGED, events.append)
+
+    coordinator.async_set_optimistic(
+        chargecontrol=replace(coordinator.data.chargecontrol, mode="eco")
+    )
+    await hass.async_block_till_done()
+    assert not events
+
+    # The station has not taken the mode yet, which is no change either.
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert not events
+
+    wallboxes["http://10.0.0.1/"].control["mode"] = "eco"
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert [(event.data["before"], event.data["after"]) for event in events] == [
+        ("manual", "eco")
+    ]
@@ -0,0 +1,54 @@
+"""Tests for the executor of the blocking eCB1 calls."""
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from common import integration_module
+
+executor = integration_module("executor")
+
+
+def _shutdown(pool: executor.WallboxExecutor) -> None:
+    """Shut a pool down and wait for its threads, which must not linger."""
+    pool.shutdown()
+    pool._pool.shutdown(wait=True)
+
+
+def test_host_key() -> None:
+    """Stations behind one base url share a host."""
+    assert executor.host_key("http://10.0.0.1/") == "10.0.0.1"
+    assert executor.host_key("http://10.0.0.1:8080/api/") == "10.0.0.1:8080"
+    assert executor.host_key("10.0.0.1") == "10.0.0.1"
+
+
+async def test_timeout_starts_with_the_call() -> None:
+    """Calls queued behind others get their full timeout once they start."""
+    pool = executor.WallboxExecutor("host", max_workers=2, timeout=0.5)
+    results = await asyncio.gather(
+        *(pool.async_run(lambda n=n: time.sleep(0.3) or n) for n in range(4))
+    )
+    assert results == [0, 1, 2, 3]
+    assert pool.metrics["timed_out"] == 0
+    assert pool.metrics["peak_queued"] >= 2
+    _shutdown(pool)
+
+
+async def test_hanging_call_times_out() -> None:
+    """A hanging call times out and queued calls give up at the deadline."""
+    release = threading.Event()
+    pool = executor.WallboxExecutor("host", max_workers=1, timeout=0.2)
+    with pytest.raises(TimeoutError):
+        await pool.async_run(release.wait)
+    # The worker still hangs, so the next call never starts.
+    with pytest.raises(TimeoutError):
+        await pool.async_run(lambda: None, deadline=time.monotonic() + 0.1)
+    metrics = pool.metrics
+    assert metrics["timed_out"] == 2 and metrics["active"] == 1
+    assert metrics["queued"] == 0
+    release.set()
+    assert await pool.async_run(lambda: 1) == 1
+    _shutdown(pool)
@@ -0,0 +1,66 @@
+"""Tests for the export of sessions and samples."""
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr
+
+from common import DOMAIN, integration_module
+
+export = integration_module("export")
+
+NAN = float("nan")
+
+
+def test_sessions_span_chunks() -> None:
+    """Sessions are runs of draw, ended by a long enough pause."""
+    chunks = [
+        # 0 W, then 7 kW for 20 s, a short dip and 7 kW again.
+        [(0, 0, 10.0), (10, 7000, 10.0), (20, 7000, 10.02), (30, 50, 10.04)],
+        [(40, 7000, 10.04), (50, 7000, NAN), (60, 7000, 10.1)],
+        # Quiet for longer than SESSION_END_AFTER, then a second session.
+        [(500, 3000, 10.1), (510, 3000, 10.2)],
+    ]
+    sessions = [row for rows in export.iter_sessions(chunks) for row in rows]
+    assert [session[2:] for session in sessions] == [
+        (50, 0.1, 7000, 5),
+        (10, 0.1, 3000, 2),
+    ]
+    assert sessions[0][0] == "1970-01-01T00:00:10+00:00"
+    assert sessions[0][1] == "1970-01-01T00:01:00+00:00"
+
+
+async def test_export_paths_per_station(
+    hass: HomeAssistant, add_entry, wallboxes, tmp_path: Path
+) -> None:
+    """Stations of the same name export to files of their own."""
+    hass.config.config_dir = str(tmp_path)
+    entries = [
+        await add_entry(options={"sample_history_size": 1}),
+        await add_entry(
+            url="http://10.0.0.2/", station=2, options={"sample_history_size": 1}
+        ),
+    ]
+    devices = dr.async_get(hass)
+    response = await hass.services.async_call(
+        DOMAIN,
+        "export",
+        {
+            "device_id": [
+                devices.async_get_device(identifiers={(DOMAIN, serial)}).id
+                for serial in ("123-1", "123-2")
+            ],
+            "kind": "samples",
+            "start": "2020-01-01 00:00:00",
+        },
+        blocking=True,
+        return_response=True,
+    )
+    paths = [response["results"][entry.entry_id]["path"] for entry in entries]
+    assert len(set(paths)) == 2
+    assert all(entry.entry_id in path for entry, path in zip(entries, paths))
+    assert sorted(os.listdir(os.path.dirname(paths[0]))) == sorted(
+        os.path.basename(path) for path in paths
+    )
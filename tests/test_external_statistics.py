@@ -0,0 +1,172 @@
+"""Tests for the statistics compiled by the integration."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+from pytest_homeassistant_custom_component.components.recorder.common import (
+    async_wait_recording_done,
+)
+
+from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+    statistics_during_period,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from common import FakeWallbox, integration_module
+
+external_statistics = integration_module("external_statistics")
+
+ENERGY = "1-0:1.8.0"
+POWER = "1-0:1.4.0"
+ENERGY_ID = "ha_ecb1:123_1_active_energy_plus"
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(
+    recorder_mock: Recorder, enable_custom_integrations: None
+) -> None:
+    """Start the recorder before the integration is enabled."""
+
+
+async def _statistics(
+    hass: HomeAssistant, start: datetime, statistic_ids: set[str]
+) -> dict[str, list[dict[str, Any]]]:
+    """Return the hourly statistics from start on."""
+    await async_wait_recording_done(hass)
+    return await hass.async_add_executor_job(
+        statistics_during_period,
+        hass,
+        start,
+        None,
+        statistic_ids,
+        "hour",
+        None,
+        {"mean", "min", "max", "state", "sum"},
+    )
+
+
+def _add_energy_rows(hass: HomeAssistant, rows: list[StatisticData]) -> None:
+    """Import rows of the energy statistic of the station."""
+    async_add_external_statistics(
+        hass,
+        StatisticMetaData(
+            has_mean=False,
+            has_sum=True,
+            name=None,
+            source="ha_ecb1",
+            statistic_id=ENERGY_ID,
+            unit_of_measurement="kWh",
+        ),
+        rows,
+    )
+
+
+def test_spread() -> None:
+    """The rise is split by the weights, the current hour keeps its share."""
+    assert external_statistics.spread(0, 10, [1, 1], 0) == [5, 10]
+    assert external_statistics.spread(0, 10, [1, 3], 1) == [2, 8]
+    assert external_statistics.spread(5, 5, [1, 1], 1) == [5, 5]
+
+
+async def test_hourly_import(
+    hass: HomeAssistant, add_entry, wallboxes, freezer: FrozenDateTimeFactory
+) -> None:
+    """Full hours get mean, min and max, the partial first hour only energy."""
+    freezer.move_to("2024-03-01 10:10:00+00:00")
+    entry = await add_entry(options={"external_statistics": True})
+    coordinator = hass.data["ha-eCB1"][entry.entry_id]
+    wallbox = wallboxes["http://10.0.0.1/"]
+    compiler = hass.data["ha-eCB1_statistics"][entry.entry_id]
+    power_id = compiler.metadata(POWER)["statistic_id"]
+    assert compiler.metadata(ENERGY)["statistic_id"] == ENERGY_ID
+
+    async def _sample(moment: str, power: float, energy: float) -> None:
+        freezer.move_to(moment)
+        wallbox.meter.update({POWER: power, ENERGY: energy})
+        await coordinator.async_refresh()
+        await hass.async_block_till_done()
+
+    await _sample("2024-03-01 10:20:00+00:00", 1000, 5.0)
+    await _sample("2024-03-01 11:00:00+00:00", 3000, 5.5)
+    await _sample("2024-03-01 11:30:00+00:00", 1000, 6.0)
+    # Changing other options keeps the aggregates of the hour in progress.
+    hass.config_entries.async_update_entry(
+        entry, options={"external_statistics": True, "poll_interval": 5}
+    )
+    await hass.async_block_till_done()
+    assert hass.data["ha-eCB1_statistics"][entry.entry_id] is compiler
+    await _sample("2024-03-01 12:00:00+00:00", 0, 6.5)
+
+    stats = await _statistics(
+        hass, datetime(2024, 3, 1, tzinfo=timezone.utc), {power_id, ENERGY_ID}
+    )
+    assert [row["state"] for row in stats[ENERGY_ID]] == [5.0, 6.0]
+    assert [row["sum"] for row in stats[ENERGY_ID]] == [5.0, 6.0]
+    (power,) = stats[power_id]
+    assert power["start"] == datetime(2024, 3, 1, 11, tzinfo=timezone.utc).timestamp()
+    assert (power["mean"], power["min"], power["max"]) == (2000, 1000, 3000)
+
+    # The sensors keep their state class, and with it their long-term statistics.
+    entity_id = er.async_get(hass).async_get_entity_id("sensor", "ha-eCB1", f"{POWER}-123-1")
+    state = hass.states.get(entity_id)
+    assert state.attributes["state_class"] == "measurement"
+
+    hass.config_entries.async_update_entry(entry, options={})
+    await hass.async_block_till_done()
+    assert entry.entry_id not in hass.data["ha-eCB1_statistics"]
+
+
+async def test_backfill_flat(
+    hass: HomeAssistant, add_entry, wallboxes, freezer: FrozenDateTimeFactory
+) -> None:
+    """Without a profile the energy of the gap is spread evenly."""
+    freezer.move_to("2024-03-01 10:30:00+00:00")
+    start = datetime(2024, 3, 1, 5, tzinfo=timezone.utc)
+    _add_energy_rows(hass, [StatisticData(start=start, state=100.0, sum=100.0)])
+    await async_wait_recording_done(hass)
+    wallbox = wallboxes["http://10.0.0.1/"] = FakeWallbox()
+    wallbox.meter[ENERGY] = 110.5
+    entry = await add_entry(options={"external_statistics": True})
+    await hass.async_block_till_done()
+
+    compiler = hass.data["ha-eCB1_statistics"][entry.entry_id]
+    assert compiler.backfilled_rows == 4
+    stats = await _statistics(hass, start, {ENERGY_ID})
+    # 10.5 kWh over the 4.5 hours since the last row, 06:00 to 10:30.
+    states = [row["state"] for row in stats[ENERGY_ID]]
+    assert states == pytest.approx([100.0, 102.3333, 104.6667, 107.0, 109.3333], abs=1e-3)
+
+
+async def test_backfill_profile(
+    hass: HomeAssistant, add_entry, wallboxes, freezer: FrozenDateTimeFactory
+) -> None:
+    """The energy of the gap follows the hourly energy of the last days."""
+    freezer.move_to("2024-03-02 10:30:00+00:00")
+    day = datetime(2024, 3, 1, tzinfo=timezone.utc)
+    # 5 kWh at 07:00 on the first day, nothing in other hours.
+    _add_energy_rows(
+        hass,
+        [
+            StatisticData(
+                start=day + timedelta(hours=hour),
+                state=55.0 if hour >= 7 else 50.0,
+                sum=55.0 if hour >= 7 else 50.0,
+            )
+            for hour in range(30)
+        ],
+    )
+    await async_wait_recording_done(hass)
+    wallbox = wallboxes["http://10.0.0.1/"] = FakeWallbox()
+    wallbox.meter[ENERGY] = 58.0
+    await add_entry(options={"external_statistics": True})
+    await hass.async_block_till_done()
+
+    stats = await _statistics(hass, day + timedelta(hours=30), {ENERGY_ID})
+    assert [row["state"] for row in stats[ENERGY_ID]] == [55.0, 58.0, 58.0, 58.0]
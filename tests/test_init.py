@@ -0,0 +1,69 @@
+"""Tests for the setup of the Wallbox integration."""
+from __future__ import annotations
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr
+
+from common import integration_module
+
+const = integration_module("const")
+
+CONTROLLERS = (
+    const.DATA_BALANCER,
+    const.DATA_SURPLUS,
+    const.DATA_DEMAND,
+    const.DATA_SAMPLE_HISTORY,
+)
+
+
+async def test_optional_controllers_start_when_enabled(
+    hass: HomeAssistant, add_entry, wallboxes
+) -> None:
+    """Controllers are loaded by the options that enable them, not at setup."""
+    entry = await add_entry()
+    assert not any(key in hass.data for key in CONTROLLERS)
+    assert integration_module().LOAD_TIMES_MS["integration"] > 0
+
+    hass.config_entries.async_update_entry(
+        entry, options={"site_current_limit": 32, "demand_response": True}
+    )
+    await hass.async_block_till_done()
+    assert hass.data[const.DATA_BALANCER].is_member(entry.entry_id)
+    assert entry.entry_id in hass.data[const.DATA_DEMAND]
+    assert const.DATA_SURPLUS not in hass.data
+
+    hass.config_entries.async_update_entry(entry, options={})
+    await hass.async_block_till_done()
+    assert not hass.data[const.DATA_BALANCER].is_member(entry.entry_id)
+    assert not hass.data[const.DATA_DEMAND]
+
+    hass.config_entries.async_update_entry(entry, options={"demand_response": True})
+    await hass.async_block_till_done()
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    assert not hass.data[const.DATA_DEMAND]
+
+
+async def test_entities_share_accessors_and_device_info(
+    hass: HomeAssistant, add_entry, wallboxes
+) -> None:
+    """Accessors are compiled once per key, the device info once per system info."""
+    snapshot = integration_module("snapshot")
+    assert snapshot.accessor_for_key("mode") is snapshot.accessor_for_key("mode")
+
+    entry = await add_entry()
+    coordinator = hass.data[const.DOMAIN][entry.entry_id]
+    device_info = coordinator.device_info
+    await coordinator.async_refresh()
+    assert coordinator.device_info is device_info
+
+    wallbox = wallboxes["http://10.0.0.1/"]
+    wallbox.getSystemInformation = lambda: {
+        "serial": "123",
+        "company": "Hardy Barth",
+        "os_version": "2.0",
+    }
+    await coordinator.async_refresh()
+    assert coordinator.device_info is not device_info
+    assert coordinator.device_info["sw_version"] == "2.0"
+    device = dr.async_get(hass).async_get_device(identifiers={(const.DOMAIN, "123-1")})
+    assert device.sw_version == "2.0"
@@ -0,0 +1,93 @@
+"""Benchmark of the memory the entities of a station allocate."""
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from dataclasses import replace
+import gc
+import tracemalloc
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import Entity, EntityDescription
+
+from common import DOMAIN, integration_module
+
+# Platform module -> (descriptions, entity class), the sensors describe theirs per call.
+PLATFORMS = (
+    ("sensor", "get_sensor_types", "WallboxSensor"),
+    ("binary_sensor", "BINARYSENSOR_TYPES", "WallboxBinarySensor"),
+    ("number", "NUMBER_TYPES", "WallboxNumber"),
+    ("lock", "LOCK_TYPES", "WallboxLock"),
+    ("select", "SELECT_TYPES", "WallboxModeSelector"),
+    ("switch", "SWITCH_TYPES", "WallboxSwitch"),
+)
+
+_FILTERS = [
+    tracemalloc.Filter(True, __file__, all_frames=True),
+    tracemalloc.Filter(False, tracemalloc.__file__, all_frames=True),
+]
+
+
+def _measure(build: Callable[[], list[Entity]]) -> int:
+    """Return the bytes still allocated by a build.
+
+    Only allocations made under this module count, so neither the snapshots
+    nor what other threads allocate meanwhile do.
+    """
+    gc.collect()
+    before = tracemalloc.take_snapshot().filter_traces(_FILTERS)
+    entities = build()
+    after = tracemalloc.take_snapshot().filter_traces(_FILTERS)
+    assert entities
+    return sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+
+
+async def test_shared_descriptions(hass: HomeAssistant, add_entry, wallboxes) -> None:
+    """Entities sharing their descriptions allocate less than per-entity copies.
+
+    The entities are built the way the platforms build them but never added
+    to Home Assistant, once sharing the descriptions and once with a copy of
+    the description and the name and unique id stored per entity.
+    """
+    entry = await add_entry()
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    platforms: list[tuple[Mapping[str, EntityDescription], type[Entity]]] = []
+    for name, types, entity_class in PLATFORMS:
+        module = integration_module(name)
+        descriptions = getattr(module, types)
+        platforms.append(
+            (
+                descriptions() if callable(descriptions) else descriptions,
+                getattr(module, entity_class),
+            )
+        )
+    keys = coordinator.data.keys()
+
+    def _shared() -> list[Entity]:
+        return [
+            entity_class(coordinator, entry, description)
+            for types, entity_class in platforms
+            for key in keys
+            if (description := types.get(key))
+        ]
+
+    def _per_entity() -> list[Entity]:
+        entities = [
+            entity_class(coordinator, entry, replace(description))
+            for types, entity_class in platforms
+            for key in keys
+            if (description := types.get(key))
+        ]
+        for entity in entities:
+            entity.__dict__["_attr_name"] = entity.name
+            entity.__dict__["_attr_unique_id"] = entity.unique_id
+        return entities
+
+    tracemalloc.start(25)
+    try:
+        # A first build fills the caches of the classes, which are not per station.
+        _shared()
+        shared = _measure(_shared)
+        per_entity = _measure(_per_entity)
+    finally:
+        tracemalloc.stop()
+    assert 0 < shared < per_entity
@@ -0,0 +1,88 @@
+"""Tests for the OpenMetrics endpoint."""
+from __future__ import annotations
+
+from http import HTTPStatus
+import re
+from unittest.mock import Mock
+
+from homeassistant.components.http import KEY_HASS
+from homeassistant.core import HomeAssistant
+
+from common import integration_module
+
+metrics = integration_module("metrics")
+
+# A sample line: name, optional label set and a float value.
+SAMPLE = re.compile(r'^[a-z_][a-z0-9_]*(\{[a-z_]+="(?:[^"\\]|\\.)*"(,[a-z_]+="(?:[^"\\]|\\.)*")*\})? \S+$')
+
+
+def _families(body: str) -> dict[str, tuple[str, list[str]]]:
+    """Return the type and samples of every metric family, checking the syntax."""
+    assert body.endswith("\n# EOF\n") and body.count("# EOF") == 1
+    families: dict[str, tuple[str, list[str]]] = {}
+    name = ""
+    for line in body.removesuffix("# EOF\n").splitlines():
+        if line.startswith("# TYPE "):
+            name, kind = line.split()[2:]
+            assert name not in families
+            families[name] = (kind, [])
+            continue
+        assert SAMPLE.match(line), line
+        assert line.startswith(name), line
+        float(line.rsplit(" ", 1)[1])
+        families[name][1].append(line)
+    return families
+
+
+async def test_render(hass: HomeAssistant, add_entry, wallboxes) -> None:
+    """Families are typed and suffixed, empty values and families are left out."""
+    entry = await add_entry(title='Garage "left"')
+    wallboxes["http://10.0.0.1/"].meter.update({"1-0:1.4.0": 2300.5})
+    coordinator = hass.data["ha-eCB1"][entry.entry_id]
+    await coordinator.async_refresh()
+    labels = f'station="{metrics._escape(entry.title)}"'
+    assert labels == 'station="Garage \\"left\\""'
+
+    families = _families(metrics.render_metrics([(labels, coordinator)]))
+    kind, samples = families["ecb1_station"]
+    assert kind == "info"
+    assert samples == ['ecb1_station_info{station="Garage \\"left\\"",model="eCB1"} 1.0']
+    assert families["ecb1_meter_active_power_plus"] == (
+        "gauge",
+        ['ecb1_meter_active_power_plus{station="Garage \\"left\\""} 2300.5'],
+    )
+    # Flags are 0 or 1, missing values have no sample and no family.
+    assert families["ecb1_connected"][1] == ['ecb1_connected{station="Garage \\"left\\""} 0']
+    assert "ecb1_meter_voltage_l1" not in families
+    kind, samples = families["ecb1_executor_submitted"]
+    assert kind == "counter"
+    assert samples[0].startswith('ecb1_executor_submitted_total{host="10.0.0.1"} ')
+    assert families["ecb1_circuit_breaker_open"][1] == [
+        'ecb1_circuit_breaker_open{host="10.0.0.1"} 0'
+    ]
+    assert "ecb1_site_current_limit_amperes" not in families
+
+
+async def test_view(hass: HomeAssistant, add_entry, wallboxes) -> None:
+    """Only stations that enable the endpoint are served."""
+    entry = await add_entry(options={"metrics": True, "site_current_limit": 16})
+    await add_entry(url="http://10.0.0.2/", title="Carport")
+    view = metrics.WallboxMetricsView()
+    request = Mock(app={KEY_HASS: hass})
+    response = await view.get(request)
+    assert response.status == HTTPStatus.OK
+    assert response.headers["Content-Type"] == metrics.CONTENT_TYPE_OPENMETRICS
+    families = _families(response.body.decode())
+    assert [line.split("{")[1].split(",")[0] for line in families["ecb1_station"][1]] == [
+        'station="eCB1"'
+    ]
+    assert families["ecb1_site_current_limit_amperes"][1] == [
+        "ecb1_site_current_limit_amperes 16.0"
+    ]
+    assert families["ecb1_balancer_cycles"][0] == "counter"
+    assert families["ecb1_balancer_cycles"][1][0].startswith("ecb1_balancer_cycles_total ")
+
+    hass.config_entries.async_update_entry(entry, options={})
+    await hass.async_block_till_done()
+    response = await view.get(request)
+    assert response.status == HTTPStatus.NOT_FOUND
@@ -0,0 +1,134 @@
+"""Tests for the Modbus TCP transport."""
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from common import integration_module
+from modbus_server import ModbusServer
+
+modbus = integration_module("modbus")
+decode = integration_module("decode")
+
+pytestmark = pytest.mark.enable_socket
+
+
+@pytest.fixture
+async def server(socket_enabled: None) -> AsyncIterator[tuple[ModbusServer, int]]:
+    """Run the stand-in server of a station with unit id 1."""
+    server = ModbusServer()
+    port = await server.async_start()
+    yield server, port
+    await server.async_stop()
+
+
+def test_meter_registers_cover_every_code() -> None:
+    """Every OBIS code has a float32 of its own."""
+    assert set(modbus.METER_REGISTERS) == set(decode.OBIS_FIELDS)
+    addresses = sorted(modbus.METER_REGISTERS.values())
+    assert all(high - low >= 2 for low, high in zip(addresses, addresses[1:]))
+    assert addresses[0] > max(
+        modbus.MODBUS_STATUS_ADDRESS + offset + 1
+        for offset, _ in modbus.STATUS_REGISTERS.values()
+    )
+
+
+def test_plan_blocks() -> None:
+    """Close ranges are merged, far or oversized ones are not."""
+    assert modbus.plan_blocks([(0, 1), (1, 1), (3, 2)]) == ((0, 5),)
+    assert modbus.plan_blocks([(0, 2), (20, 2)], max_gap=8) == ((0, 2), (20, 2))
+    assert modbus.plan_blocks([(0, 2), (4, 2)], max_count=4) == ((0, 2), (4, 2))
+    assert modbus.plan_blocks([(4, 2), (0, 2), (4, 2)]) == ((0, 6),)
+
+
+def test_meter_blocks_follow_codes() -> None:
+    """All codes fit in full blocks, a few codes in one small block."""
+    blocks = modbus.meter_blocks(None)
+    assert all(count <= 125 for _, count in blocks)
+    covered = {
+        register
+        for address, count in blocks
+        for register in range(address, address + count)
+    }
+    assert all(
+        {address, address + 1} <= covered for address in modbus.METER_REGISTERS.values()
+    )
+    codes = frozenset({"1-0:1.4.0", "1-0:1.8.0"})
+    assert modbus.meter_blocks(codes) == ((100, 8),)
+
+
+async def test_client_framing(server: tuple[ModbusServer, int]) -> None:
+    """Requests carry the unit id and read back what the server holds."""
+    stand_in, port = server
+    stand_in.set_uint16(1, 0, 194)
+    stand_in.set_float32(1, 3, 16.0)
+    client = modbus.ModbusTcpClient("127.0.0.1", port)
+
+    assert await client.async_read_input_registers(1, 0, 1) == (194,)
+    registers = await client.async_read_input_registers(1, 3, 2)
+    assert modbus._float32(dict(zip((3, 4), registers)), 3) == 16.0
+    # Unset registers are NaN, which reads as no value.
+    registers = await client.async_read_input_registers(1, 100, 2)
+    assert modbus._float32(dict(zip((100, 101), registers)), 100) is None
+    assert stand_in.requests == [(1, 0, 1), (1, 3, 2), (1, 100, 2)]
+    assert client.requests == 3
+    client.close()
+
+
+async def test_client_exception_response(server: tuple[ModbusServer, int]) -> None:
+    """A Modbus exception keeps the connection, transport errors drop it."""
+    stand_in, port = server
+    stand_in.set_uint16(1, 0, 1)
+    client = modbus.ModbusTcpClient("127.0.0.1", port)
+
+    with pytest.raises(modbus.ModbusError):
+        await client.async_read_input_registers(2, 0, 1)
+    assert await client.async_read_input_registers(1, 0, 1) == (1,)
+
+    await stand_in.async_stop()
+    client.close()
+    with pytest.raises(ConnectionError):
+        await client.async_read_input_registers(1, 0, 1)
+    port = await stand_in.async_start()
+    client.port = port
+    assert await client.async_read_input_registers(1, 0, 1) == (1,)
+    client.close()
+
+
+async def test_transport_reads_snapshot(
+    hass: HomeAssistant, add_entry, wallboxes, server: tuple[ModbusServer, int]
+) -> None:
+    """A station on Modbus is polled with block reads and no HTTP request."""
+    stand_in, port = server
+    stand_in.set_uint16(1, 0, 194)
+    stand_in.set_uint16(1, 1, 1)
+    stand_in.set_uint16(1, 2, 3)
+    stand_in.set_float32(1, 3, 16.0)
+    stand_in.set_float32(1, 5, 32.0)
+    stand_in.set_float32(1, 7, 10.5)
+    stand_in.set_float32(1, modbus.METER_REGISTERS["1-0:1.4.0"], 2300.0)
+    stand_in.set_float32(1, modbus.METER_REGISTERS["1-0:1.8.0"], 1234.5)
+
+    entry = await add_entry(
+        url="http://127.0.0.1/", data={"transport": "modbus", "modbus_port": port}
+    )
+    coordinator = hass.data["ha-eCB1"][entry.entry_id]
+    control = coordinator.data.chargecontrol
+    assert control.stateid == 194 and control.connected is True
+    assert control.mode == "manual" and control.currentpwmamp == 10.5
+    assert coordinator.data.meter.data.active_power_plus == 2300.0
+    assert coordinator.data.meter.data.active_energy_plus == 1234.5
+    assert coordinator.data.meter.data.voltage_l1 is None
+
+    wallbox = wallboxes["http://127.0.0.1/"]
+    wallbox.calls.clear()
+    stand_in.requests.clear()
+    await coordinator.async_refresh()
+    assert wallbox.calls == []
+    assert len(stand_in.requests) == 1 + len(modbus.meter_blocks(coordinator.obis_codes))
+
+    await hass.config_entries.async_unload(entry.entry_id)
+    assert not hass.data.get(modbus.DATA_MODBUS_CLIENTS)
@@ -0,0 +1,134 @@
+"""Tests for the on-disk history of meter samples."""
+from __future__ import annotations
+
+import math
+import os
+from pathlib import Path
+
+import pytest
+
+from common import integration_module
+
+sample_history = integration_module("sample_history")
+
+POWER = "1-0:1.4.0"
+
+
+def _history(tmp_path: Path, capacity: int) -> sample_history.SampleHistory:
+    """Return an open history of capacity samples per file."""
+    history = sample_history.SampleHistory(
+        str(tmp_path / "station.samples"),
+        2 * capacity * sample_history.RECORD_SIZE / 2**20,
+    )
+    assert history.capacity == capacity
+    history.open()
+    return history
+
+
+def _values(power: float) -> list[float]:
+    """Return the values of a record with only the power set."""
+    values = [math.nan] * len(sample_history.CODES)
+    values[sample_history.CODE_INDEX[POWER]] = power
+    return values
+
+
+def _times(history: sample_history.SampleHistory) -> list[float]:
+    """Return the times of every sample held."""
+    return [row[0] for row in history.read([POWER], 0, math.inf, 100)]
+
+
+def test_rotation(tmp_path: Path) -> None:
+    """A full file becomes the previous one, whose samples stay readable."""
+    history = _history(tmp_path, 4)
+    for second in range(1, 10):
+        history.append(float(second), _values(second * 100))
+    # Older or repeated samples are dropped.
+    history.append(9.0, _values(0))
+    assert history.metrics["rotations"] == 2
+    assert history.metrics["count"] == 1
+    assert history.appended == 9
+    # Samples 1 to 4 went with the first rotation.
+    assert _times(history) == [5.0, 6.0, 7.0, 8.0, 9.0]
+    rows = history.read([POWER, "1-0:32.4.0"], 6, 8, 100)
+    assert rows[0][:2] == (6.0, 600.0) and math.isnan(rows[0][2])
+    assert len(rows) == 2
+    assert history.read([POWER], 0, math.inf, 3) == [(5.0, 500.0), (6.0, 600.0), (7.0, 700.0)]
+    history.close()
+
+
+def test_reopen(tmp_path: Path) -> None:
+    """Samples survive a restart, appends continue after them."""
+    history = _history(tmp_path, 4)
+    history.append(1.0, _values(100))
+    history.append(2.0, _values(200))
+    history.close()
+    history = _history(tmp_path, 4)
+    assert history.metrics["count"] == 2
+    history.append(3.0, _values(300))
+    assert _times(history) == [1.0, 2.0, 3.0]
+    history.close()
+
+
+def test_crash_recovery(tmp_path: Path) -> None:
+    """Without a close, a torn last record and a half written slot are dropped."""
+    history = _history(tmp_path, 8)
+    for second in range(1, 5):
+        history.append(float(second), _values(second * 100))
+    # A crash while writing the fourth record changed it after its checksum.
+    segment = history._current
+    offset = sample_history.HEADER_SIZE + 3 * sample_history.RECORD_SIZE
+    segment._mmap[offset + 8] ^= 0xFF
+    # A crash before writing the timestamp of the fifth left its values only.
+    offset += sample_history.RECORD_SIZE
+    segment._mmap[offset + 8 : offset + 12] = b"\x01\x02\x03\x04"
+    segment.flush()
+
+    reopened = _history(tmp_path, 8)
+    assert reopened.metrics["count"] == 3
+    assert _times(reopened) == [1.0, 2.0, 3.0]
+    reopened.append(4.5, _values(450))
+    assert reopened.read([POWER], 4, 5, 10) == [(4.5, 450.0)]
+    reopened.close()
+    history._current.close()
+
+    # The recovered file reads as a clean one.
+    history = _history(tmp_path, 8)
+    assert _times(history) == [1.0, 2.0, 3.0, 4.5]
+    history.close()
+
+
+def test_resize(tmp_path: Path) -> None:
+    """A file of another size is kept as the previous one, still readable."""
+    history = _history(tmp_path, 4)
+    history.append(1.0, _values(100))
+    history.close()
+    history = _history(tmp_path, 8)
+    assert os.path.exists(history.previous_path)
+    assert history.metrics["count"] == 0
+    history.append(2.0, _values(200))
+    assert _times(history) == [1.0, 2.0]
+    history.close()
+
+
+def test_bad_layout(tmp_path: Path) -> None:
+    """A file that is not a history is not mapped."""
+    path = tmp_path / "other"
+    path.write_bytes(bytes(sample_history.HEADER_SIZE + sample_history.RECORD_SIZE))
+    with pytest.raises(ValueError):
+        sample_history.SampleSegment(str(path), 1, False)
+
+
+def test_query(tmp_path: Path) -> None:
+    """Buckets aggregate the samples in them, empty buckets have no values."""
+    history = _history(tmp_path, 4)
+    for second, power in ((1, 100), (2, 300), (5, 400), (6, 600), (7, 700)):
+        history.append(float(second), _values(power))
+    result = history.query([POWER], 0, 9, 3)
+    assert result["start"] == [0, 3, 6]
+    assert result["series"][POWER] == {
+        "mean": [200.0, 400.0, 650.0],
+        "min": [100.0, 400.0, 600.0],
+        "max": [300.0, 400.0, 700.0],
+    }
+    assert history.query([POWER], 20, 29, 1)["series"][POWER]["mean"] == [None]
+    history.close()
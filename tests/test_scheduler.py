@@ -0,0 +1,77 @@
+"""Tests for the phase-spread poll scheduler."""
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from unittest.mock import Mock
+
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from common import integration_module
+
+scheduler = integration_module("scheduler")
+
+
+def _coordinator(refreshed: list[str], name: str, done: asyncio.Event | None = None) -> Mock:
+    """Return a coordinator recording its refreshes, blocking on an event if given."""
+
+    async def _async_refresh() -> None:
+        refreshed.append(name)
+        if done is not None:
+            await done.wait()
+
+    return Mock(async_refresh=_async_refresh, name=name)
+
+
+async def test_phases_stay_in_place(hass: HomeAssistant) -> None:
+    """Stations joining take the widest gap without moving the others."""
+    polls = scheduler.WallboxScheduler(hass)
+    refreshed: list[str] = []
+    for key in ("a", "b", "c"):
+        polls.async_register(key, _coordinator(refreshed, key), 12)
+    phases = polls.phases
+    assert len({round(phase) for phase in phases.values()}) == 3
+
+    polls.async_register("d", _coordinator(refreshed, "d"), 12)
+    assert {key: polls.phases[key] for key in phases} == phases
+    # The widest gap of a, b and c was at least a third of the interval.
+    gaps = sorted(polls.phases.values())
+    assert min(
+        (end - begin) % 12 for begin, end in zip(gaps, [*gaps[1:], gaps[0]])
+    ) >= 12 / 3 / 2 - 0.01
+
+    polls.async_unregister("b")
+    polls.async_set_interval("d", 30)
+    assert {key: polls.phases[key] for key in ("a", "c")} == {
+        key: phases[key] for key in ("a", "c")
+    }
+    assert 0 <= polls.phases["d"] <= 30 * 0.1
+    polls.async_stop()
+
+
+async def test_polls_and_cancels(hass: HomeAssistant) -> None:
+    """Polls run on the grid, overlapping ones are skipped, leaving cancels them."""
+    polls = scheduler.WallboxScheduler(hass)
+    refreshed: list[str] = []
+    done = asyncio.Event()
+    polls.async_register("a", _coordinator(refreshed, "a", done), 5)
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=6))
+    await asyncio.sleep(0)
+    assert refreshed == ["a"]
+    member = polls._members["a"]
+    task = member.task
+    assert task is not None and not task.done()
+
+    # The refresh is still running, so the next slot is skipped.
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=12))
+    await asyncio.sleep(0)
+    assert refreshed == ["a"]
+
+    polls.async_unregister("a")
+    await asyncio.sleep(0)
+    assert task.cancelled()
+    assert member.handle is None or member.handle.cancelled()
@@ -0,0 +1,54 @@
+"""Tests for the sensor entities of the Wallbox integration."""
+from __future__ import annotations
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from common import DOMAIN, FakeWallbox
+
+POWER = "1-0:1.4.0"
+ENERGY = "1-0:1.8.0"
+VOLTAGE_L1 = "1-0:32.4.0"
+CURRENT_DEMAND_L1 = "1-0:31.6.0"
+
+
+def _entity_id(hass: HomeAssistant, key: str) -> str | None:
+    """Return the entity of a data key of station 1."""
+    return er.async_get(hass).async_get_entity_id("sensor", DOMAIN, f"{key}-123-1")
+
+
+async def test_keys_reported_later(hass: HomeAssistant, add_entry, wallboxes) -> None:
+    """A key the meter starts reporting after setup gets its entity on the next poll."""
+    wallbox = wallboxes.setdefault("http://10.0.0.1/", FakeWallbox())
+    wallbox.meter[ENERGY] = 1.5
+    entry = await add_entry()
+    assert _entity_id(hass, ENERGY) is not None
+    assert _entity_id(hass, POWER) is None
+
+    wallbox.meter[POWER] = 2300
+    await hass.data[DOMAIN][entry.entry_id].async_refresh()
+    await hass.async_block_till_done()
+    assert (entity_id := _entity_id(hass, POWER)) is not None
+    assert hass.states.get(entity_id).state == "2300.0"
+
+
+async def test_obis_profiles(hass: HomeAssistant, add_entry, wallboxes) -> None:
+    """The profile of an entry selects its OBIS entities, applied without a reload."""
+    wallbox = wallboxes.setdefault("http://10.0.0.1/", FakeWallbox())
+    wallbox.meter.update({POWER: 2300, VOLTAGE_L1: 230, CURRENT_DEMAND_L1: 16})
+    entry = await add_entry(options={"obis_profile": "minimal"})
+    assert _entity_id(hass, POWER) is not None
+    assert _entity_id(hass, VOLTAGE_L1) is None
+    assert _entity_id(hass, CURRENT_DEMAND_L1) is None
+
+    hass.config_entries.async_update_entry(entry, options={"obis_profile": "per_phase"})
+    await hass.async_block_till_done()
+    await hass.data[DOMAIN][entry.entry_id].async_refresh()
+    await hass.async_block_till_done()
+    assert _entity_id(hass, VOLTAGE_L1) is not None
+    assert _entity_id(hass, CURRENT_DEMAND_L1) is None
+
+    hass.config_entries.async_update_entry(entry, options={"obis_profile": "minimal"})
+    await hass.async_block_till_done()
+    assert _entity_id(hass, POWER) is not None
+    assert _entity_id(hass, VOLTAGE_L1) is None
@@ -0,0 +1,149 @@
+"""Tests for the services of the Wallbox integration."""
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any
+
+import pytest
+import requests
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import device_registry as dr
+
+from common import DOMAIN
+
+HOST_A = "http://10.0.0.1/"
+HOST_B = "http://10.0.0.2/"
+
+
+async def _setup(hass: HomeAssistant, add_entry, wallboxes) -> list:
+    """Set up two stations on one eCB1 and one on another."""
+    entries = [
+        await add_entry(url=HOST_A, station=1, title="a1"),
+        await add_entry(url=HOST_A, station=2, title="a2"),
+        await add_entry(url=HOST_B, station=3, title="b3"),
+    ]
+    for wallbox in wallboxes.values():
+        wallbox.calls.clear()
+        wallbox.set_values.clear()
+    return entries
+
+
+async def _bulk_command(hass: HomeAssistant, command: str, value: Any) -> dict:
+    """Run a command on every station."""
+    response = await hass.services.async_call(
+        DOMAIN,
+        "bulk_command",
+        {"command": command, "value": value},
+        blocking=True,
+        return_response=True,
+    )
+    return response["results"]
+
+
+async def test_bulk_command_per_host(hass: HomeAssistant, add_entry, wallboxes) -> None:
+    """Writes are serialized per host and read back with one read per host."""
+    a1, a2, b3 = await _setup(hass, add_entry, wallboxes)
+    lock = threading.Lock()
+    running: dict[str, int] = {HOST_A: 0, HOST_B: 0}
+    most: dict[str, int] = dict(running)
+
+    for url, wallbox in wallboxes.items():
+        write = wallbox.setMaxChargingCurrent
+
+        def _write(station: int, value: float, url=url, write=write) -> None:
+            with lock:
+                running[url] += 1
+                most[url] = max(most[url], running[url])
+            time.sleep(0.05)
+            with lock:
+                running[url] -= 1
+            if station == 2:
+                raise requests.exceptions.ConnectionError("Station offline")
+            write(station, value)
+
+        wallbox.setMaxChargingCurrent = _write
+
+    results = await _bulk_command(hass, "charging_current", 10)
+    assert most == {HOST_A: 1, HOST_B: 1}
+    assert results[a1.entry_id] == {"station": "a1", "success": True}
+    assert results[b3.entry_id] == {"station": "b3", "success": True}
+    assert results[a2.entry_id]["success"] is False
+    assert "Station offline" in results[a2.entry_id]["error"]
+    assert wallboxes[HOST_A].calls.count("statuses") == 1
+    assert wallboxes[HOST_B].calls.count("statuses") == 1
+    assert "status" not in wallboxes[HOST_A].calls + wallboxes[HOST_B].calls
+    for entry in (a1, b3):
+        coordinator = hass.data[DOMAIN][entry.entry_id]
+        assert coordinator.data.chargecontrol.manualmodeamp == 10
+
+
+async def test_bulk_command_ai_mode(hass: HomeAssistant, add_entry, wallboxes) -> None:
+    """The AI mode is read back from every written station."""
+    entries = await _setup(hass, add_entry, wallboxes)
+    results = await _bulk_command(hass, "ai_mode", True)
+    assert all(result["success"] for result in results.values())
+    assert wallboxes[HOST_A].calls.count("ai") == 2
+    assert "statuses" not in wallboxes[HOST_A].calls
+    for entry in entries:
+        assert hass.data[DOMAIN][entry.entry_id].data.ai_mode is True
+
+
+async def test_bulk_command_current_bounds(
+    hass: HomeAssistant, add_entry, wallboxes
+) -> None:
+    """Currents below the minimum or above the supply line are rejected."""
+    a1, _, b3 = await _setup(hass, add_entry, wallboxes)
+    with pytest.raises(ServiceValidationError):
+        await _bulk_command(hass, "charging_current", 2)
+
+    wallboxes[HOST_B].control["supplylinemaxamp"] = 16
+    await hass.data[DOMAIN][b3.entry_id].async_refresh()
+    results = await _bulk_command(hass, "charging_current", 20)
+    assert results[a1.entry_id]["success"] is True
+    assert results[b3.entry_id]["success"] is False
+    assert "supply line" in results[b3.entry_id]["error"]
+    assert wallboxes[HOST_B].set_values == []
+
+
+async def test_read_values(hass: HomeAssistant, add_entry, wallboxes) -> None:
+    """Values are read right away, merged on request, per station."""
+    a1, a2, b3 = await _setup(hass, add_entry, wallboxes)
+    coordinator = hass.data[DOMAIN][a1.entry_id]
+    version = coordinator.data
+    wallboxes[HOST_A].control["manualmodeamp"] = 12
+    wallboxes[HOST_A].meter["1-0:1.4.0"] = 3.5
+
+    def _offline(station: int) -> dict:
+        raise requests.exceptions.ConnectionError("Station offline")
+
+    wallboxes[HOST_B].getMetersData = _offline
+    devices = dr.async_get(hass)
+    response = await hass.services.async_call(
+        DOMAIN,
+        "read_values",
+        {
+            "device_id": [
+                devices.async_get_device(identifiers={(DOMAIN, f"123-{station}")}).id
+                for station in (1, 3)
+            ],
+            "keys": ["manualmodeamp", "1-0:1.4.0"],
+            "merge": True,
+        },
+        blocking=True,
+        return_response=True,
+    )
+    results = response["results"]
+    assert results[a1.entry_id]["values"] == {"manualmodeamp": 12, "1-0:1.4.0": 3.5}
+    assert "timestamp" in results[a1.entry_id]
+    assert results[b3.entry_id]["station"] == "b3"
+    assert "Station offline" in results[b3.entry_id]["error"]
+    assert a2.entry_id not in results
+
+    # The values are published as a new version, the other sections are kept.
+    assert coordinator.data is not version
+    assert coordinator.data.chargecontrol.manualmodeamp == 12
+    assert coordinator.data.meter.data.active_power_plus == 3.5
+    assert coordinator.data.system is version.system
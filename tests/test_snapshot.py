@@ -0,0 +1,48 @@
+"""Tests for the versioned station snapshots."""
+from __future__ import annotations
+
+from common import integration_module
+
+decode = integration_module("decode")
+snapshot = integration_module("snapshot")
+
+POWER = "1-0:1.4.0"
+
+
+def _snapshot() -> object:
+    """Return a first version of a station."""
+    return snapshot.WallboxSnapshot(
+        version=1,
+        serial="123-1",
+        model="eCB1",
+        system={"serial": "123"},
+        meter=decode.meter_info_from_values("meter", "EM", {POWER: 100}),
+        chargecontrol=decode.charge_control_from_values({"mode": "manual", "stateid": 17}),
+        ai_mode=False,
+        charging_modes=("eco", "manual"),
+    )
+
+
+def test_evolve_shares_unchanged_sections() -> None:
+    """A new version keeps the objects of the sections that did not change."""
+    first = _snapshot()
+    # Equal values are no change, not even a new version.
+    assert first.evolve(system={"serial": "123"}, ai_mode=False) is first
+
+    control = decode.charge_control_from_values({"mode": "eco", "stateid": 17})
+    second = first.evolve(chargecontrol=control, system={"serial": "123"})
+    assert second.version == 2
+    assert second.chargecontrol is control
+    assert second.system is first.system and second.meter is first.meter
+    assert second.changed(first) == {"chargecontrol"}
+    assert first.changed(None) == set(snapshot.SNAPSHOT_SECTIONS)
+
+
+def test_values_and_keys() -> None:
+    """Keys of every section are read from the snapshot."""
+    first = _snapshot()
+    assert first.value(POWER) == 100
+    assert first.value("mode") == "manual"
+    assert first.value("autostartstop") is False
+    assert first.value("charging_modes") == ("eco", "manual")
+    assert {"mode", "charging_modes", "autostartstop", POWER} <= set(first.keys())
@@ -0,0 +1,110 @@
+"""Tests for PV surplus charging."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from common import integration_module
+
+surplus = integration_module("surplus")
+
+POWER_PLUS = "1-0:1.4.0"
+POWER_MINUS = "1-0:2.4.0"
+CURRENTS = ("1-0:31.4.0", "1-0:51.4.0", "1-0:71.4.0")
+
+# Watts per ampere on three phases.
+WATTS = 3 * 230
+
+
+async def _setup(hass: HomeAssistant, add_entry, wallboxes) -> tuple[Any, Any, Any]:
+    """Set up a station with a car plugged in but not charging yet."""
+    entry = await add_entry(options={"pv_surplus": True})
+    wallbox = wallboxes["http://10.0.0.1/"]
+    wallbox.control["connected"] = "true"
+    # Forget the write probing the permissions at setup.
+    wallbox.set_values.clear()
+    coordinator = hass.data["ha-eCB1"][entry.entry_id]
+    await coordinator.async_refresh()
+    return hass.data["ha-eCB1_surplus"][entry.entry_id], coordinator, wallbox
+
+
+async def _tick(
+    hass: HomeAssistant, controller: Any, wallbox: Any, grid: float, draw: float
+) -> None:
+    """Run the fast loop once on a grid power in watts and a phase current."""
+    wallbox.meter.update(
+        {
+            POWER_PLUS: max(grid, 0),
+            POWER_MINUS: max(-grid, 0),
+            **dict.fromkeys(CURRENTS, draw),
+        }
+    )
+    await controller._async_tick()
+    await hass.async_block_till_done()
+
+
+async def test_setpoint(hass: HomeAssistant, add_entry, wallboxes) -> None:
+    """Charging starts and pauses after the delays, lowering is written at once."""
+    controller, coordinator, wallbox = await _setup(hass, add_entry, wallboxes)
+    assert controller.target(-10 * WATTS, 0) == 10
+
+    # 10 A of export for the start delay starts charging at 10 A.
+    await _tick(hass, controller, wallbox, -10 * WATTS, 0)
+    assert not wallbox.set_values
+    controller._above_since -= 60
+    await _tick(hass, controller, wallbox, -10 * WATTS, 0)
+    assert wallbox.set_values == [10] and controller.setpoint == 10
+
+    # Importing 2 A worth at 10 A lowers to 8 A right away.
+    await _tick(hass, controller, wallbox, 2 * WATTS, 10)
+    assert wallbox.set_values[-1] == 8
+    # Raising again waits for the write interval.
+    await _tick(hass, controller, wallbox, -4 * WATTS, 8)
+    assert wallbox.set_values[-1] == 8 and controller.metrics["deferred"] == 1
+    controller._written -= 5
+    await _tick(hass, controller, wallbox, -4 * WATTS, 8)
+    assert wallbox.set_values[-1] == 12
+
+    # Too little surplus holds the minimum, then pauses by locking.
+    await _tick(hass, controller, wallbox, 12 * WATTS, 12)
+    assert wallbox.set_values[-1] == 6 and not coordinator.paused_by
+    controller._below_since -= 120
+    await _tick(hass, controller, wallbox, 6 * WATTS, 6)
+    assert controller.setpoint == 0 and coordinator.paused_by == {"pv_surplus"}
+    assert wallbox.calls[-1] == "lock" and 0 not in wallbox.set_values
+    assert controller.metrics["latency_ms"]["last"] is not None
+
+    # Disabling the controller unlocks the station it paused.
+    entry = hass.config_entries.async_entries("ha-eCB1")[0]
+    hass.config_entries.async_update_entry(entry, options={})
+    await hass.async_block_till_done()
+    assert not coordinator.paused_by and wallbox.calls[-1] == "unlock"
+    assert "ha-eCB1_balancer" not in hass.data
+
+
+async def test_breaker_open(hass: HomeAssistant, add_entry, wallboxes) -> None:
+    """Nothing is read or written while the breaker of the host is open."""
+    controller, coordinator, wallbox = await _setup(hass, add_entry, wallboxes)
+    while coordinator.breaker.state != "open":
+        coordinator.breaker.async_record_failure()
+    calls = len(wallbox.calls)
+    await _tick(hass, controller, wallbox, -10 * WATTS, 0)
+    assert len(wallbox.calls) == calls and controller.metrics["samples"] == 0
+
+
+async def test_failures(hass: HomeAssistant, add_entry, wallboxes) -> None:
+    """A malformed reading or a failed write is counted, not raised."""
+    controller, coordinator, wallbox = await _setup(hass, add_entry, wallboxes)
+    coordinator._get_raw = lambda path: b"<html>"
+    await _tick(hass, controller, wallbox, -10 * WATTS, 0)
+    assert controller.metrics["failed"] == 1 and controller.metrics["samples"] == 0
+    del coordinator._get_raw
+
+    def _reject(station: int, value: float) -> None:
+        raise ValueError("rejected")
+
+    wallbox.setMaxChargingCurrent = _reject
+    controller._above_since = -1e9
+    await _tick(hass, controller, wallbox, -10 * WATTS, 0)
+    assert controller.metrics["failed"] == 2 and controller.setpoint is None